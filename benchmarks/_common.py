@@ -0,0 +1,45 @@
+"""
+Helpers shared by the benchmark scripts, that import them as::
+
+    from _common import measure, measure_memory, timeit
+
+"""
+
+import time
+import tracemalloc
+
+
+def timeit(func, repeat=3):
+    """
+    :return: the best time of `repeat` calls to func, in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(func, repeat=3):
+    """
+    :return: the best time of `repeat` calls to func, in seconds,
+        and the peak memory of one more call, in bytes
+    """
+    best = timeit(func, repeat)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def measure_memory(build):
+    """
+    :return: the object built by build and the memory it still uses, in bytes
+    """
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
@@ -0,0 +1,44 @@
+"""
+Speed of repeated nested reads with :py:meth:`pytups.SuperDict.accessor`
+against :py:meth:`pytups.SuperDict.get_m`.
+
+Usage::
+
+    python benchmarks/bench_accessor.py [n_reads]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import timeit
+
+
+def main(n):
+    data = pt.SuperDict.from_dict(
+        {
+            "cost": {
+                "resource_{}".format(r): {p: {"fixed": r, "var": p * 0.5} for p in range(100)}
+                for r in range(100)
+            }
+        }
+    )
+    paths = [("resource_{}".format(i % 100), i % 97, "var") for i in range(n)]
+    acc = data.accessor("cost", ..., ..., ...)
+    cached = data.tracked().accessor("cost", ..., ..., ..., cache=True)
+    cached.get(*paths[0])
+    cases = {
+        "get_m": lambda: [data.get_m("cost", *path) for path in paths],
+        "accessor.get": lambda: [acc.get(*path) for path in paths],
+        "accessor.get_many": lambda: acc.get_many(paths),
+        "cached get": lambda: [cached.get(*path) for path in paths],
+        "cached get_many": lambda: cached.get_many(paths),
+    }
+    print("reads: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<24} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
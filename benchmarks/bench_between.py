@@ -0,0 +1,52 @@
+"""
+Speed of :py:meth:`pytups.OrderSet.between` against the previous implementation,
+and of window sums with the positions of the view.
+
+Usage::
+
+    python benchmarks/bench_between.py [n_periods] [window]
+
+"""
+
+import sys
+
+import numpy as np
+
+import pytups as pt
+
+from _common import timeit
+
+
+def between_reference(order_set, value1, value2):
+    # the implementation of between up to version 1.0.5
+    return [order_set[i] for i in range(order_set.ord(value1), order_set.ord(value2) + 1)]
+
+
+def main(n, window):
+    periods = pt.OrderSet(["p{:06d}".format(i) for i in range(n)])
+    starts = periods[: n - window]
+    values = np.arange(n, dtype=float)
+    by_period = dict(zip(periods, values.tolist()))
+
+    cases = {
+        "before: between": lambda: [between_reference(periods, p, periods.next(p, window)) for p in starts],
+        "now: between": lambda: [periods.between(p, periods.next(p, window)) for p in starts],
+        "before: window sums": lambda: [
+            sum(by_period[q] for q in between_reference(periods, p, periods.next(p, window)))
+            for p in starts
+        ],
+        "now: window sums, numpy": lambda: [
+            values[periods.between(p, periods.next(p, window)).positions(use_numpy=True)].sum()
+            for p in starts
+        ],
+    }
+    print("periods: {}, window: {}".format(n, window))
+    for name, func in cases.items():
+        print("  {:<26} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 300,
+    )
@@ -0,0 +1,47 @@
+"""
+Memory and speed of :py:class:`pytups.ColumnarTupList` against :py:class:`pytups.TupList`.
+
+Usage::
+
+    python benchmarks/bench_columnar.py [n_rows]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure_memory, timeit
+
+
+def make_rows(n):
+    machines = ["machine_{}".format(m) for m in range(20)]
+    return ((t // 100, t % 100, machines[t % 20], t * 0.5) for t in range(n))
+
+
+def main(n):
+    tl, tl_size = measure_memory(lambda: pt.TupList(make_rows(n)))
+    col, col_size = measure_memory(lambda: pt.ColumnarTupList(make_rows(n)))
+    print("rows: {}".format(n))
+    print("memory TupList: {:.1f} MB".format(tl_size / 1e6))
+    print("memory ColumnarTupList: {:.1f} MB".format(col_size / 1e6))
+
+    operations = {
+        "take": lambda obj: obj.take([0, 2]),
+        "vfilter": lambda obj: obj.vfilter(lambda x: x[1] < 10),
+        "to_dict": lambda obj: obj.to_dict(result_col=[1, 2]),
+        "sorted": lambda obj: obj.sorted(),
+        "unique": lambda obj: obj.take([0, 2]).unique(),
+    }
+    for name, operation in operations.items():
+        time_tl = timeit(lambda: operation(tl))
+        time_col = timeit(lambda: operation(col))
+        print(
+            "{:<8} TupList: {:.3f}s ColumnarTupList: {:.3f}s".format(
+                name, time_tl, time_col
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,48 @@
+"""
+Speed of :py:meth:`pytups.SuperDict.copy_deep` and :py:meth:`pytups.TupList.copy_deep`
+against the previous pickle round trip and :py:func:`copy.deepcopy`.
+
+Usage::
+
+    python benchmarks/bench_copy_deep.py [n_keys]
+
+"""
+
+import copy
+import pickle
+import sys
+
+import pytups as pt
+
+from _common import timeit
+
+
+def copy_deep_reference(data):
+    # the implementation of copy_deep up to version 1.0.5
+    return pickle.loads(pickle.dumps(data, -1))
+
+
+def main(n):
+    # a solution: assignments per resource and a flat cost dictionary
+    solution = pt.SuperDict(
+        assign=pt.SuperDict(
+            ("resource_{}".format(i), pt.TupList((i, p, "task_{}".format(p)) for p in range(10)))
+            for i in range(n // 10)
+        ),
+        cost=pt.SuperDict(((i // 100, i % 100), i * 0.5) for i in range(n)),
+    )
+    rows = pt.TupList((i // 100, i % 100, "task_{}".format(i % 7), i * 0.5) for i in range(n))
+    cases = {
+        "solution, pickle": lambda: copy_deep_reference(solution),
+        "solution, deepcopy": lambda: copy.deepcopy(solution),
+        "solution, copy_deep": lambda: solution.copy_deep(),
+        "TupList, pickle": lambda: copy_deep_reference(rows),
+        "TupList, copy_deep": lambda: rows.copy_deep(),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<24} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,61 @@
+"""
+Speed and peak memory of :py:meth:`pytups.TupList.from_csv` with per-column types
+against the previous implementation with a per-row function.
+
+Usage::
+
+    python benchmarks/bench_csv.py [n_rows]
+
+"""
+
+import csv
+import os
+import sys
+import tempfile
+
+import pytups as pt
+
+from _common import measure
+
+
+def from_csv_reference(path, func=None, **kwargs):
+    # the implementation of from_csv up to version 1.0.5
+    if func is None:
+        func = tuple
+    with open(path) as f:
+        data = pt.TupList(csv.reader(f, **kwargs)).vapply(func)
+    return data
+
+
+def fmt(row):
+    return row[0], int(row[1]), row[2], float(row[3])
+
+
+def main(n):
+    path = os.path.join(tempfile.mkdtemp(), "bench.csv")
+    pt.TupList(
+        ("task_{}".format(i % 500), i % 100, "machine_{}".format(i % 7), i * 0.25)
+        for i in range(n)
+    ).to_csv(path)
+    cases = {
+        "before, func per row": lambda: from_csv_reference(path, func=fmt),
+        "after, types": lambda: pt.TupList.from_csv(path, types=[str, int, str, float]),
+        "after, types='infer'": lambda: pt.TupList.from_csv(path, types="infer"),
+        "before, strings": lambda: from_csv_reference(path),
+        "after, strings": lambda: pt.TupList.from_csv(path),
+        "after, chunks of 10000": lambda: sum(
+            len(chunk)
+            for chunk in pt.TupList.from_csv(
+                path, types=[str, int, str, float], chunksize=10000
+            )
+        ),
+    }
+    print("rows: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,39 @@
+"""
+Memory and time of :py:meth:`pytups.SuperDict.fill_with_default` over a sparse product of keys,
+building every key against the lazy :py:class:`pytups.DefaultSuperDict`.
+
+Usage::
+
+    python benchmarks/bench_fill_default.py [n_tasks]
+
+"""
+
+import operator as op
+from itertools import islice
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def main(n):
+    tasks = ["t{}".format(i) for i in range(n)]
+    periods = range(50)
+    machines = ["m{}".format(i) for i in range(20)]
+    # one key in a thousand has a value
+    keys = pt.KeyProduct(tasks, periods, machines)
+    data = pt.SuperDict((key, 1.0) for key in islice(keys, 0, None, 1000))
+
+    cases = {
+        "full: fill + sapply": lambda: data.fill_with_default(keys).sapply(op.mul, 2),
+        "lazy: fill + sapply": lambda: data.fill_with_default(keys, lazy=True).sapply(op.mul, 2),
+    }
+    print("keys: {}, stored: {}".format(len(keys), len(data)))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<22} {:.3f}s {:>8.1f} MB".format(name, seconds, peak / 2**20))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
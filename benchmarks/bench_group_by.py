@@ -0,0 +1,36 @@
+"""
+Speed and peak memory of :py:meth:`pytups.TupList.group_by` aggregations
+against grouping with `to_dict` and aggregating each group afterwards.
+
+Usage::
+
+    python benchmarks/bench_group_by.py [n_rows]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def main(n):
+    rows = pt.TupList((i % 1000, i % 100, "machine_{}".format(i % 20), i * 0.5) for i in range(n))
+    cases = {
+        "sum, to_dict + vapply": lambda: rows.to_dict(result_col=3, indices=0).vapply(sum),
+        "sum, group_by": lambda: rows.group_by(0).sum(3),
+        "sum, group_by numpy": lambda: rows.group_by(0).agg(use_numpy=True, sum=3),
+        "count, to_dict + len": lambda: rows.to_dict(result_col=3, indices=0).vapply(len),
+        "count, group_by": lambda: rows.group_by(0).count(),
+        "sum+max, group_by": lambda: rows.group_by(0).agg(sum=3, max=1),
+        "sum+max, numpy": lambda: rows.group_by(0).agg(use_numpy=True, sum=3, max=1),
+    }
+    print("rows: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,53 @@
+"""
+Speed of :py:meth:`pytups.SuperDict.index_by_part_of_tuple` with and without the cache,
+against the previous implementation.
+
+Usage::
+
+    python benchmarks/bench_index_by.py [n_keys]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import timeit
+
+
+def index_by_part_of_tuple_reference(data, position):
+    # the implementation of index_by_part_of_tuple up to version 1.0.5
+    el = data.keys_l()[0]
+    if len(el) <= position:
+        raise IndexError()
+    result = {k[position]: {} for k in data.keys()}
+    for k, v in data.items():
+        result[k[position]][k] = v
+    return pt.SuperDict.from_dict(result)
+
+
+def main(n):
+    data = pt.TrackedSuperDict(((i % 100, i // 100 % 100, i // 10000), i * 0.5) for i in range(n))
+
+    def loop(func, **kwargs):
+        for _ in range(5):
+            for pos in range(3):
+                func(pos, **kwargs)
+
+    cases = {
+        "before, 5 x 3 positions": lambda: loop(lambda pos: index_by_part_of_tuple_reference(data, pos)),
+        "no cache, 5 x 3 positions": lambda: loop(data.index_by_part_of_tuple),
+        "one pass, 3 positions": lambda: data.index_by_parts_of_tuple([0, 1, 2]),
+        "cache, 5 x 3 positions": lambda: (
+            data.index_by_parts_of_tuple([0, 1, 2], cache=True),
+            loop(data.index_by_part_of_tuple),
+            data.__setitem__((0, 0, 0), 0.0),
+        ),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<28} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,66 @@
+"""
+Speed and peak memory of :py:meth:`pytups.SuperDict.list_reverse` and
+:py:meth:`pytups.SuperDict.inverted_index` against the previous implementation.
+
+Usage::
+
+    python benchmarks/bench_list_reverse.py [n_keys]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def list_reverse_reference(data):
+    # the implementation of list_reverse up to version 1.0.5
+    new_keys = list(set(val for l in data.values() for val in l))
+    dict_out = pt.SuperDict({k: pt.TupList() for k in new_keys})
+    for k, v in data.items():
+        for el in v:
+            dict_out[el].append(k)
+    return dict_out
+
+
+def main(n):
+    # tasks and the machines they can use
+    data = pt.SuperDict(
+        ("task_{}".format(i), ["machine_{}".format((i * j) % 1000) for j in range(1, 6)])
+        for i in range(n)
+    )
+
+    def edits_rebuild():
+        for i in range(1000):
+            data["task_{}".format(i)] = ["machine_{}".format(i % 7)]
+            data.list_reverse()["machine_3"]
+
+    def edits_index():
+        index = tracked.inverted_index()
+        for i in range(1000):
+            tracked["task_{}".format(i)] = ["machine_{}".format(i % 7)]
+            index["machine_3"]
+        index.close()
+
+    cases = {
+        "before, list_reverse": lambda: list_reverse_reference(data),
+        "list_reverse": lambda: data.list_reverse(),
+        "inverted_index": lambda: len(data.inverted_index(sync=False)),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+    n_small = max(n // 100, 1000)
+    data = pt.SuperDict(list(data.items())[:n_small])
+    tracked = data.tracked()
+    print("1000 edits and queries on {} keys".format(n_small))
+    for name, func in {"rebuild": edits_rebuild, "synced index": edits_index}.items():
+        seconds, peak = measure(func, repeat=1)
+        print("  {:<24} {:.3f}s".format(name, seconds))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,39 @@
+"""
+Speed of arithmetic between :py:class:`pytups.NumericSuperDict` objects
+against the same operations between :py:class:`pytups.SuperDict` objects.
+
+Usage::
+
+    python benchmarks/bench_numeric.py [n_keys]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import timeit
+
+
+def main(n):
+    cost = pt.SuperDict((("task_{}".format(i), i % 100), i * 0.5) for i in range(n))
+    amount = cost.vapply(lambda v: v % 7)
+    cost_a = cost.as_array()
+    amount_a = amount.as_array()
+    reordered_a = pt.SuperDict(reversed(list(amount.items()))).as_array()
+    cases = {
+        "SuperDict cost * amount": lambda: cost * amount,
+        "SuperDict cost * 2 + 1": lambda: cost * 2 + 1,
+        "as_array": lambda: cost.as_array(),
+        "numeric cost * amount": lambda: cost_a * amount_a,
+        "numeric cost * 2 + 1": lambda: cost_a * 2 + 1,
+        "numeric, other key order": lambda: cost_a * reordered_a,
+        "to_superdict": lambda: cost_a.to_superdict(),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<26} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
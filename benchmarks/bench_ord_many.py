@@ -0,0 +1,64 @@
+"""
+Speed of :py:meth:`pytups.OrderSet.ord_many` and :py:meth:`pytups.OrderSet.next_many`
+against a loop of :py:meth:`pytups.OrderSet.ord` and :py:meth:`pytups.OrderSet.next`.
+
+Usage::
+
+    python benchmarks/bench_ord_many.py [n_lookups]
+
+"""
+
+import datetime
+import sys
+
+import numpy as np
+
+import pytups as pt
+
+from _common import timeit
+
+
+def main(n):
+    rng = np.random.default_rng(0)
+    numbers = pt.OrderSet(list(range(0, 20000, 2)))
+    number_queries = (rng.integers(0, 9999, n) * 2).tolist()
+    floats = pt.OrderSet([i * 0.5 for i in range(10000)])
+    float_queries = [floats[i] for i in rng.integers(0, 9999, n)]
+    strings = pt.OrderSet(["p{:05d}".format(i) for i in range(10000)])
+    string_queries = [strings[i] for i in rng.integers(0, 9999, n)]
+    tuples = pt.OrderSet([("t{}".format(t), p) for t in range(100) for p in range(100)])
+    tuple_queries = [tuples[i] for i in rng.integers(0, 9999, n)]
+    first = datetime.date(2020, 1, 1)
+    dates = pt.OrderSet([first + datetime.timedelta(days=i) for i in range(10000)])
+    date_queries = [dates[i] for i in rng.integers(0, 9999, n)]
+    date_array = np.array(date_queries, dtype="datetime64[D]")
+    periods = pt.RangeOrderSet(0, 10000, step=2)
+    for order_set in (numbers, floats, strings, tuples, dates):
+        # builds the arrays before timing
+        order_set.ord_many(order_set[:1])
+
+    cases = {
+        "numbers: ord loop": lambda: [numbers.ord(v) for v in number_queries],
+        "numbers: ord_many": lambda: numbers.ord_many(number_queries),
+        "numbers: ord_many array": lambda: numbers.ord_many(np.array(number_queries)),
+        "numbers: next loop": lambda: [numbers.next(v) for v in number_queries],
+        "numbers: next_many": lambda: numbers.next_many(number_queries),
+        "floats: ord loop": lambda: [floats.ord(v) for v in float_queries],
+        "floats: ord_many": lambda: floats.ord_many(float_queries),
+        "strings: ord loop": lambda: [strings.ord(v) for v in string_queries],
+        "strings: ord_many": lambda: strings.ord_many(string_queries),
+        "tuples: ord loop": lambda: [tuples.ord(v) for v in tuple_queries],
+        "tuples: ord_many": lambda: tuples.ord_many(tuple_queries),
+        "dates: ord loop": lambda: [dates.ord(v) for v in date_queries],
+        "dates: ord_many": lambda: dates.ord_many(date_queries),
+        "dates: ord_many datetime64": lambda: dates.ord_many(date_array),
+        "range: ord loop": lambda: [periods.ord(v) for v in number_queries],
+        "range: ord_many": lambda: periods.ord_many(number_queries),
+    }
+    print("lookups: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<28} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
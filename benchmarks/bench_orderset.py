@@ -0,0 +1,80 @@
+"""
+Speed of editing and splicing a long :py:class:`pytups.OrderSet` in place, and of looking up
+positions after the edits, against the previous implementation.
+
+Usage::
+
+    python benchmarks/bench_orderset.py [n_periods]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import timeit
+
+
+class OrderSetReference(pt.OrderSet):
+    # the implementation of __delitem__ and insert up to version 1.0.5
+    def __delitem__(self, key):
+        del self._store[self[key]]
+        if key != -1:
+            rest = self._pos[key + 1 :]
+            for item in rest:
+                self._store[item] -= 1
+        del self._pos[key]
+
+    def insert(self, key, value):
+        # it always appended: we add the renumbering a real insert needs
+        self._pos.insert(key, value)
+        for pos in range(key, len(self._pos)):
+            self._store[self._pos[pos]] = pos
+
+
+def main(n):
+    periods = ["p{:07d}".format(i) for i in range(n)]
+    n_edits = 200
+
+    def rolling(cls):
+        # moves the horizon: drops the first periods, adds new ones at the end
+        # and some in the middle, looking up positions in between
+        horizon = cls(periods)
+        for i in range(n_edits):
+            del horizon[0]
+            horizon.insert(len(horizon) // 2, "new{}".format(i))
+            horizon.append("end{}".format(i))
+            horizon.next(horizon[n // 3], 2)
+        return horizon
+
+    def lookups(cls):
+        horizon = rolling(cls)
+        return [horizon.ord(horizon[i]) for i in range(0, len(horizon), max(n // 10000, 1))]
+
+    def replace_block(splice):
+        # replaces 24 periods in the middle, 50 times
+        horizon = pt.OrderSet(periods)
+        middle = n // 2
+        for i in range(50):
+            new = ["r{}-{}".format(i, j) for j in range(24)]
+            if splice:
+                horizon.splice(middle, 24, *new)
+            else:
+                horizon = pt.OrderSet(horizon[:middle] + new + horizon[middle + 24 :])
+        horizon.ord(horizon[-1])
+
+    cases = {
+        "before: {} edits".format(n_edits): lambda: rolling(OrderSetReference),
+        "now: {} edits".format(n_edits): lambda: rolling(pt.OrderSet),
+        "before: edits + 10k ord": lambda: lookups(OrderSetReference),
+        "now: edits + 10k ord": lambda: lookups(pt.OrderSet),
+        "rebuild: 50 blocks": lambda: replace_block(False),
+        "splice: 50 blocks": lambda: replace_block(True),
+    }
+    print("periods: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<28} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
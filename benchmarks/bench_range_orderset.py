@@ -0,0 +1,40 @@
+"""
+Memory and speed of :py:class:`pytups.RangeOrderSet` against an :py:class:`pytups.OrderSet`
+of the same consecutive periods.
+
+Usage::
+
+    python benchmarks/bench_range_orderset.py [n_periods]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def main(n):
+    ordinary = pt.OrderSet(list(range(n)))
+    compact = pt.RangeOrderSet(0, n)
+    queries = range(0, n - 10, max(n // 100000, 1))
+
+    cases = {
+        "OrderSet: build": lambda: pt.OrderSet(list(range(n))),
+        "RangeOrderSet: build": lambda: pt.RangeOrderSet(0, n),
+        "OrderSet: next + dist": lambda: [
+            ordinary.dist(p, ordinary.next(p, 10)) for p in queries
+        ],
+        "RangeOrderSet: next + dist": lambda: [
+            compact.dist(p, compact.next(p, 10)) for p in queries
+        ],
+    }
+    print("periods: {}, queries: {}".format(n, len(queries)))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<28} {:.3f}s {:>8.1f} MB".format(name, seconds, peak / 2**20))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
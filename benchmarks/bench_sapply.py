@@ -0,0 +1,54 @@
+"""
+Speed and peak memory of :py:meth:`pytups.SuperDict.sapply` with `how` and `fill_value`
+and of the in-place operators, against filling the missing keys first.
+
+Usage::
+
+    python benchmarks/bench_sapply.py [n_keys]
+
+"""
+
+import operator as op
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def accumulate_before(total, components):
+    for comp in components:
+        total = total + comp.fill_with_default(total.keys())
+    return total
+
+
+def accumulate_after(total, components):
+    for comp in components:
+        total.sapply_inplace(op.add, comp, fill_value=0)
+    return total
+
+
+def main(n):
+    keys = [("task_{}".format(i), i % 100) for i in range(n)]
+    components = [
+        pt.SuperDict((k, 1.0) for k in keys[j::3]) for j in range(3)
+    ]
+    full = pt.SuperDict((k, 1.0) for k in keys)
+    cases = {
+        "before, fill + add": lambda: accumulate_before(
+            pt.SuperDict.fromkeys(keys, 0.0), components
+        ),
+        "after, sapply_inplace": lambda: accumulate_after(
+            pt.SuperDict.fromkeys(keys, 0.0), components
+        ),
+        "total = total + full": lambda: full + full,
+        "total += full": lambda: full.__iadd__(full),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
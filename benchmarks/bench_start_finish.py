@@ -0,0 +1,62 @@
+"""
+Speed and peak memory of :py:meth:`pytups.TupList.to_start_finish`
+against its previous implementation.
+
+Usage::
+
+    python benchmarks/bench_start_finish.py [n_rows]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def to_start_finish_reference(tuplist, compare_tups, pp=1):
+    # the implementation of to_start_finish up to version 1.0.5, without the in-place sort
+    last_tup = ()
+    all_periods = []
+    current_period = []
+    for tup in tuplist:
+        if tup == tuplist[0] or compare_tups(tup, last_tup, pp):
+            if len(current_period):
+                all_periods.append(current_period)
+            current_period = [tup]
+        else:
+            current_period.append(tup)
+        last_tup = tup
+    if len(current_period):
+        all_periods.append(current_period)
+    join_func = lambda list_tup: tuple(list(list_tup[0]) + [list_tup[-1][pp]])
+    return pt.TupList([join_func(list_tup) for list_tup in all_periods])
+
+
+def compare_tups(x, y, p):
+    return x[0] != y[0] or x[p] - 1 != y[p]
+
+
+def main(n):
+    # resources busy in runs of 5 periods out of every 7
+    rows = pt.TupList(
+        ("resource_{}".format(i // 700), i % 700) for i in range(n) if i % 7 < 5
+    )
+    shuffled = rows.sorted(key=lambda x: (x[1], x[0]))
+    cases = {
+        "before, sorted input": lambda: to_start_finish_reference(rows, compare_tups),
+        "sorted input, no sort": lambda: rows.to_start_finish(sort=False),
+        "iter_start_finish": lambda: sum(1 for _ in rows.iter_start_finish()),
+        "numpy, no sort": lambda: rows.to_start_finish(sort=False, use_numpy=True),
+        "unsorted input": lambda: shuffled.to_start_finish(),
+        "unsorted input, numpy": lambda: shuffled.to_start_finish(use_numpy=True),
+    }
+    print("rows: {}".format(len(rows)))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,54 @@
+"""
+Speed of :py:meth:`pytups.TupList.take` against the previous implementations
+of take and take_np (now deprecated).
+
+Usage::
+
+    python benchmarks/bench_take.py [n_rows]
+
+"""
+
+import sys
+
+import numpy as np
+
+import pytups as pt
+
+from _common import timeit
+
+
+def take_reference(tuplist, indices):
+    # the implementation of take up to version 1.0.5
+    return tuplist.vapply(lambda tup: tuple(tup[a] for a in indices))
+
+
+def take_np_reference(tuplist, indices):
+    # the implementation of take_np up to version 1.0.5
+    arr = np.array(tuplist, dtype=object)
+    arr_filt = np.take(arr, indices, axis=1)
+    return pt.TupList(tuple(x) for x in arr_filt)
+
+
+def main(n):
+    rows = pt.TupList((i // 100, i % 100, "machine_{}".format(i % 20), i * 0.5) for i in range(n))
+    indices = [0, 1, 3]
+    print("rows: {}".format(n))
+    cases = {
+        "take, before": lambda: take_reference(rows, indices),
+        "take_np, before": lambda: take_np_reference(rows, indices),
+        "take": lambda: rows.take(indices),
+    }
+    for name, func in cases.items():
+        print("  {:<24} {:.3f}s".format(name, timeit(func)))
+
+    dicts = rows[: n // 10].to_dictlist(["task", "period", "machine", "cost"])
+    print("dict rows: {}".format(len(dicts)))
+    cases = {
+        "take": lambda: dicts.take(["task", "cost"]),
+    }
+    for name, func in cases.items():
+        print("  {:<24} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
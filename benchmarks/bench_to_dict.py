@@ -0,0 +1,87 @@
+"""
+Speed of :py:meth:`pytups.TupList.to_dict` against the previous, closure-based, implementation.
+
+Usage::
+
+    python benchmarks/bench_to_dict.py [n_rows ...]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import timeit
+
+
+def to_dict_reference(tuplist, result_col=0, is_list=True, indices=None):
+    # the implementation of to_dict up to version 1.0.5
+    if result_col is None:
+        if indices is None:
+            return pt.SuperDict({k: k for k in tuplist})
+    elif not isinstance(result_col, (list, tuple)):
+        result_col = [result_col]
+    if indices is None:
+        width = len(tuplist[0])
+        indices = [
+            col
+            for col in range(width)
+            if col not in result_col and (col - width) not in result_col
+        ]
+    elif not isinstance(indices, (list, tuple)):
+        indices = [indices]
+
+    def one_or_tup(_list):
+        if len(_list) == 1:
+            return _list[0]
+        return _list
+
+    def get_index(el):
+        return one_or_tup(tuple(el[i] for i in indices))
+
+    def get_content(el):
+        return one_or_tup(tuple(el[i] for i in result_col))
+
+    def assign_result(result, index, content):
+        if not is_list:
+            result[index] = content
+            return
+        if index not in result:
+            result[index] = pt.TupList()
+        result[index].append(content)
+
+    result = pt.SuperDict()
+    for el in tuplist:
+        assign_result(result, get_index(el), get_content(el))
+    return result
+
+
+def main(sizes):
+    cases = {
+        "K_j (one key, one value)": dict(result_col=1),
+        "JK_k2 (one key, two values)": dict(result_col=[0, 1]),
+        "two keys, one value": dict(result_col=2),
+        "no list": dict(result_col=2, is_list=False),
+    }
+    for n in sizes:
+        jkk2 = pt.TupList((j % 1000, j // 1000, j % 97) for j in range(n))
+        print("rows: {}".format(n))
+        for name, kwargs in cases.items():
+            old = timeit(lambda: to_dict_reference(jkk2, **kwargs))
+            new = timeit(lambda: jkk2.to_dict(**kwargs))
+            print(
+                "  {:<28} before: {:.3f}s after: {:.3f}s ({:.1f}x)".format(
+                    name, old, new, old / new
+                )
+            )
+        old = timeit(lambda: to_dict_reference(jkk2, result_col=[1, 2]))
+        new = timeit(lambda: jkk2.to_dict(result_col=[1, 2], use_numpy=True))
+        print(
+            "  {:<28} before: {:.3f}s after: {:.3f}s ({:.1f}x)".format(
+                "numpy, integer key", old, new, old / new
+            )
+        )
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,51 @@
+"""
+Speed and peak memory of :py:meth:`pytups.SuperDict.to_dictdict` and
+:py:meth:`pytups.SuperDict.dump_json` against the previous recursive implementation.
+
+Usage::
+
+    python benchmarks/bench_to_dictdict.py [n_keys]
+
+"""
+
+import io
+import json
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def to_dictdict_reference(data):
+    # the implementation of to_dictdict up to version 1.0.5
+    dictdict = pt.SuperDict()
+    for key in data:
+        if isinstance(data[key], dict):
+            data[key] = to_dictdict_reference(data[key])
+        value = data[key]
+        if not isinstance(key, tuple):
+            key = (key,)
+        dictdict.set_m(*key, value=value)
+    return dictdict
+
+
+def main(n):
+    solution = pt.SuperDict(
+        (("task_{}".format(i // 1000), "machine_{}".format(i % 10), i % 1000 // 10), 1)
+        for i in range(n)
+    )
+    cases = {
+        "before, to_dictdict": lambda: to_dictdict_reference(solution),
+        "before, dump": lambda: json.dump(to_dictdict_reference(solution), io.StringIO()),
+        "to_dictdict": lambda: solution.to_dictdict(),
+        "dump_json": lambda: solution.dump_json(io.StringIO()),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,46 @@
+"""
+Speed and peak memory of :py:meth:`pytups.SuperDict.to_dictup`
+against the previous recursive implementation.
+
+Usage::
+
+    python benchmarks/bench_to_dictup.py [n_keys]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def dicts_to_tup_reference(data, keys, content):
+    # the implementation of dicts_to_tup up to version 1.0.5
+    try:
+        for key, value in content.items():
+            dicts_to_tup_reference(data, keys + [key], value)
+    except AttributeError:
+        data[tuple(keys)] = content
+        return data
+    return data
+
+
+def main(n):
+    nested = pt.SuperDict(
+        (("task_{}".format(i // 1000), "machine_{}".format(i % 10), i % 1000 // 10), 1)
+        for i in range(n)
+    ).to_dictdict()
+    cases = {
+        "before, to_dictup": lambda: dicts_to_tup_reference(pt.SuperDict(), [], nested),
+        "to_dictup": lambda: nested.to_dictup(),
+        "iter_flat, no dict": lambda: sum(1 for _ in nested.iter_flat()),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
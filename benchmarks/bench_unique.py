@@ -0,0 +1,50 @@
+"""
+Speed of :py:meth:`pytups.TupList.unique` against its previous implementations.
+
+Usage::
+
+    python benchmarks/bench_unique.py [n_rows]
+
+"""
+
+import sys
+
+import numpy as np
+
+import pytups as pt
+
+from _common import timeit
+
+
+def unique_reference(tuplist, **kwargs):
+    # the implementation of unique up to version 1.0.5
+    arr = np.asarray(tuplist, **kwargs)
+    return pt.TupList(np.unique(arr, axis=0).tolist())
+
+
+def unique2_reference(tuplist):
+    # the implementation of unique2 up to version 1.0.5
+    return pt.TupList(set(tuplist))
+
+
+def main(n):
+    mixed = pt.TupList(("task_{}".format(i % 5000), i % 100) for i in range(n))
+    numbers = pt.TupList((i % 5000, i % 100, (i % 7) * 0.5) for i in range(n))
+    cases = {
+        "mixed, before unique": lambda: unique_reference(mixed),
+        "mixed, before unique2": lambda: unique2_reference(mixed),
+        "mixed, unique": lambda: mixed.unique(),
+        "mixed, unique(0)": lambda: mixed.unique(0),
+        "numbers, before unique": lambda: unique_reference(numbers),
+        "numbers, before unique2": lambda: unique2_reference(numbers),
+        "numbers, unique": lambda: numbers.unique(),
+        "numbers, unique numpy": lambda: numbers.unique(use_numpy=True),
+        "numbers, unique([0, 1]) np": lambda: numbers.unique([0, 1], use_numpy=True),
+    }
+    print("rows: {}".format(n))
+    for name, func in cases.items():
+        print("  {:<28} {:.3f}s".format(name, timeit(func)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
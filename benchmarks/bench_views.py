@@ -0,0 +1,42 @@
+"""
+Speed and peak memory of chained filters on :py:meth:`pytups.SuperDict.view`
+against chaining the filters of :py:class:`pytups.SuperDict`.
+
+Usage::
+
+    python benchmarks/bench_views.py [n_keys]
+
+"""
+
+import sys
+
+import pytups as pt
+
+from _common import measure
+
+
+def main(n):
+    data = pt.SuperDict(((i // 100, i % 100), i % 3) for i in range(n))
+
+    def constraints_before():
+        filtered = data.clean().kfilter(lambda k: k[1] < 80).vfilter(lambda v: v < 2)
+        return sum(1 for _ in filtered.items())
+
+    def constraints_view():
+        filtered = data.view().clean().kfilter(lambda k: k[1] < 80).vfilter(lambda v: v < 2)
+        return sum(1 for _ in filtered.items())
+
+    cases = {
+        "before, iterate": constraints_before,
+        "view, iterate": constraints_view,
+        "before, one filter": lambda: data.clean(),
+        "view, collect": lambda: data.view().clean().collect(),
+    }
+    print("keys: {}".format(n))
+    for name, func in cases.items():
+        seconds, peak = measure(func)
+        print("  {:<24} {:.3f}s peak {:.1f} MB".format(name, seconds, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -1,3 +1,12 @@
-from pytups.orderedSet import OrderSet, MissingValue
-from pytups.superdict import SuperDict
-from pytups.tuplist import TupList
+from pytups.orderedSet import OrderSet, RangeOrderSet, MissingValue
+from pytups.superdict import SuperDict, TrackedSuperDict
+from pytups.tuplist import TupList, TrackedTupList
+from pytups.columnar import ColumnarTupList
+from pytups.tupindex import TupIndex
+from pytups.lazy import LazyTupList
+from pytups.groupby import GroupBy
+from pytups.numeric import NumericSuperDict
+from pytups.views import SuperDictView
+from pytups.accessor import PathAccessor
+from pytups.inverted import InvertedIndex
+from pytups.default import DefaultSuperDict, KeyProduct
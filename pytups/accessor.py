@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from functools import reduce
+from operator import getitem
+from typing import Any, Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+
+def _get_path(data: dict, path: tuple, default=None) -> Any:
+    """
+    Follows the path of keys in a nested dictionary.
+
+    :return: the value at the end, or `default` if a key is missing
+    """
+    try:
+        # dict.__getitem__ skips the python level __getitem__ of SuperDict
+        return reduce(dict.__getitem__, path, data)
+    except KeyError:
+        return default
+    except TypeError:
+        # some level is not a dict
+        pass
+    try:
+        return reduce(getitem, path, data)
+    except KeyError:
+        return default
+
+
+class PathAccessor:
+    """
+    Reads and writes values of a nested :py:class:`pytups.superdict.SuperDict`
+    following paths with the same shape.
+
+    The template is a tuple of keys where each `...` is filled, in order,
+    with the keys given to :py:meth:`get` and :py:meth:`set`.
+    With `cache=True`, all the values that match the template are copied into
+    a flat dictionary indexed by their path. The nested dictionaries need to be
+    :py:class:`pytups.superdict.TrackedSuperDict`: any modification drops the cache,
+    which is rebuilt on the next read.
+    """
+
+    def __init__(self, data: "SuperDict", template: Tuple, cache: bool = False):
+        """
+        :param data: the nested dictionary
+        :param template: keys in the nested dictionary, or `...` for keys given later
+        :param bool cache: keep a flat copy of the values, indexed by their path
+        """
+        if not template:
+            raise ValueError("The template needs at least one key")
+        self._data = data
+        self.template = tuple(template)
+        self._slots = [pos for pos, key in enumerate(self.template) if key is ...]
+        # when the fixed keys all go first, the path is built with a single concatenation
+        self._prefix: tuple | None = None
+        n_fixed = len(self.template) - len(self._slots)
+        if self._slots == list(range(n_fixed, len(self.template))):
+            self._prefix = self.template[:n_fixed]
+        self._cache = cache
+        self._flat: Dict[tuple, Any] | None = None
+        self._watched: List["SuperDict"] = []
+        # True while we modify the dictionary ourselves
+        self._writing = False
+
+    def _path(self, keys: tuple) -> tuple:
+        if len(keys) != len(self._slots):
+            raise TypeError(
+                "{} keys are needed, got {}".format(len(self._slots), len(keys))
+            )
+        if self._prefix is not None:
+            return self._prefix + keys
+        path = list(self.template)
+        for pos, key in zip(self._slots, keys):
+            path[pos] = key
+        return tuple(path)
+
+    def get(self, *keys, default=None) -> Any:
+        """
+        :param keys: one key for each `...` in the template
+        :param default: value to return if the path does not exist
+        :return: the value at the end of the path
+        """
+        path = self._path(keys)
+        if self._cache:
+            flat = self._flat
+            if flat is None:
+                flat = self._get_flat()
+            return flat.get(path, default)
+        return _get_path(self._data, path, default)
+
+    def get_many(self, paths: Iterable[tuple], default=None) -> list:
+        """
+        :param paths: for each value, one key for each `...` in the template
+        :param default: value to use for the paths that do not exist
+        :return: list with the value at the end of each path
+        """
+        paths = map(self._path, paths)
+        if self._cache:
+            get = self._get_flat().get
+            return [get(path, default) for path in paths]
+        data = self._data
+        return [_get_path(data, path, default) for path in paths]
+
+    def set(self, *keys, value=None) -> "SuperDict":
+        """
+        Assigns `value` at the end of the path, creating the missing dictionaries,
+        as :py:meth:`pytups.superdict.SuperDict.set_m`.
+
+        :param keys: one key for each `...` in the template
+        :param value: value to assign
+        :return: the modified dictionary
+        """
+        path = self._path(keys)
+        if self._flat is None:
+            return self._data.set_m(*path, value=value)
+        try:
+            parent = reduce(getitem, path[:-1], self._data)
+        except KeyError:
+            # new dictionaries are needed: the cache will be rebuilt
+            return self._data.set_m(*path, value=value)
+        # the path already exists: we keep the cache up to date
+        self._writing = True
+        try:
+            parent[path[-1]] = value
+        finally:
+            self._writing = False
+        self._flat[path] = value
+        return self._data
+
+    def _get_flat(self) -> Dict[tuple, Any]:
+        if self._flat is None:
+            self._flat = self._build()
+        return self._flat
+
+    def _build(self) -> Dict[tuple, Any]:
+        """
+        Flattens the dictionary down to the depth of the template and watches all the
+        nested dictionaries on the way.
+        """
+        from .superdict import TrackedSuperDict
+
+        depth = len(self.template)
+        flat: Dict[tuple, Any] = {}
+        stack = [((), self._data)]
+        while stack:
+            prefix, node = stack.pop()
+            if not isinstance(node, TrackedSuperDict):
+                raise TypeError(
+                    "The cache needs nested TrackedSuperDicts. Try SuperDict.tracked() first."
+                )
+            node._watch(self)
+            self._watched.append(node)
+            fixed = self.template[len(prefix)]
+            if fixed is ...:
+                items: Iterable = node.items()
+            else:
+                items = [(fixed, node[fixed])] if fixed in node else []
+            if len(prefix) + 1 == depth:
+                flat.update(((*prefix, key), value) for key, value in items)
+                continue
+            for key, value in items:
+                if isinstance(value, dict):
+                    stack.append(((*prefix, key), value))
+        return flat
+
+    def invalidate(self) -> None:
+        """
+        Drops the cache. It's rebuilt on the next read.
+        """
+        self._flat = None
+        watched, self._watched = self._watched, []
+        for node in watched:
+            node._unwatch(self)
+
+    def _dict_changed(self, data: "SuperDict", key) -> None:
+        if not self._writing:
+            self.invalidate()
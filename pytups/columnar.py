@@ -0,0 +1,440 @@
+from __future__ import annotations
+
+import csv
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from itertools import compress, islice, repeat
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Union,
+    TYPE_CHECKING,
+    cast,
+    overload,
+)
+
+from .tools import is_really_iterable
+from .tuplist import TupList, _group, _to_dict_cols
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+# typecodes for the typed columns
+_NUMBER_CODES = {int: "q", float: "d"}
+# typecode for the dictionary-encoded columns
+_CODE_TYPECODE = "l"
+
+
+class _NumberColumn:
+    """
+    A column of ints or floats stored in a typed array
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: array):
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def get(self, pos: int):
+        return self.data[pos]
+
+    def values(self) -> Iterable:
+        return self.data
+
+    def raw(self) -> Iterable:
+        return self.data
+
+    def sort_keys(self) -> Iterable:
+        return self.data
+
+    def select(self, positions: Iterable[int]) -> "_NumberColumn":
+        return _NumberColumn(array(self.data.typecode, map(self.data.__getitem__, positions)))
+
+    def extend(self, values: tuple) -> Union["_NumberColumn", "_CodedColumn"]:
+        if _number_typecode(values) == self.data.typecode:
+            size = len(self.data)
+            try:
+                self.data.extend(values)
+                return self
+            except OverflowError:
+                # ints that do not fit in 64 bits: the ones before them were added
+                del self.data[size:]
+        # the new values do not fit: we fall back to a dictionary-encoded column
+        column = _CodedColumn.from_values(self.data)
+        return column.extend(values)
+
+    def nbytes(self) -> int:
+        return self.data.itemsize * len(self.data)
+
+
+class _CodedColumn:
+    """
+    A dictionary-encoded column: each distinct value (of each type) is stored once
+    and every row only keeps the integer code of its value.
+    """
+
+    __slots__ = ("codes", "categories", "lookup", "mixed")
+
+    def __init__(self, codes: array, categories: list, lookup: dict, mixed: bool = False):
+        self.codes = codes
+        self.categories = categories
+        self.lookup = lookup
+        # values of several types: the lookup is by type and value
+        self.mixed = mixed
+
+    @classmethod
+    def from_values(cls, values: Sequence) -> "_CodedColumn":
+        return cls(array(_CODE_TYPECODE), [], {}).extend(values)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def get(self, pos: int):
+        return self.categories[self.codes[pos]]
+
+    def values(self) -> Iterable:
+        return map(self.categories.__getitem__, self.codes)
+
+    def raw(self) -> Iterable:
+        if self.mixed:
+            # different codes can have equal values
+            return self.values()
+        return self.codes
+
+    def sort_keys(self) -> Iterable:
+        # the rank of each category replaces the code so integers sort like the values
+        categories = self.categories
+        order = sorted(range(len(categories)), key=categories.__getitem__)
+        rank = [0] * len(order)
+        position = -1
+        previous = None
+        for code in order:
+            value = categories[code]
+            # equal values (1 and 1.0) get the same rank
+            if position < 0 or value != previous:
+                position += 1
+            previous = value
+            rank[code] = position
+        return array(_CODE_TYPECODE, map(rank.__getitem__, self.codes))
+
+    def select(self, positions: Iterable[int]) -> "_CodedColumn":
+        codes = array(_CODE_TYPECODE, map(self.codes.__getitem__, positions))
+        # categories are shared: columns are never modified after being built
+        return _CodedColumn(codes, self.categories, self.lookup, self.mixed)
+
+    def extend(self, values: Sequence) -> "_CodedColumn":
+        lookup = self.lookup
+        categories = self.categories
+        if not self.mixed:
+            kinds = set(map(type, values))
+            if categories:
+                kinds.add(type(categories[0]))
+            if len(kinds) > 1:
+                # 1, 1.0 and True are equal but different values: from now on
+                # the type is part of the key
+                self.mixed = True
+                self.lookup = lookup = {
+                    (type(value), value): code for code, value in enumerate(categories)
+                }
+        if self.mixed:
+            keys: Sequence = list(zip(map(type, values), values))
+        else:
+            keys = values
+        for key, value in zip(keys, values):
+            if key not in lookup:
+                lookup[key] = len(categories)
+                categories.append(value)
+        self.codes.extend(map(lookup.__getitem__, keys))
+        return self
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+_Column = Union[_NumberColumn, _CodedColumn]
+
+
+def _number_typecode(values: Iterable) -> str | None:
+    kinds = set(map(type, values))
+    if len(kinds) != 1:
+        return None
+    return _NUMBER_CODES.get(kinds.pop())
+
+
+def _build_column(values: tuple) -> _Column:
+    typecode = _number_typecode(values)
+    if typecode is not None:
+        try:
+            return _NumberColumn(array(typecode, values))
+        except OverflowError:
+            # ints that do not fit in 64 bits
+            pass
+    return _CodedColumn.from_values(values)
+
+
+class ColumnarTupList(Sequence):
+    """
+    A list of tuples stored column by column.
+
+    Columns of ints or floats are kept in typed :py:class:`array.array` and
+    any other column is dictionary-encoded. Rows are rebuilt as tuples on demand.
+    The object is not modified after being built.
+    """
+
+    _columns: List[_Column]
+    _len: int
+
+    def __init__(self, data: Iterable = (), chunksize: int = 65536):
+        """
+        :param data: an iterable of tuples, all with the same length
+        :param int chunksize: number of rows to convert at a time
+        """
+        self._columns = []
+        self._len = 0
+        rows = iter(data)
+        while True:
+            chunk = list(islice(rows, chunksize))
+            if not chunk:
+                break
+            self._extend(chunk)
+
+    @classmethod
+    def _from_columns(cls, columns: List[_Column], length: int) -> "ColumnarTupList":
+        new = cls.__new__(cls)
+        new._columns = columns
+        new._len = length
+        return new
+
+    def _extend(self, chunk: list) -> None:
+        if isinstance(chunk[0], dict):
+            raise TypeError("ColumnarTupList only stores tuples")
+        widths = set(map(len, chunk))
+        if len(widths) > 1 or (self._columns and widths != {len(self._columns)}):
+            raise ValueError("all rows need to have the same length")
+        columns = list(zip(*chunk))
+        if not self._columns:
+            self._columns = [_build_column(values) for values in columns]
+        else:
+            self._columns = [
+                column.extend(values) for column, values in zip(self._columns, columns)
+            ]
+        self._len += len(chunk)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[tuple]:
+        if not self._columns:
+            return iter(() for _ in range(self._len))
+        return zip(*(column.values() for column in self._columns))
+
+    @overload
+    def __getitem__(self, key: int) -> tuple: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "ColumnarTupList": ...
+
+    def __getitem__(self, key: int | slice) -> tuple | "ColumnarTupList":
+        if isinstance(key, slice):
+            return self._select(range(self._len)[key])
+        return tuple(column.get(key) for column in self._columns)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "ColumnarTupList({})".format(self.head())
+
+    def head(self) -> str:
+        if self._len <= 10:
+            return list.__repr__(self.to_list())
+        return "[{},\n...,\n{}]\n({} elements)".format(
+            self[:5].to_list().__repr__(), self[-5:].to_list().__repr__(), self._len
+        )
+
+    def len(self) -> int:
+        """
+        Shortcut to:
+
+        >>> len(ColumnarTupList())
+
+        :return: number of rows
+        :rtype: int
+        """
+        return self._len
+
+    @property
+    def ncols(self) -> int:
+        """
+        :return: the number of positions in each tuple
+        """
+        return len(self._columns)
+
+    def nbytes(self) -> int:
+        """
+        Size of the row data, without the distinct values of the encoded columns.
+
+        :return: number of bytes
+        """
+        return sum(column.nbytes() for column in self._columns)
+
+    def _select(self, positions: Iterable[int]) -> "ColumnarTupList":
+        positions = list(positions)
+        columns = [column.select(positions) for column in self._columns]
+        return self._from_columns(columns, len(positions))
+
+    def _iter_cols(self, cols: list) -> Iterable:
+        # yields a value per row if there is only one column and a tuple otherwise
+        if not cols:
+            return repeat((), self._len)
+        if len(cols) == 1:
+            return self._columns[cols[0]].values()
+        return zip(*(self._columns[col].values() for col in cols))
+
+    def take(self, indices: Union[Iterable, int]) -> Union["ColumnarTupList", TupList]:
+        """
+        Keeps only some positions of each tuple.
+        The columns are shared with the original object, no data is copied.
+
+        :param indices: a list of positions or a single position
+        :type indices: int or list
+        :return: a new :py:class:`ColumnarTupList` or, for a single position,
+            a :py:class:`pytups.tuplist.TupList` with the values
+        """
+        if not is_really_iterable(indices):
+            return TupList(self._columns[cast(int, indices)].values())
+        columns = [self._columns[col] for col in cast(Iterable, indices)]
+        return self._from_columns(columns, self._len)
+
+    def vfilter(self, function: Callable) -> "ColumnarTupList":
+        """
+        returns new list with only tuples for which `function` returns True
+
+        :param callable function: function to apply to each element
+        :return: new :py:class:`ColumnarTupList`
+        """
+        return self._select(compress(range(self._len), map(function, self)))
+
+    def sorted(self, key: Callable | None = None, reverse: bool = False) -> "ColumnarTupList":
+        """
+        Sorts the rows and returns a new object.
+        Without `key`, rows are sorted column by column without building the tuples.
+
+        :param callable key: function to apply to each tuple to get the sorting key
+        :param bool reverse: sort in descending order
+        :return: new :py:class:`ColumnarTupList`
+        """
+        order = list(range(self._len))
+        if key is not None:
+            keys = list(map(key, self))
+            order.sort(key=keys.__getitem__, reverse=reverse)
+            return self._select(order)
+        # stable sorts from the last column to the first give the lexicographic order
+        for column in reversed(self._columns):
+            order.sort(key=column.sort_keys().__getitem__, reverse=reverse)
+        return self._select(order)
+
+    def unique(self) -> "ColumnarTupList":
+        """
+        Takes out repeated tuples, keeping the order in which they first appear.
+
+        :return: new :py:class:`ColumnarTupList`
+        """
+        # codes identify the values, so we compare codes instead of values
+        rows = zip(*(column.raw() for column in self._columns))
+        # the first position of each row, in the order they appear
+        first: dict = {}
+        deque(map(first.setdefault, rows, range(self._len)), maxlen=0)
+        return self._select(first.values())
+
+    def to_dict(
+        self,
+        result_col: Union[Iterable, int, None] = 0,
+        is_list: bool = True,
+        indices: Union[Iterable, int, None] = None,
+    ) -> "SuperDict":
+        """
+        Same as :py:meth:`pytups.tuplist.TupList.to_dict` but only
+        decoding the columns that are needed.
+
+        :param result_col: a list of positions for the result
+        :type result_col: int or list or None
+        :param bool is_list: the value of the dictionary will be a TupList?
+        :param list indices: optional way of determining the indices instead of
+            being the complement of result_col
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        if self._len == 0:
+            return sd.SuperDict()
+        if result_col is None and indices is None:
+            return sd.SuperDict({k: k for k in self})
+        result_col, indices = _to_dict_cols(self.ncols, result_col, indices)
+        keys = self._iter_cols(indices)
+        if result_col is None:
+            contents: Iterable = iter(self)
+        else:
+            contents = self._iter_cols(result_col)
+        return _group(keys, contents, is_list)
+
+    def to_tuplist(self) -> TupList:
+        """
+        Builds the tuples back.
+
+        :return: new :py:class:`pytups.tuplist.TupList`
+        """
+        return TupList(self)
+
+    def to_list(self) -> list:
+        """
+
+        :return: list
+        """
+        return list(self)
+
+    def to_numpy(self, pos: int):
+        """
+        Gets one column as a numpy array.
+        Typed columns are not copied.
+
+        :param int pos: position of the column
+        :return: :py:class:`numpy.ndarray`
+        """
+        import numpy as np
+
+        column = self._columns[pos]
+        if isinstance(column, _NumberColumn):
+            return np.frombuffer(column.data, dtype=column.data.typecode)
+        categories = np.empty(len(column.categories), dtype=object)
+        categories[:] = column.categories
+        return categories[np.frombuffer(column.codes, dtype=_CODE_TYPECODE)]
+
+    def to_csv(self, path: str, header: list | None = None) -> "ColumnarTupList":
+        """
+        Exports the list to a csv file
+
+        :param path: filename
+        :param header: list of strings to use as header/column names
+        :return: the same :py:class:`ColumnarTupList`
+        """
+        if self._len == 0:
+            return self
+        if header is not None and self.ncols != len(header):
+            raise ValueError("Header length does not match data length")
+        with open(path, "w", newline="\n", encoding="utf-8") as out:
+            csv_out = csv.writer(out)
+            if header is not None:
+                csv_out.writerow(header)
+            csv_out.writerows(self)
+        return self
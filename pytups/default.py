@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from itertools import product
+from typing import Any, Callable, Iterable, Iterator, Mapping, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+    from .tuplist import TupList
+
+
+class KeyProduct:
+    """
+    All the combinations of some domains, as :py:func:`itertools.product`, without building them.
+
+    >>> keys = KeyProduct(['t1', 't2'], [1, 2, 3])
+    >>> len(keys), ('t2', 3) in keys
+    (6, True)
+    """
+
+    def __init__(self, *domains: Iterable):
+        """
+        :param domains: the possible values of each position of the keys
+        """
+        # dicts keep the order and are fast to search
+        self.domains = [dict.fromkeys(domain) for domain in domains]
+
+    def __contains__(self, key) -> bool:
+        if not isinstance(key, tuple) or len(key) != len(self.domains):
+            return False
+        try:
+            return all(part in domain for part, domain in zip(key, self.domains))
+        except TypeError:
+            # not hashable
+            return False
+
+    def __iter__(self) -> Iterator[tuple]:
+        return product(*self.domains)
+
+    def __len__(self) -> int:
+        size = 1
+        for domain in self.domains:
+            size *= len(domain)
+        return size
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, KeyProduct):
+            return NotImplemented
+        return self.domains == other.domains
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "KeyProduct({})".format(
+            ", ".join(repr(list(domain)) for domain in self.domains)
+        )
+
+
+# methods of SuperDict that DefaultSuperDict runs on a full copy: they do not modify it
+_READ_METHODS = frozenset(
+    [
+        "as_array",
+        "clean",
+        "copy_deep",
+        "copy_deep2",
+        "copy_shallow",
+        "dump_json",
+        "fill_with_default",
+        "filter",
+        "get_m",
+        "get_property",
+        "head",
+        "index_by_part_of_tuple",
+        "index_by_parts_of_tuple",
+        "index_by_property",
+        "items_tl",
+        "iter_flat",
+        "kapply",
+        "keys_l",
+        "keys_tl",
+        "kfilter",
+        "kvapply",
+        "kvfilter",
+        "len",
+        "list_reverse",
+        "reverse",
+        "sorted",
+        "to_df",
+        "to_dictdict",
+        "to_dictup",
+        "to_lendict",
+        "values_l",
+        "values_tl",
+        "vfilter",
+    ]
+)
+# methods of SuperDict that would only modify the copy
+_WRITE_METHODS = frozenset(
+    [
+        "accessor",
+        "clear",
+        "dicts_to_tup",
+        "inverted_index",
+        "pop",
+        "popitem",
+        "sapply_inplace",
+        "set_m",
+        "setdefault",
+        "tracked",
+        "update",
+        "view",
+    ]
+)
+
+
+class DefaultSuperDict(Mapping):
+    """
+    A dictionary with a value for every key of a domain, where only the keys that are not
+    the default are stored.
+
+    Lookups, `len` and iteration go over the whole domain (and the stored keys that are out of it)
+    without building it. :py:meth:`vapply` and :py:meth:`sapply` with a number keep the result sparse.
+    The methods of :py:class:`pytups.superdict.SuperDict` that do not modify the dictionary
+    are available too: they build all the keys first, with :py:meth:`to_superdict`.
+    The ones that modify it (or follow its changes) raise a TypeError.
+    """
+
+    def __init__(self, data: dict, keys: Iterable, default: Any = 0):
+        """
+        :param dict data: the stored values. It's not copied.
+        :param keys: the domain: a :py:class:`KeyProduct` or any collection of keys
+        :param default: value of the keys of the domain that are not in `data`
+        """
+        self.data = data
+        if not isinstance(keys, (KeyProduct, set, frozenset, dict)):
+            keys = dict.fromkeys(keys)
+        self.domain = keys
+        self.default = default
+
+    def __getitem__(self, key):
+        try:
+            return self.data[key]
+        except KeyError:
+            if key in self.domain:
+                return self.default
+            raise
+
+    def __contains__(self, key) -> bool:
+        return key in self.data or key in self.domain
+
+    def _extra_keys(self) -> Iterator:
+        """
+        The stored keys that are not in the domain.
+        """
+        domain = self.domain
+        return (k for k in self.data if k not in domain)
+
+    def __iter__(self) -> Iterator:
+        yield from self.domain
+        yield from self._extra_keys()
+
+    def __len__(self) -> int:
+        return len(self.domain) + sum(1 for _ in self._extra_keys())
+
+    def __getattr__(self, name: str):
+        # only called for what is not defined here: we borrow it from a full SuperDict
+        if name in _READ_METHODS:
+            return getattr(self.to_superdict(), name)
+        if name in _WRITE_METHODS:
+            raise TypeError(
+                "DefaultSuperDict can't be modified with {}: "
+                "modify its data or use to_superdict() first.".format(name)
+            )
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def __repr__(self) -> str:
+        return "DefaultSuperDict({} stored, {} keys, default={!r})".format(
+            len(self.data), len(self), self.default
+        )
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:  # type: ignore[override]
+        get = self.data.get
+        default = self.default
+        for k in self.domain:
+            yield k, get(k, default)
+        data = self.data
+        for k in self._extra_keys():
+            yield k, data[k]
+
+    def values(self) -> Iterator:  # type: ignore[override]
+        return (v for _, v in self.items())
+
+    def _new(self, data: dict, default) -> "DefaultSuperDict":
+        return DefaultSuperDict(data, self.domain, default)
+
+    def vapply(self, func: Callable, *args, **kwargs) -> "DefaultSuperDict":
+        """
+        Applies the function to the stored values and to the default,
+        so it's only called once for all the keys with the default.
+
+        :param callable func: function to apply.
+        :return: new :py:class:`DefaultSuperDict`
+        """
+        from . import superdict as sd
+
+        data = sd.SuperDict(self.data).vapply(func, *args, **kwargs)
+        return self._new(data, func(self.default, *args, **kwargs))
+
+    def sapply(self, func: Callable, other, *args, **kwargs) -> "DefaultSuperDict | SuperDict":
+        """
+        Applies function to both dictionaries, as :py:meth:`pytups.superdict.SuperDict.sapply`.
+        With a number, or another :py:class:`DefaultSuperDict` over an equal domain,
+        the result is sparse. Otherwise, all the keys are used.
+
+        :param callable func: function to apply.
+        :param other: either an int, a float, a string or another dictionary
+        :return: new :py:class:`DefaultSuperDict` or :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        if isinstance(other, (int, float, str)):
+            return self.vapply(lambda v: func(v, other, *args, **kwargs))
+        if isinstance(other, DefaultSuperDict) and (
+            other.domain is self.domain or other.domain == self.domain
+        ):
+            # the keys of self, as in SuperDict.sapply
+            domain = self.domain
+            keys = dict.fromkeys(self.data)
+            keys.update(dict.fromkeys(k for k in other.data if k in domain))
+            data = sd.SuperDict(
+                {k: func(self[k], other[k], *args, **kwargs) for k in keys}
+            )
+            return self._new(data, func(self.default, other.default, *args, **kwargs))
+        return self.to_superdict().sapply(func, other, *args, **kwargs)
+
+    def to_superdict(self) -> "SuperDict":
+        """
+        Builds all the keys.
+
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        return sd.SuperDict(self.items())
+
+    def to_tuplist(self) -> "TupList":
+        """
+        Same as :py:meth:`pytups.superdict.SuperDict.to_tuplist`, for all the keys.
+
+        :return: new :py:class:`pytups.tuplist.TupList`
+        """
+        from . import superdict as sd
+        from . import tuplist as tl
+
+        return tl.TupList(sd._iter_tuplist(self.items()))
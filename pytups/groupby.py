@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import operator as op
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union, TYPE_CHECKING
+
+from .tuplist import TupList, _as_cols, _item_getter
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+
+def _count(state, value):
+    return state + 1
+
+
+def _keep(state, value):
+    return state
+
+
+# for each aggregation: the value of the first element and how to update it
+_AGGREGATIONS: Dict[str, Tuple[Callable, Callable]] = {
+    "sum": (lambda v: v, op.add),
+    "count": (lambda v: 1, _count),
+    "min": (lambda v: v, min),
+    "max": (lambda v: v, max),
+    "first": (lambda v: v, _keep),
+}
+
+
+class GroupBy:
+    """
+    The elements of a list grouped by some of their positions (or keys),
+    ready to be aggregated with :py:meth:`agg`.
+    """
+
+    def __init__(self, data: Iterable, cols: Union[Iterable, int, str]):
+        """
+        :param data: a :py:class:`pytups.tuplist.TupList` or any iterable of tuples (or dicts)
+        :param cols: positions (or keys) to group by
+        """
+        self._data = data
+        self.cols = _as_cols(cols)
+
+    def agg(self, use_numpy: bool = False, **aggregations) -> "SuperDict":
+        """
+        Aggregates the elements of each group in a single pass over the data.
+
+        >>> TupList([(1, 5), (1, 6), (2, 7)]).group_by(0).agg(sum=1)
+        {1: 11, 2: 7}
+        >>> TupList([(1, 5), (1, 6), (2, 7)]).group_by(0).agg(count=True, max=1)
+        {1: (2, 6), 2: (1, 7)}
+
+        :param bool use_numpy: aggregate with numpy when the data is a TupList grouped by one
+            numeric position and the aggregated values are numeric
+        :param aggregations: the name of the aggregation (sum, count, min, max or first) and
+            the position (or key) to aggregate. For count, the value is not used.
+        :return: new :py:class:`pytups.superdict.SuperDict` with the result of the aggregation
+            for each group, or a tuple with all of them if there are several.
+        """
+        from . import superdict as sd
+
+        if not aggregations:
+            raise ValueError("At least one aggregation is needed")
+        unknown = set(aggregations) - _AGGREGATIONS.keys()
+        if unknown:
+            raise ValueError(
+                "Unknown aggregations: {}. Options are: {}".format(
+                    unknown, list(_AGGREGATIONS)
+                )
+            )
+        if use_numpy and isinstance(self._data, TupList) and len(self.cols) == 1:
+            try:
+                return self._agg_numpy(aggregations)
+            except (ImportError, TypeError):
+                # numpy is not present or the values are not numbers
+                pass
+        get_key = _item_getter(self.cols)
+        if len(aggregations) == 1:
+            name, col = next(iter(aggregations.items()))
+            return sd.SuperDict(_agg_one(name, col, get_key, self._data))
+
+        names = list(aggregations)
+        inits = [_AGGREGATIONS[name][0] for name in names]
+        updates = [_AGGREGATIONS[name][1] for name in names]
+        getters = [
+            (lambda el: None) if name == "count" else _item_getter([col])
+            for name, col in aggregations.items()
+        ]
+        steps = list(zip(range(len(names)), updates, getters))
+        states: Dict[Any, List] = {}
+        for el in self._data:
+            key = get_key(el)
+            state = states.get(key)
+            if state is None:
+                states[key] = [init(get(el)) for init, get in zip(inits, getters)]
+                continue
+            for pos, update, get in steps:
+                state[pos] = update(state[pos], get(el))
+        return sd.SuperDict({k: tuple(v) for k, v in states.items()})
+
+    def _agg_numpy(self, aggregations: dict) -> "SuperDict":
+        import numpy as np
+        from . import superdict as sd
+
+        data = self._data
+        keys = data.column_np(self.cols[0])
+        if keys.dtype.kind not in "iuf":
+            raise TypeError("numpy aggregation needs numeric keys")
+        uniq, first_pos, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        inverse = inverse.ravel()
+        # elements sorted by group and groups in order of appearance
+        order = np.argsort(inverse, kind="stable")
+        counts = np.bincount(inverse, minlength=len(uniq))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        appearance = np.argsort(first_pos, kind="stable")
+        results = []
+        for name, col in aggregations.items():
+            if name == "count":
+                results.append(counts[appearance].tolist())
+                continue
+            values = data.column_np(col)
+            if values.dtype.kind not in "iuf":
+                raise TypeError("numpy aggregation needs numeric values")
+            if name == "first":
+                results.append(values[first_pos][appearance].tolist())
+                continue
+            ufunc = {"sum": np.add, "min": np.minimum, "max": np.maximum}[name]
+            results.append(ufunc.reduceat(values[order], starts)[appearance].tolist())
+        keys_l = uniq[appearance].tolist()
+        if len(results) == 1:
+            return sd.SuperDict(zip(keys_l, results[0]))
+        return sd.SuperDict(zip(keys_l, zip(*results)))
+
+    def sum(self, col: Union[int, str]) -> "SuperDict":
+        """
+        Shortcut to `agg(sum=col)`
+        """
+        return self.agg(sum=col)
+
+    def count(self) -> "SuperDict":
+        """
+        Shortcut to `agg(count=True)`
+        """
+        return self.agg(count=True)
+
+    def min(self, col: Union[int, str]) -> "SuperDict":
+        """
+        Shortcut to `agg(min=col)`
+        """
+        return self.agg(min=col)
+
+    def max(self, col: Union[int, str]) -> "SuperDict":
+        """
+        Shortcut to `agg(max=col)`
+        """
+        return self.agg(max=col)
+
+    def first(self, col: Union[int, str]) -> "SuperDict":
+        """
+        Shortcut to `agg(first=col)`
+        """
+        return self.agg(first=col)
+
+
+def _agg_one(name: str, col, get_key: Callable, data: Iterable) -> dict:
+    """
+    Same as :py:meth:`GroupBy.agg` with a single aggregation, with a loop for each one.
+    """
+    if name == "count":
+        return Counter(map(get_key, data))
+    pairs = ((get_key(el), el[col]) for el in data)
+    result: dict = {}
+    if name == "first":
+        for key, value in pairs:
+            if key not in result:
+                result[key] = value
+        return result
+    get = result.get
+    missing = object()
+    if name == "sum":
+        # like in agg, the sum starts from the first value and not from 0
+        for key, value in pairs:
+            current = get(key, missing)
+            result[key] = value if current is missing else current + value
+        return result
+    better = op.lt if name == "min" else op.gt
+    for key, value in pairs:
+        current = get(key, missing)
+        if current is missing or better(value, current):
+            result[key] = value
+    return result
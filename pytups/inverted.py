@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from itertools import chain, repeat
+from typing import Any, Dict, Iterable, Iterator, List, TYPE_CHECKING
+
+from .tuplist import TupList
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+
+class InvertedIndex:
+    """
+    The reverse of a :py:class:`pytups.superdict.SuperDict` of lists: for each value in the lists,
+    the keys whose list has it. It's built in a single pass over the dictionary,
+    with :py:meth:`pytups.superdict.SuperDict.list_reverse`.
+
+    With `sync=True` the dictionary, a :py:class:`pytups.superdict.TrackedSuperDict`, is watched:
+    assigning or deleting keys updates the index for those keys only. Adding or removing values with :py:meth:`add` and :py:meth:`remove`
+    changes both the list in the dictionary and the index.
+    Changes made to the lists in any other way are not seen: call :py:meth:`invalidate`
+    after them. If the index finds out it does not match the dictionary, it's rebuilt
+    on the next lookup. It never stops the dictionary from being modified.
+    """
+
+    # for each value: the keys that have it. As built by list_reverse, a list with each key
+    # once per time it has the value. Once the value changes, a dict with the count of each key.
+    _reverse: Dict[Any, List | Dict[Any, int]]
+
+    def __init__(self, data: "SuperDict", sync: bool | None = None):
+        """
+        :param data: a dictionary of lists
+        :param bool sync: follow the changes of the dictionary.
+            By default, only if it's a :py:class:`pytups.superdict.TrackedSuperDict`.
+        """
+        from .superdict import TrackedSuperDict
+
+        tracked = isinstance(data, TrackedSuperDict)
+        if sync is None:
+            sync = tracked
+        elif sync and not tracked:
+            raise TypeError(
+                "sync=True needs a TrackedSuperDict. Try SuperDict.tracked() first."
+            )
+        self._data = data
+        # for each value: the keys that have it, once per time they have it
+        self._reverse = {}
+        self._stale = True
+        # True while we modify the dictionary ourselves
+        self._writing = False
+        self._sync = sync
+        if sync:
+            data._watch(self)
+
+    def _build(self) -> None:
+        from .superdict import SuperDict
+
+        self._reverse = dict(SuperDict.list_reverse(self._data))
+        self._stale = False
+
+    def _counts(self, value) -> Dict[Any, int]:
+        """
+        :return: the count of each key that has the value, to be modified
+        """
+        keys = self._reverse.get(value)
+        if isinstance(keys, list):
+            counts: Dict[Any, int] = {}
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+            keys = self._reverse[value] = counts
+        elif keys is None:
+            keys = self._reverse[value] = {}
+        return keys
+
+    def _add_values(self, key, values: Iterable) -> None:
+        for value in values:
+            counts = self._counts(value)
+            counts[key] = counts.get(key, 0) + 1
+
+    def _remove_values(self, key, values: Iterable) -> None:
+        for value in values:
+            counts = self._counts(value)
+            count = counts.pop(key)
+            if count > 1:
+                counts[key] = count - 1
+            elif not counts:
+                del self._reverse[value]
+
+    def _update(self, update, key, values) -> None:
+        """
+        Applies the change of the values of a key. If the index does not match the dictionary
+        (for example, if the list was modified in place) or the values are not valid,
+        the index is rebuilt on the next lookup.
+        """
+        try:
+            update(key, values)
+        except (KeyError, TypeError):
+            self._stale = True
+
+    def _get_reverse(self) -> Dict[Any, List]:
+        if self._stale:
+            self._build()
+        return self._reverse
+
+    def _dict_changing(self, data: "SuperDict", key) -> None:
+        if self._writing or self._stale:
+            return
+        if key is None:
+            self._stale = True
+        elif key in data:
+            self._update(self._remove_values, key, data[key])
+
+    def _dict_changed(self, data: "SuperDict", key) -> None:
+        if self._writing or self._stale:
+            return
+        if key is None:
+            self._stale = True
+        elif key in data:
+            self._update(self._add_values, key, data[key])
+
+    def invalidate(self) -> None:
+        """
+        Marks the index to be rebuilt on the next lookup.
+        """
+        self._stale = True
+
+    def close(self) -> None:
+        """
+        Stops following the changes of the dictionary.
+        """
+        if self._sync:
+            self._data._unwatch(self)
+            self._sync = False
+
+    def add(self, key, value) -> None:
+        """
+        Appends `value` to the list of `key`, creating it if needed, and updates the index.
+
+        :param key: key of the dictionary
+        :param value: value to add to its list
+        """
+        values = self._data.get(key)
+        self._writing = True
+        try:
+            if values is None:
+                self._data[key] = TupList([value])
+            else:
+                values.append(value)
+        finally:
+            self._writing = False
+        if not self._stale:
+            self._update(self._add_values, key, [value])
+
+    def remove(self, key, value) -> None:
+        """
+        Removes the first `value` from the list of `key` and updates the index.
+
+        :param key: key of the dictionary
+        :param value: value to take out of its list
+        """
+        self._data[key].remove(value)
+        if not self._stale:
+            self._update(self._remove_values, key, [value])
+
+    @staticmethod
+    def _as_tuplist(keys: List | Dict[Any, int]) -> TupList:
+        if isinstance(keys, list):
+            return TupList(keys)
+        return TupList(chain.from_iterable(repeat(key, count) for key, count in keys.items()))
+
+    def get(self, value, default=None) -> TupList:
+        """
+        :param value: a value of the lists
+        :param default: what to return if no list has the value. An empty TupList by default.
+        :return: new :py:class:`pytups.tuplist.TupList` with the keys whose list has the value
+        """
+        keys = self._get_reverse().get(value)
+        if keys is None:
+            return TupList() if default is None else default
+        return self._as_tuplist(keys)
+
+    def __getitem__(self, value) -> TupList:
+        keys = self._get_reverse().get(value)
+        if keys is None:
+            raise KeyError(value)
+        return self._as_tuplist(keys)
+
+    def __contains__(self, value) -> bool:
+        return value in self._get_reverse()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._get_reverse())
+
+    def __len__(self) -> int:
+        return len(self._get_reverse())
+
+    def keys(self) -> Iterable:
+        """
+        :return: the distinct values of the lists
+        """
+        return self._get_reverse().keys()
+
+    def to_dict(self) -> "SuperDict":
+        """
+        Same as :py:meth:`pytups.superdict.SuperDict.list_reverse`.
+
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        return sd.SuperDict(
+            {value: self._as_tuplist(keys) for value, keys in self._get_reverse().items()}
+        )
+
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from itertools import chain, tee
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from .tuplist import (
+    TupList,
+    _as_cols,
+    _col_setter,
+    _group,
+    _iter_start_finish,
+    _iter_unique,
+    _item_getter,
+    _take_getter,
+    _to_dict_cols,
+    _write_csv,
+)
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+    from .groupby import GroupBy
+
+Step = Callable[[Iterator], Iterator]
+
+
+class LazyTupList:
+    """
+    A recipe of operations over a list of tuples (or dictionaries).
+
+    Each operation returns a new :py:class:`LazyTupList` with one more step.
+    Nothing is computed until the result is requested with :py:meth:`collect`,
+    :py:meth:`to_dict` or :py:meth:`to_csv`, and then all steps run in a single pass,
+    so no intermediate list is built.
+    """
+
+    def __init__(self, source: Iterable, steps: Tuple[Step, ...] = ()):
+        """
+        :param source: the elements. If it's an iterator, the result can only be requested once.
+        :param steps: functions that take an iterator and return another one
+        """
+        self._source = source
+        self._steps = steps
+
+    def _then(self, step: Step) -> "LazyTupList":
+        return LazyTupList(self._source, self._steps + (step,))
+
+    def __iter__(self) -> Iterator:
+        elements: Iterator = iter(self._source)
+        for step in self._steps:
+            elements = step(elements)
+        return elements
+
+    def __repr__(self) -> str:
+        return "LazyTupList({} steps)".format(len(self._steps))
+
+    def lazy(self) -> "LazyTupList":
+        return self
+
+    def vfilter(self, function: Callable) -> "LazyTupList":
+        """
+        keeps only the elements for which `function` returns True
+
+        :param callable function: function to apply to each element
+        :return: new :py:class:`LazyTupList`
+        """
+        return self._then(lambda elements: filter(function, elements))
+
+    def vapply(self, func: Callable, *args, **kwargs) -> "LazyTupList":
+        """
+        maps function into each element
+
+        :param callable func: function to apply
+        :return: new :py:class:`LazyTupList`
+        """
+        if args or kwargs:
+            return self._then(
+                lambda elements: (func(v, *args, **kwargs) for v in elements)
+            )
+        return self._then(lambda elements: map(func, elements))
+
+    def take(self, indices: Union[Iterable, int]) -> "LazyTupList":
+        """
+        keeps some positions of each tuple (or keys of each dict)
+
+        :param indices: a list of positions or a single position
+        :type indices: int or list
+        :return: new :py:class:`LazyTupList`
+        """
+        getter = _take_getter(indices)
+        return self._then(lambda elements: map(getter, elements))
+
+    def vapply_col(self, pos: Union[int, str, None], func: Callable) -> "LazyTupList":
+        """
+        Like vapply, but it stores the result in one of the positions of the tuple (or dictionary)
+
+        :param pos: int or str
+        :param callable func: function to apply to create col
+        :return: new :py:class:`LazyTupList`
+        """
+        setter = _col_setter(pos, func)
+        return self._then(lambda elements: map(setter, elements))
+
+    def chain(self) -> "LazyTupList":
+        """
+        Flattens the elements, like itertools chain
+        """
+        return self._then(chain.from_iterable)
+
+    def unique(self, cols: Union[Iterable, int, str, None] = None) -> "LazyTupList":
+        """
+        Keeps the first element of each distinct value, in the order they appear.
+
+        :param cols: positions (or keys) to compare. None to compare the whole element.
+        :return: new :py:class:`LazyTupList`
+        """
+        if cols is not None:
+            cols = _as_cols(cols)
+        return self._then(lambda elements: _iter_unique(elements, cols))
+
+    def to_start_finish(
+        self,
+        compare_tups: Callable | None = None,
+        pp: int = 1,
+        join_func: Callable | None = None,
+    ) -> "LazyTupList":
+        """
+        Joins consecutive elements as :py:meth:`pytups.tuplist.TupList.to_start_finish`,
+        one run at a time. The elements need to be sorted by id and period already.
+
+        :param callable compare_tups: returns True if tups are not consecutive. Takes 3 arguments
+        :param int pp: the position in the tuple where the period is
+        :param callable join_func: returns joined tuple from list of consecutive tuples. Takes 1 argument.
+        :return: new :py:class:`LazyTupList`
+        """
+        return self._then(
+            lambda elements: _iter_start_finish(elements, compare_tups, pp, join_func)
+        )
+
+    def group_by(self, cols: Union[Iterable, int, str]) -> "GroupBy":
+        """
+        Groups the elements to aggregate them while the steps run.
+
+        :param cols: a list of positions or a single position
+        :return: :py:class:`pytups.groupby.GroupBy`
+        """
+        from .groupby import GroupBy
+
+        return GroupBy(self, cols)
+
+    def collect(self) -> TupList:
+        """
+        Runs the steps.
+
+        :return: new :py:class:`pytups.tuplist.TupList`
+        """
+        return TupList(self)
+
+    def to_dict(
+        self,
+        result_col: Union[Iterable, int, None] = 0,
+        is_list: bool = True,
+        indices: Union[Iterable, int, None] = None,
+    ) -> "SuperDict":
+        """
+        Runs the steps and builds the dictionary as :py:meth:`pytups.tuplist.TupList.to_dict`,
+        without building the list first.
+
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        elements = iter(self)
+        for first in elements:
+            break
+        else:
+            return sd.SuperDict()
+        elements = chain([first], elements)
+        if isinstance(first, dict) and indices is None:
+            raise ValueError(
+                "For a list of dicts, to_dict require indices to be specified"
+            )
+        if result_col is None and indices is None:
+            return sd.SuperDict({k: k for k in elements})
+        result_col, indices = _to_dict_cols(len(first), result_col, indices)
+        for_keys, for_contents = tee(elements)
+        keys = map(_item_getter(indices), for_keys)
+        if result_col is None:
+            contents: Iterable = for_contents
+        else:
+            contents = map(_item_getter(result_col), for_contents)
+        return _group(keys, contents, is_list)
+
+    def to_csv(self, path: str, header: list | None = None) -> "LazyTupList":
+        """
+        Runs the steps and writes the elements to a csv file, one at a time.
+
+        :param path: filename
+        :param header: list of strings to use as header/column names for dict
+        :return: the same :py:class:`LazyTupList`
+        """
+        elements = iter(self)
+        for first in elements:
+            break
+        else:
+            return self
+        _write_csv(path, first, chain([first], elements), header)
+        return self
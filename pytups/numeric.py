@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import operator as op
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+
+class NumericSuperDict(Mapping):
+    """
+    A dictionary of numbers with fixed keys, stored as a list of keys and a numpy array of values.
+
+    Arithmetic with numbers or with another :py:class:`NumericSuperDict` over the same keys
+    is done in a single vectorized operation. The result shares the keys with the operands,
+    so chains of operations never touch the keys again.
+    Values of existing keys can be modified (a float in an array of ints turns it into floats);
+    adding or deleting keys is not possible.
+    """
+
+    def __init__(self, keys: List, values, pos: Dict[Any, int] | None = None):
+        """
+        :param list keys: the keys, in order
+        :param values: the values, in the same order, as a numpy array or any sequence of numbers
+        :param dict pos: position of each key. Built from `keys` if not given.
+        """
+        import numpy as np
+
+        values = np.asarray(values)
+        if values.ndim != 1 or len(values) != len(keys):
+            raise ValueError("There needs to be one value per key")
+        if values.dtype.kind not in "biuf":
+            raise TypeError("NumericSuperDict only stores numbers")
+        if pos is None:
+            pos = {k: i for i, k in enumerate(keys)}
+            if len(pos) != len(keys):
+                raise ValueError("Keys need to be unique")
+        self._keys = keys
+        self._pos = pos
+        self.values_array = values
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NumericSuperDict":
+        """
+        :param dict data: a dictionary with numbers as values
+        :return: new :py:class:`NumericSuperDict`
+        """
+        import numpy as np
+
+        return cls(list(data), np.array(list(data.values())))
+
+    def _new(self, values) -> "NumericSuperDict":
+        return NumericSuperDict(self._keys, values, self._pos)
+
+    def _aligned(self, other: dict):
+        """
+        Gets the values of `other` in the order of our keys.
+
+        :param dict other: a :py:class:`NumericSuperDict` or any dictionary with (at least) our keys
+        :return: :py:class:`numpy.ndarray`
+        """
+        import numpy as np
+
+        if isinstance(other, NumericSuperDict):
+            if other._pos is self._pos or other._keys == self._keys:
+                return other.values_array
+            return other.values_array[
+                np.fromiter(
+                    map(other._pos.__getitem__, self._keys),
+                    dtype=np.intp,
+                    count=len(self._keys),
+                )
+            ]
+        return np.array(list(map(other.__getitem__, self._keys)))
+
+    def _operate(self, func: Callable, other, reverse: bool = False) -> "NumericSuperDict":
+        if isinstance(other, Mapping):
+            other = self._aligned(other)
+        if reverse:
+            return self._new(func(other, self.values_array))
+        return self._new(func(self.values_array, other))
+
+    def __add__(self, other) -> "NumericSuperDict":
+        return self._operate(op.add, other)
+
+    def __radd__(self, other) -> "NumericSuperDict":
+        return self._operate(op.add, other, reverse=True)
+
+    def __sub__(self, other) -> "NumericSuperDict":
+        return self._operate(op.sub, other)
+
+    def __rsub__(self, other) -> "NumericSuperDict":
+        return self._operate(op.sub, other, reverse=True)
+
+    def __mul__(self, other) -> "NumericSuperDict":
+        return self._operate(op.mul, other)
+
+    def __rmul__(self, other) -> "NumericSuperDict":
+        return self._operate(op.mul, other, reverse=True)
+
+    def __truediv__(self, other) -> "NumericSuperDict":
+        return self._operate(op.truediv, other)
+
+    def __rtruediv__(self, other) -> "NumericSuperDict":
+        return self._operate(op.truediv, other, reverse=True)
+
+    def __floordiv__(self, other) -> "NumericSuperDict":
+        return self._operate(op.floordiv, other)
+
+    def __rfloordiv__(self, other) -> "NumericSuperDict":
+        return self._operate(op.floordiv, other, reverse=True)
+
+    def __neg__(self) -> "NumericSuperDict":
+        return self._new(-self.values_array)
+
+    def __getitem__(self, key):
+        return self.values_array[self._pos[key]].item()
+
+    def __setitem__(self, key, value) -> None:
+        import numpy as np
+
+        pos = self._pos[key]
+        values = self.values_array
+        try:
+            dtype = np.result_type(values, np.asarray(value))
+        except TypeError:
+            dtype = np.dtype(object)
+        if dtype.kind not in "biuf":
+            raise TypeError("NumericSuperDict only stores numbers")
+        if dtype != values.dtype:
+            # the value would be truncated
+            values = self.values_array = values.astype(dtype)
+        values[pos] = value
+
+    def __contains__(self, key) -> bool:
+        return key in self._pos
+
+    def __iter__(self) -> Iterator:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return "NumericSuperDict({})".format(dict(self.items()))
+
+    def items(self) -> Iterable:  # type: ignore[override]
+        return zip(self._keys, self.values_array.tolist())
+
+    def values_l(self) -> list:
+        """
+        :return: list with values
+        """
+        return self.values_array.tolist()
+
+    def keys_l(self) -> list:
+        """
+        :return: list with keys
+        """
+        return list(self._keys)
+
+    def vapply(self, func: Callable, *args, **kwargs) -> "NumericSuperDict":
+        """
+        Applies a vectorized function (for example, a numpy ufunc) to all the values at once.
+
+        :param callable func: function that takes and returns an array
+        :return: new :py:class:`NumericSuperDict`
+        """
+        return self._new(func(self.values_array, *args, **kwargs))
+
+    def sum(self):
+        """
+        :return: the sum of the values
+        """
+        return self.values_array.sum().item()
+
+    def copy(self) -> "NumericSuperDict":
+        """
+        :return: new :py:class:`NumericSuperDict` with a copy of the values
+        """
+        return self._new(self.values_array.copy())
+
+    def to_superdict(self) -> "SuperDict":
+        """
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        return sd.SuperDict(self.items())
+
+    def as_array(self) -> "NumericSuperDict":
+        return self
@@ -1,19 +1,317 @@
+from __future__ import annotations
+
 try:
-    from collections import MutableSequence
+    from collections import MutableSequence, Sequence
 except:
-    from collections.abc import MutableSequence
-from typing import Iterable, TypeVar, Generic, List, Dict
+    from collections.abc import MutableSequence, Sequence
+import datetime
+import sys
+from abc import ABC, abstractmethod
+from itertools import islice, repeat
+from typing import Any, Callable, Iterable, Iterator, Tuple, TypeVar, Generic, List, Dict
+
+from .tools import copy_deep
 
 T = TypeVar("T")
 
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+# numpy kinds that can be compared with each other
+_KIND_GROUP = {"b": "b", "i": "n", "u": "n", "f": "n", "M": "M", "U": "U"}
+
+
+def _as_array(values: Iterable, ints: bool = False):
+    """
+    :param bool ints: only accept integers
+    :return: values as a one dimensional numpy array of numbers, dates or strings, or None
+    """
+    import numpy as np
+
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+        kinds = set(map(type, values))
+        if ints and not kinds <= {int}:
+            return None
+        if len(kinds) > 1 and not kinds <= {int, float}:
+            # numpy would turn them all into strings
+            return None
+        if values and isinstance(values[0], tuple):
+            return None
+        if values and isinstance(values[0], (datetime.date, np.datetime64)):
+            try:
+                values = np.array(values, dtype="datetime64[us]")
+            except (TypeError, ValueError):
+                return None
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        # different lengths
+        return None
+    if array.ndim != 1 or (len(array) and array.dtype.kind not in "biufMU"):
+        return None
+    return array
+
+
+def _array_lookup(elements) -> Callable:
+    """
+    :param elements: numpy array with unique elements
+    :return: function that takes a numpy array and returns the positions of its values
+        in `elements` and which ones are there. Or None if the arrays can't be compared.
+    """
+    import numpy as np
+
+    kind = elements.dtype.kind
+    size = len(elements)
+    if kind in "iu" and size and int(elements.max()) - int(elements.min()) < 4 * size:
+        # close integers: a table with the position of each number
+        low = int(elements.min())
+        table = np.full(int(elements.max()) - low + 1, -1, dtype=np.intp)
+        table[elements - low] = np.arange(size)
+
+        def lookup(query):
+            if len(query) and query.dtype.kind not in "iu":
+                return None
+            shifted = query.astype(np.int64) - low
+            inside = (shifted >= 0) & (shifted < len(table))
+            positions = table[np.where(inside, shifted, 0)]
+            return positions, inside & (positions >= 0)
+
+        return lookup
+
+    # any other case: binary search
+    order = np.argsort(elements, kind="stable")
+    sorted_elements = elements[order]
+    group = _KIND_GROUP.get(kind)
+
+    def lookup(query):
+        if len(query) and _KIND_GROUP.get(query.dtype.kind) != group:
+            return None
+        if not size:
+            return np.zeros(len(query), dtype=np.intp), np.zeros(len(query), dtype=bool)
+        found = np.searchsorted(sorted_elements, query)
+        np.minimum(found, size - 1, out=found)
+        return order[found], sorted_elements[found] == query
+
+    return lookup
+
+
+def _as_sequence(values: Iterable):
+    import numpy as np
+
+    if isinstance(values, (list, tuple, np.ndarray)):
+        return values
+    return list(values)
+
+
+def _check_how(how: str, options: tuple) -> None:
+    if how not in options:
+        raise ValueError("how needs to be one of {}, not {!r}".format(options, how))
+
+
+class _Lookups(ABC, Generic[T]):
+    """
+    The searches by element shared by :py:class:`OrderSet` and :py:class:`RangeOrderSet`.
+    They need `_pos` (the elements), `_position` and `_ord_many`.
+    """
+
+    _pos: Sequence
+    # numpy arrays for the batched lookups, built with _get_arrays
+    _arrays: Tuple | None = None
+
+    @abstractmethod
+    def _position(self, value: T) -> int:
+        """
+        :return: the position of the element. KeyError if it's not in the set
+        """
+
+    @abstractmethod
+    def _ord_many(self, values) -> Tuple[Any, Any]:
+        """
+        :param values: list, tuple or numpy array
+        :return: two numpy arrays: the positions of the values and which ones are in the set
+        """
+
+    def index(self, value: T, start: int = 0, stop: int | None = None) -> int:
+        try:
+            pos = self._position(value)
+        except (KeyError, TypeError):
+            raise ValueError("{} is not in the set".format(value)) from None
+        size = len(self._pos)
+        start = max(start + size, 0) if start < 0 else start
+        stop = size if stop is None else (max(stop + size, 0) if stop < 0 else stop)
+        if not start <= pos < stop:
+            raise ValueError("{} is not in the set".format(value))
+        return pos
+
+    def ord(self, value: T) -> int:
+        """
+
+        :param value: element in the set
+        :return: the position of the element in the set
+        """
+        try:
+            return self._position(value)
+        except KeyError as e:
+            raise MissingValue("value {} does not exist".format(value)) from e
+
+    def next(self, value: T, num: int = 1) -> T:
+        """
+
+        :param value: element in set
+        :param num: number of elements to offset
+        :return: next element in the list
+        """
+        return self[self.ord(value) + num]
+
+    def prev(self, value: T, num: int = 1) -> T:
+        """
+
+        :param value: element in set
+        :param num: number of elements to offset backwards
+        :return: previous element in the list
+        """
+        return self[self.ord(value) - num]
+
+    def dist(self, value1, value2) -> int:
+        """
+
+        :param value1: element in set
+        :param value2: element in set
+        :return: difference in position between the two elements
+        """
+        return self.ord(value2) - self.ord(value1)
+
+    def between(self, value1: T, value2: T) -> "OrderSetRange[T]":
+        """
+
+        :param value1: element in set
+        :param value2: element in set
+        :return: view of the elements between value1 and value2, both inclusive
+        """
+        return OrderSetRange(self, range(self.ord(value1), self.ord(value2) + 1))
+
+    def slice_by_value(self, value1: T | None = None, value2: T | None = None) -> "OrderSetRange[T]":
+        """
+        Same as slicing the set, but with elements instead of positions.
 
-class OrderSet(MutableSequence, Generic[T]):
+        :param value1: first element. By default, the first in the set.
+        :param value2: element after the last one. By default, until the end.
+        :return: view of the elements from value1 to value2, value2 not included
+        """
+        start = 0 if value1 is None else self.ord(value1)
+        stop = len(self) if value2 is None else self.ord(value2)
+        return OrderSetRange(self, range(start, stop))
+
+    def _get_arrays(self) -> Tuple:
+        """
+        :return: the elements as a numpy array and a function that finds
+            the positions of a numpy array of elements, if numpy can do it.
+            Kept until the set is modified.
+        """
+        if self._arrays is None:
+            import numpy as np
+
+            elements = _as_array(self._pos)
+            if elements is None:
+                elements = np.empty(len(self._pos), dtype=object)
+                elements[:] = self._pos
+                self._arrays = elements, None
+            else:
+                self._arrays = elements, _array_lookup(elements)
+        return self._arrays
+
+    def ord_many(self, values: Iterable, how: str = "raise", fill_value: int = -1):
+        """
+        Same as :py:meth:`ord` for many elements at once.
+        A numpy array of numbers, dates or strings is searched with numpy, as is a list of ints.
+        Other values are searched one at a time, which is faster than converting them.
+
+        :param values: iterable or numpy array with elements
+        :param str how: what to do with the values not in the set. "raise": raise a
+            :py:class:`MissingValue`. "fill": use `fill_value` as position.
+        :param int fill_value: position of the values not in the set, with how="fill"
+        :return: numpy array with the positions
+        """
+        import numpy as np
+
+        _check_how(how, ("raise", "fill"))
+        values = _as_sequence(values)
+        positions, found = self._ord_many(values)
+        if found.all():
+            return positions
+        if how == "raise":
+            missing = values[int(np.argmin(found))]
+            raise MissingValue("value {} does not exist".format(missing))
+        return np.where(found, positions, fill_value)
+
+    def _offset_many(self, values: Iterable, num, how: str, fill_value):
+        import numpy as np
+
+        _check_how(how, ("raise", "clip", "fill"))
+        values = _as_sequence(values)
+        elements = self._get_arrays()[0]
+        positions, found = self._ord_many(values)
+        if how != "fill" and not found.all():
+            missing = values[int(np.argmin(found))]
+            raise MissingValue("value {} does not exist".format(missing))
+        positions = positions + num
+        size = len(elements)
+        if how == "clip":
+            return elements[np.clip(positions, 0, size - 1)]
+        outside = (positions < 0) | (positions >= size) | ~found
+        if not outside.any():
+            return elements[positions]
+        if how == "raise":
+            raise IndexError("some positions are out of the set")
+        if not size:
+            return np.full(len(positions), fill_value)
+        result = elements[np.where(outside, 0, positions)]
+        return np.where(outside, fill_value, result)
+
+    def next_many(self, values: Iterable, num=1, how: str = "raise", fill_value=None):
+        """
+        Same as :py:meth:`next` for many elements at once.
+
+        :param values: iterable or numpy array with elements
+        :param num: number of elements to offset. An int or a numpy array, one per value.
+        :param str how: what to do when there is no next element. "raise": raise an IndexError.
+            "clip": use the last element. "fill": use `fill_value`, also for the values not in the set.
+            Values not in the set raise a :py:class:`MissingValue` otherwise.
+        :param fill_value: element to use, with how="fill"
+        :return: numpy array with the next elements. Dates are numpy datetime64.
+        """
+        return self._offset_many(values, num, how, fill_value)
+
+    def prev_many(self, values: Iterable, num=1, how: str = "raise", fill_value=None):
+        """
+        Same as :py:meth:`prev` for many elements at once.
+
+        :param values: iterable or numpy array with elements
+        :param num: number of elements to offset backwards. An int or a numpy array, one per value.
+        :param str how: what to do when there is no previous element. "raise": raise an IndexError.
+            "clip": use the first element. "fill": use `fill_value`, also for the values not in the set.
+            Values not in the set raise a :py:class:`MissingValue` otherwise.
+        :param fill_value: element to use, with how="fill"
+        :return: numpy array with the previous elements. Dates are numpy datetime64.
+        """
+        return self._offset_many(values, -num, how, fill_value)
+
+
+class OrderSet(_Lookups[T], MutableSequence):
     """
     An ordered set of elements.
+
+    Inserting or deleting in the middle does not renumber the elements that move:
+    the positions after the change are fixed on the next lookup that needs them.
+    Until then, an element is searched for a few positions around its old one.
+    When there are too many pending changes, all the moved positions are fixed at once.
     """
 
     _store: Dict[T, int]
     _pos: List[T]
+    # positions in _store before this one are correct
+    _valid: int = sys.maxsize
+    # number of shifts since the positions were last fixed
+    _shifts: int = 0
 
     def __init__(self, _list: List[T]):
         # _pos is the real list
@@ -32,18 +330,86 @@ class OrderSet(MutableSequence, Generic[T]):
         return self._pos[key]
 
     def __setitem__(self, key: int, value: T) -> None:
-        prev_value = self[key]
+        prev_value = self._pos[key]
+        if value in self._store and value != prev_value:
+            raise ValueError("value {} is already in the set".format(value))
+        if key < 0:
+            key += len(self._pos)
         self._store.pop(prev_value)
         self._store[value] = key
         self._pos[key] = value
+        self._arrays = None
 
-    def __delitem__(self, key: int):
-        del self._store[self[key]]
-        if key != -1:
-            rest = self._pos[key + 1 :]
-            for item in rest:
-                self._store[item] -= 1
+    def __delitem__(self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._pos))
+            removed = self._pos[key]
+            if not removed:
+                return
+            first = start if step > 0 else start + step * (len(removed) - 1)
+        else:
+            removed = [self._pos[key]]
+            first = key if key >= 0 else key + len(self._pos)
+        for value in removed:
+            del self._store[value]
         del self._pos[key]
+        self._arrays = None
+        if first < len(self._pos):
+            self._shifted(first, len(removed))
+
+    def insert(self, key: int, value: T) -> None:
+        if value in self._store:
+            raise ValueError("value {} is already in the set".format(value))
+        size = len(self._pos)
+        # same positions as list.insert
+        if key < 0:
+            key = max(key + size, 0)
+        key = min(key, size)
+        self._pos.insert(key, value)
+        self._store[value] = key
+        self._arrays = None
+        if key < size:
+            self._shifted(key, 1)
+
+    def _shifted(self, position: int, num: int) -> None:
+        """
+        Takes note that the elements that were in `position` and after moved up to `num` places.
+        """
+        self._valid = min(self._valid, position)
+        self._shifts += num
+
+    def _renumber(self) -> None:
+        """
+        Fixes the positions of all the elements that moved.
+        """
+        # the elements that moved back may now be before self._valid
+        valid = max(self._valid - self._shifts, 0)
+        self._store.update(
+            zip(islice(self._pos, valid, None), range(valid, len(self._pos)))
+        )
+        self._valid = sys.maxsize
+        self._shifts = 0
+
+    def _position(self, value: T) -> int:
+        """
+        :return: the position of the element. KeyError if it's not in the set
+        """
+        pos = self._store[value]
+        if pos < self._valid:
+            return pos
+        shifts = self._shifts
+        # searching costs up to 2 * shifts comparisons, fixing the positions costs len(self)
+        if shifts * shifts > len(self._pos):
+            self._renumber()
+            return self._store[value]
+        # each shift moved the element one place at most
+        return self._pos.index(value, max(pos - shifts, 0), pos + shifts + 1)
+
+    def __contains__(self, value) -> bool:
+        try:
+            return value in self._store
+        except TypeError:
+            return False
 
     def __iter__(self) -> Iterable:
         return iter(self._pos)
@@ -54,81 +420,370 @@ class OrderSet(MutableSequence, Generic[T]):
     def __repr__(self) -> str:
         return repr(self._pos)
 
-    def insert(self, key: int, value: T) -> None:
-        self._store[value] = len(self)
-        self._pos.append(value)
+    def copy(self) -> "OrderSet[T]":
+        """
+        Copies the set. The elements are shared: :py:func:`copy.deepcopy` copies them too.
 
-    def ord(self, value: T) -> int:
+        :return: new :py:class:`OrderSet`
         """
+        new = self.__class__.__new__(self.__class__)
+        new._pos = list(self._pos)
+        new._store = dict(self._store)
+        new._valid = self._valid
+        new._shifts = self._shifts
+        return new
 
-        :param value: element in the set
-        :return: the position of the element in the set
+    def __copy__(self) -> "OrderSet[T]":
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> "OrderSet[T]":
+        # the elements are copied too: hashable does not mean they can't be modified
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new._pos = copy_deep(self._pos, memo)
+        new._store = dict(zip(new._pos, range(len(new._pos))))
+        return new
+
+    def _ord_many(self, values) -> Tuple[Any, Any]:
+        """
+        :param values: list, tuple or numpy array
+        :return: two numpy arrays: the positions of the values and which ones are in the set
         """
+        import numpy as np
+
+        lookup = self._get_arrays()[1]
+        if lookup is not None:
+            query = values if isinstance(values, np.ndarray) else _as_array(values, ints=True)
+            result = None if query is None else lookup(query)
+            if result is not None:
+                return result
+        # one dictionary lookup each: faster than numpy for python objects
+        # (floats, dates and strings included), as converting them costs more
+        if self._valid != sys.maxsize:
+            self._renumber()
         try:
-            return self._store[value]
-        except KeyError as e:
-            raise MissingValue("value {} does not exist".format(value)) from e
+            positions = np.fromiter(
+                map(self._store.get, values, repeat(-1)), dtype=np.intp, count=len(values)
+            )
+        except TypeError:
+            # some values are not hashable
+            positions = np.fromiter(
+                map(self._position_or_missing, values), dtype=np.intp, count=len(values)
+            )
+        return positions, positions >= 0
 
-    def next(self, value: T, num: int = 1) -> T:
-        """
+    def _position_or_missing(self, value: T) -> int:
+        try:
+            return self._store.get(value, -1)
+        except TypeError:
+            return -1
 
-        :param value: element in set
-        :param num: number of elements to offset
-        :return: next element in the list
+    def splice(self, start: int, delete_count: int | None = None, *items: T) -> List[T]:
         """
-        return self[self.ord(value) + num]
+        Removes some consecutive elements and/or inserts new ones in their place,
+        as javascript's `Array.prototype.splice`.
+        Only the inserted items are checked: they need to be unique and not in the set,
+        unless they are among the removed ones.
 
-    def prev(self, value: T, num: int = 1) -> T:
+        :param int start: position of the first element to remove
+        :param int delete_count: number of elements to remove. By default, until the end.
+        :param items: elements to insert at `start`
+        :return: list with the removed elements
         """
+        size = len(self._pos)
+        if start < 0:
+            start = max(start + size, 0)
+        start = min(start, size)
+        if delete_count is None:
+            delete_count = size - start
+        stop = start + min(max(delete_count, 0), size - start)
+        try:
+            new_values = dict.fromkeys(items)
+        except TypeError as e:
+            raise TypeError("values in list need to be hashable") from e
+        if len(new_values) < len(items):
+            raise ValueError("The list needs to have unique values.")
+        removed = self._pos[start:stop]
+        store = self._store
+        repeated = [value for value in new_values if value in store]
+        if repeated:
+            removed_values = set(removed)
+            repeated = [value for value in repeated if value not in removed_values]
+            if repeated:
+                raise ValueError("values {} are already in the set".format(repeated))
+        for value in removed:
+            del store[value]
+        self._pos[start:stop] = items
+        self._arrays = None
+        store.update(zip(items, range(start, start + len(items))))
+        moved = len(items) - len(removed)
+        if moved and stop < size:
+            self._shifted(stop, abs(moved))
+        return removed
 
-        :param value: element in set
-        :param num: number of elements to offset backwards
-        :return: previous element in the list
+
+class _Progression(Sequence):
+    """
+    The elements of a :py:class:`RangeOrderSet`: start, start + step, start + 2 * step...
+    Slices are lists, as in :py:class:`OrderSet`.
+    """
+
+    def __init__(self, start, step, length: int):
+        self.start = start
+        self.step = step
+        self._range = range(length)
+
+    def __getitem__(self, key: int | slice):
+        start, step = self.start, self.step
+        if isinstance(key, slice):
+            return [start + i * step for i in self._range[key]]
+        return start + self._range[key] * step
+
+    def __iter__(self) -> Iterator:
+        start, step = self.start, self.step
+        if isinstance(start, int) and isinstance(step, int):
+            return iter(range(start, start + step * len(self._range), step))
+        return (start + i * step for i in self._range)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class RangeOrderSet(_Lookups[T], Sequence):
+    """
+    A read-only ordered set of evenly spaced elements: consecutive integers, dates every day...
+    Only the first element, the step and the length are stored, and
+    the positions are calculated, so :py:meth:`ord`, :py:meth:`next`,
+    :py:meth:`prev`, :py:meth:`dist` and :py:meth:`between` do not need
+    to search.
+
+    It has the same lookups as an :py:class:`OrderSet` but it's not one, as it can't be modified:
+    :py:meth:`to_orderset` returns a regular :py:class:`OrderSet`.
+
+    >>> periods = RangeOrderSet(0, 10, step=2)
+    >>> periods.ord(6), periods.next(6), periods[-1]
+    (3, 8, 18)
+    """
+
+    def __init__(self, start: T, length: int, step=1):
         """
-        return self[self.ord(value) - num]
+        :param start: first element
+        :param int length: number of elements
+        :param step: difference between two consecutive elements:
+            an int, or a timedelta for dates.
+        """
+        if length < 0:
+            raise ValueError("length can't be negative")
+        if not step:
+            raise ValueError("step can't be zero")
+        if isinstance(step, float):
+            # start + i * step would not give back i with divmod
+            raise TypeError("step needs to be exact, such as an int or a timedelta, not a float")
+        self.start = start
+        self.step = step
+        self._length = length
+        self._indices = range(length)
+        self._pos = _Progression(start, step, length)  # type: ignore[assignment]
 
-    def dist(self, value1, value2) -> int:
+    @classmethod
+    def from_range(cls, _range: range) -> "RangeOrderSet[int]":
         """
+        :param range _range: a range of integers
+        :return: new :py:class:`RangeOrderSet`
+        """
+        return cls(_range.start, len(_range), _range.step)
 
-        :param value1: element in set
-        :param value2: element in set
-        :return: difference in position between the two elements
+    def __repr__(self) -> str:
+        return "RangeOrderSet(start={!r}, length={}, step={!r})".format(
+            self.start, len(self), self.step
+        )
+
+    def __getitem__(self, key: int | slice):
+        if isinstance(key, slice):
+            return self._pos[key]
+        return self.start + self._indices[key] * self.step
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._pos)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _position(self, value: T) -> int:
+        try:
+            position, rest = divmod(value - self.start, self.step)  # type: ignore[operator]
+        except (TypeError, OverflowError):
+            raise KeyError(value) from None
+        if rest or not 0 <= position < self._length:
+            raise KeyError(value)
+        return int(position)
+
+    def __contains__(self, value) -> bool:
+        try:
+            self._position(value)
+        except KeyError:
+            return False
+        return True
+
+    def _get_arrays(self) -> Tuple:
+        if self._arrays is None:
+            import numpy as np
+
+            start, step = self._numpy_start_step()
+            if start is None:
+                return super()._get_arrays()
+            # lookups are calculated with _ord_many
+            self._arrays = np.arange(self._length) * step + start, None
+        return self._arrays
+
+    def _numpy_start_step(self) -> Tuple:
         """
-        return self.ord(value2) - self.ord(value1)
+        :return: start and step that numpy can use, or None, None
+        """
+        import numpy as np
+
+        start, step = self.start, self.step
+        if isinstance(start, int) and isinstance(step, int):
+            last = start + step * max(self._length - 1, 0)
+            if not _INT64_MIN <= min(start, last) <= max(start, last) <= _INT64_MAX:
+                return None, None
+            return start, step
+        if isinstance(start, datetime.date) and isinstance(step, datetime.timedelta):
+            return np.datetime64(start, "us"), np.timedelta64(step, "us")
+        return None, None
+
+    def _ord_many(self, values) -> Tuple[Any, Any]:
+        import numpy as np
+
+        start, step = self._numpy_start_step()
+        query = values if isinstance(values, np.ndarray) else _as_array(values)
+        if start is not None and query is not None:
+            kind = "iu" if isinstance(step, int) else "M"
+            if len(query) and kind == "iu" and query.dtype.kind in kind:
+                # query - start must fit in an int64
+                low, high = int(query.min()) - start, int(query.max()) - start
+                if not _INT64_MIN <= low <= high <= _INT64_MAX:
+                    kind = ""
+                else:
+                    query = query.astype(np.int64, copy=False)
+            if not len(query) or query.dtype.kind in kind:
+                positions, rest = np.divmod(query - start, step)
+                found = (rest == 0) & (positions >= 0) & (positions < self._length)
+                return positions.astype(np.intp), found
+        if isinstance(values, np.ndarray):
+            # python numbers do not overflow
+            values = values.tolist()
+        positions = np.fromiter(
+            map(self._position_or_missing, values), dtype=np.intp, count=len(values)
+        )
+        return positions, positions >= 0
+
+    def _position_or_missing(self, value: T) -> int:
+        try:
+            return self._position(value)
+        except KeyError:
+            return -1
+
+    def __copy__(self) -> "RangeOrderSet[T]":
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> "RangeOrderSet[T]":
+        new = self.__class__(copy_deep(self.start, memo), len(self), copy_deep(self.step, memo))
+        memo[id(self)] = new
+        return new
 
-    def between(self, value1: T, value2: T) -> List[T]:
+    def copy(self) -> "RangeOrderSet[T]":
         """
+        :return: new :py:class:`RangeOrderSet`
+        """
+        return self.__class__(self.start, len(self), self.step)
 
-        :param value1: element in set
-        :param value2: element in set
-        :return: elements between value1 and value2, both inclusive
+    def to_orderset(self) -> OrderSet[T]:
+        """
+        :return: new :py:class:`OrderSet` with the same elements, that can be modified
         """
-        return [self[i] for i in range(self.ord(value1), self.ord(value2) + 1)]
+        new = OrderSet.__new__(OrderSet)
+        new._pos = list(self._pos)
+        new._store = dict(zip(new._pos, range(len(new._pos))))
+        return new
+
+
+class OrderSetRange(Sequence, Generic[T]):
+    """
+    Some consecutive elements of an :py:class:`OrderSet`, without copying them.
 
-    def splice(self, start, delete_count, *items) -> List:
-        """Remove existing elements and/or add new elements to a list.
-        this function was taken from: https://gist.github.com/jonbeebe/44a529fcf15d6bda118fe3cfa434edf3
-        target        the target list (will be changed)
-        start         index of starting position
-        delete_count  number of items to remove (default: len(target) - start)
-        *items        items to insert at start index
-        Returns a new list of removed items (or an empty list)
+    It keeps the positions of the elements: if the set is modified, the view shows
+    whatever is in those positions.
+    """
+
+    def __init__(self, order_set: OrderSet[T], positions: range):
         """
-        raise NotImplementedError()
-        if delete_count is None:
-            delete_count = len(self._pos) - start
+        :param order_set: the set
+        :param range positions: the positions of the elements
+        """
+        self._set = order_set
+        self._range = positions
 
-        # store removed range in a separate list and replace with *items
-        total = start + delete_count
-        removed = self._pos[start:total]
-        self._pos[start:total] = items
+    def __getitem__(self, key: int | slice):
+        if isinstance(key, slice):
+            return OrderSetRange(self._set, self._range[key])
+        return self._set._pos[self._range[key]]
 
-        # TODO: we still need to edit self._store with inserts and removes
-        # for i in removed:
-        #     self._store
-        return removed
+    def __iter__(self) -> Iterator[T]:
+        return map(self._set._pos.__getitem__, self._range)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __contains__(self, value) -> bool:
+        try:
+            return self._set.index(value) in self._range
+        except ValueError:
+            return False
+
+    def index(self, value: T, start: int = 0, stop: int | None = None) -> int:
+        try:
+            position = self._range.index(self._set.index(value))
+        except ValueError:
+            raise ValueError("{} is not in the range".format(value)) from None
+        size = len(self._range)
+        start = max(start + size, 0) if start < 0 else start
+        stop = size if stop is None else (max(stop + size, 0) if stop < 0 else stop)
+        if not start <= position < stop:
+            raise ValueError("{} is not in the range".format(value))
+        return position
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, OrderSetRange)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def to_list(self) -> List[T]:
+        """
+        :return: new list with the elements
+        """
+        pos = self._set._pos
+        step = self._range.step
+        if step == 1:
+            return pos[self._range.start : self._range.stop]
+        return list(self)
+
+    def positions(self, use_numpy: bool = False):
+        """
+        :param bool use_numpy: return a numpy array instead of a range
+        :return: the positions of the elements in the set
+        """
+        if not use_numpy:
+            return self._range
+        import numpy as np
 
-        pass
+        return np.arange(self._range.start, self._range.stop, self._range.step)
 
 
 class MissingValue(Exception):
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from . import tools
 import operator as op
-import pickle
+from functools import partial
 from typing import (
     Callable,
     Iterable,
@@ -22,18 +22,187 @@ import json
 
 if TYPE_CHECKING:
     from .tuplist import TupList
+    from .numeric import NumericSuperDict
+    from .views import SuperDictView
+    from .accessor import PathAccessor
+    from .inverted import InvertedIndex
+    from .default import DefaultSuperDict
 
 K = TypeVar("K")
 V = TypeVar("V")
 T = TypeVar("T")
 R = TypeVar("R")
 
+# default of fill_value: missing keys raise a KeyError
+_NO_FILL: Any = object()
+
+
+def _apply_rest(func: Callable, args: tuple, kwargs: dict, value, other_value):
+    return func(value, other_value, *args, **kwargs)
+
+
+def _check_keys(data: dict, other: dict) -> None:
+    """
+    Raises a KeyError with the first key of `data` that is not in `other`.
+    """
+    if not all(map(other.__contains__, data)):
+        raise KeyError(next(k for k in data if k not in other))
+
+
+def _aligned_keys(data: dict, other: dict, how: str) -> Iterable:
+    """
+    Gets the keys of a binary operation between two dictionaries.
+
+    :param str how: left, inner or outer
+    :return: the keys, in order: first the ones in `data`.
+    """
+    if how == "left":
+        return list(data)
+    if how == "inner":
+        return [k for k in data if k in other]
+    if how == "outer":
+        return list(data) + [k for k in other if k not in data]
+    raise ValueError("how needs to be one of: left, inner, outer. Got: {}".format(how))
+
+
+def _group_items(triples: Iterable[tuple], new: Callable) -> dict:
+    """
+    Groups the elements of a dictionary.
+
+    :param triples: for each element: the group, the key and the value
+    :param callable new: the class of the new dictionaries
+    :return: new dictionary with a dictionary for each group
+    """
+    groups: dict = {}
+    for group, k, v in triples:
+        if isinstance(v, dict):
+            v = new.from_dict(v)
+        content = groups.get(group)
+        if content is None:
+            content = groups[group] = new()
+        content[k] = v
+    return new(groups)
+
+
+def _group_by_parts(data: dict, positions: list) -> dict:
+    """
+    Groups the elements of a dictionary by several positions of their keys, in one pass.
+
+    :param dict data: dictionary with tuple keys
+    :param list positions: positions in the keys
+    :return: new dictionary with a :py:class:`SuperDict` of groups for each position
+    """
+    groups: dict = {pos: {} for pos in positions}
+    if not positions:
+        return groups
+    for k, v in data.items():
+        if isinstance(v, dict):
+            v = SuperDict.from_dict(v)
+        for pos, by_part in groups.items():
+            content = by_part.get(k[pos])
+            if content is None:
+                content = by_part[k[pos]] = SuperDict()
+            content[k] = v
+    return {pos: SuperDict(by_part) for pos, by_part in groups.items()}
+
+
+def _to_nested(data: dict, new: Callable) -> dict:
+    """
+    Expands tuple keys to nested dictionaries, in one pass over all the (nested) keys.
+    Nested dictionaries are converted before storing them, as if it was done recursively.
+
+    :param dict data: the dictionary to expand
+    :param callable new: the class of the new dictionaries
+    :return: new (nested) dictionary
+    """
+    result = new()
+    # the dictionaries we are going through, with the key to store each one in its parent
+    stack = [(iter(data.items()), result)]
+    pending: list = []
+    while stack:
+        items, target = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                pending.append(key)
+                stack.append((iter(value.items()), new()))
+                break
+            _set_nested(target, key, value, new)
+        else:
+            stack.pop()
+            if pending:
+                _set_nested(stack[-1][1], pending.pop(), target, new)
+    return result
+
+
+def _iter_flat(data: dict, max_depth: int | None = None) -> Iterator[Tuple[tuple, Any]]:
+    """
+    Yields the path of keys to each value of nested dictionaries, in the same order
+    as going through them recursively.
+
+    :param dict data: a (possibly nested) dictionary
+    :param int max_depth: maximum number of keys in the path. None to go to the end.
+    :return: an iterator of (tuple of keys, value)
+    """
+    # for each dictionary we are going through: the keys to reach it
+    stack: list = [((), iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        go_deeper = max_depth is None or len(prefix) + 1 < max_depth
+        for key, value in items:
+            if go_deeper and isinstance(value, dict):
+                stack.append((prefix + (key,), iter(value.items())))
+                break
+            yield prefix + (key,), value
+        else:
+            stack.pop()
+
+
+def _set_nested(target: dict, key, value, new: Callable) -> None:
+    """
+    Same as :py:meth:`SuperDict.set_m`, with a tuple key.
+    A key that is not a tuple is used as it is.
+    """
+    if not isinstance(key, tuple):
+        target[key] = value
+        return
+    node = target
+    for pos in range(len(key) - 1):
+        child = node.get(key[pos])
+        if not isinstance(child, new):
+            child = node[key[pos]] = new()
+        node = child
+    node[key[-1]] = value
+
+
+def _iter_tuplist(items: Iterable[tuple]) -> Iterator[tuple]:
+    """
+    The rows of :py:meth:`SuperDict.to_tuplist`, from the key-value pairs.
+    """
+    for key, value in items:
+        if not isinstance(value, list):
+            value = [value]
+        if not isinstance(key, tuple):
+            key = [key]
+        else:
+            key = list(key)
+        # now we assume key is a list and value is a list of values.
+        for val in value:
+            if isinstance(val, tuple):
+                val = list(val)
+            else:
+                val = [val]
+            # we also assume val is a list
+            yield tuple(key + val)
+
 
 class SuperDict(dict, Generic[K, V], Mapping[K, V]):
     """
     A dictionary with additional methods
     """
 
+    # indexes kept until the dictionary is modified. Only in TrackedSuperDict.
+    _index_cache: dict | None = None
+
     def __getitem__(self, key: K) -> V:
         return dict.__getitem__(self, key)
 
@@ -84,6 +253,38 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         """
         return self.sapply(op.__floordiv__, other)
 
+    def __iadd__(self, other: Union[dict, int, float, str]) -> "SuperDict":
+        """
+        Adds another object to the values in the SuperDict, without creating a new one.
+        """
+        return self.sapply_inplace(op.__add__, other)
+
+    def __isub__(self, other: Union[dict, int, float, str]) -> "SuperDict":
+        """
+        Substracts another object to the values in the SuperDict, without creating a new one.
+        """
+        return self.sapply_inplace(op.__sub__, other)
+
+    def __imul__(self, other: Union[dict, int, float, str]) -> "SuperDict":
+        """
+        Multiplies the values in the SuperDict by another object, without creating a new one.
+        """
+        return self.sapply_inplace(op.__mul__, other)
+
+    def as_array(self) -> "NumericSuperDict":
+        """
+        Stores the values in a numpy array, for fast arithmetic.
+        All values need to be numbers.
+
+        >>> (SuperDict({'a': 1, 'b': 2}).as_array() * 2).to_superdict()
+        {'a': 2, 'b': 4}
+
+        :return: new :py:class:`pytups.numeric.NumericSuperDict`
+        """
+        from .numeric import NumericSuperDict
+
+        return NumericSuperDict.from_dict(self)
+
     def head(self) -> str:
         """
         Returns a string representation with the first pair of key values in the SuperDict, the last pair of key value
@@ -299,6 +500,20 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
             {key: value for key, value in self.items() if func(key, value, **kwargs)}
         )
 
+    def view(self) -> "SuperDictView":
+        """
+        Starts a lazy chain of filters over the dictionary: filter, vfilter, kfilter, kvfilter and clean.
+        Nothing is copied until :py:meth:`pytups.views.SuperDictView.collect` is called.
+
+        >>> SuperDict({'a': 2, 'b': 3, 'c': 1}).view().vfilter(lambda v: v > 1).kfilter(lambda k: k > 'a').collect()
+        {'b': 3}
+
+        :return: new :py:class:`pytups.views.SuperDictView`
+        """
+        from .views import SuperDictView
+
+        return SuperDictView(self)
+
     def len(self) -> int:
         """
         Shortcut to:
@@ -338,7 +553,8 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
     def to_dictdict(self) -> "SuperDict":
         """
         Expands tuple keys to nested dictionaries
-        Useful to get json-compatible objects from the solution
+        Useful to get json-compatible objects from the solution.
+        The dictionary is not modified.
 
         :return: new (nested) :py:class:`SuperDict`
 
@@ -346,19 +562,18 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         {'a': {'b': 1}, 'b': {'c': 0}, 'c': 1}
 
         """
-        dictdict = SuperDict()
-        for key in self:
-            # TODO: checking all the time for isinstance is inneficient
-            if isinstance(self[key], dict):
-                # if it's a nested dictionary, we traverse it first:
-                self[key] = self[key].to_dictdict()
-            value = self[key]
-            if not isinstance(key, tuple):
-                # in some cases, the key is just one value that's a string
-                # we need to be careful not to expand the string
-                key = (key,)
-            dictdict.set_m(*key, value=value)
-        return dictdict
+        return _to_nested(self, SuperDict)
+
+    def dump_json(self, fp, **kwargs) -> None:
+        """
+        Expands tuple keys to nested dictionaries, like :py:meth:`to_dictdict`,
+        and writes them to a json file.
+        The nested dictionaries are plain dicts, which are cheaper to build.
+
+        :param fp: file object, as in :py:func:`json.dump`
+        :param kwargs: other arguments for :py:func:`json.dump`
+        """
+        json.dump(_to_nested(self, dict), fp, **kwargs)
 
     def set_m(self, *args, value=None) -> "SuperDict":
         """
@@ -392,40 +607,76 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         :return: modified :py:class:`SuperDict`
         :rtype: :py:class:`SuperDict`
         """
-        try:
-            for key, value in content.items():
-                self.dicts_to_tup(keys + [key], value)
-        except AttributeError:
+        prefix = tuple(keys)
+        if not isinstance(content, dict):
             # content is not a dict, we store it
-            self[tuple(keys)] = content
+            self[prefix] = content
             return self
+        for key, value in _iter_flat(content):
+            self[prefix + key] = value
         return self
 
-    def to_dictup(self) -> "SuperDict":
+    def iter_flat(self, max_depth: int | None = None) -> Iterator[Tuple[tuple, Any]]:
+        """
+        Goes through the nested dictionaries, yielding the path of keys to each value.
+
+        >>> list(SuperDict({'a': {'b': 1, 'c': {'d': 2}}}).iter_flat())
+        [(('a', 'b'), 1), (('a', 'c', 'd'), 2)]
+        >>> list(SuperDict({'a': {'b': 1, 'c': {'d': 2}}}).iter_flat(max_depth=2))
+        [(('a', 'b'), 1), (('a', 'c'), {'d': 2})]
+
+        :param int max_depth: maximum number of keys in the path. None to go to the end.
+        :return: an iterator of (tuple of keys, value)
+        """
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("max_depth needs to be at least 1")
+        return _iter_flat(self, max_depth)
+
+    def to_dictup(self, max_depth: int | None = None) -> "SuperDict":
         """
         Useful when reading a json and wanting to convert it to tuples.
         Opposite to to_dictdict
 
+        :param int max_depth: maximum number of elements in the new keys. None to go to the end.
         :return: new (flat) :py:class:`SuperDict`
         :rtype: :py:class:`SuperDict`
         """
-        return SuperDict().dicts_to_tup([], self)
+        return SuperDict(self.iter_flat(max_depth))
 
     def list_reverse(self) -> "SuperDict[V, TupList[K]]":
         """
         transforms dictionary of lists to another dictionary of lists only indexed by the values.
 
+        >>> SuperDict({'t1': ['m1', 'm2'], 't2': ['m1']}).list_reverse()
+        {'m1': ['t1', 't2'], 'm2': ['t1']}
+
         :return: new :py:class:`SuperDict`
         """
         from . import tuplist as tl
 
-        new_keys = list(set(val for l in self.values() for val in l))
-        dict_out = SuperDict({k: tl.TupList() for k in new_keys})
+        dict_out: SuperDict = SuperDict()
         for k, v in self.items():
             for el in v:
-                dict_out[el].append(k)
+                keys = dict_out.get(el)
+                if keys is None:
+                    dict_out[el] = tl.TupList([k])
+                else:
+                    keys.append(k)
         return dict_out
 
+    def inverted_index(self, sync: bool | None = None) -> "InvertedIndex":
+        """
+        Like :py:meth:`list_reverse` but as an index that can be kept up to date
+        while the lists of the dictionary change.
+
+        :param bool sync: follow the changes of the dictionary (assigning or deleting keys).
+            Only for a :py:class:`TrackedSuperDict`, and the default for it.
+        :return: new :py:class:`pytups.inverted.InvertedIndex`
+        """
+        from .inverted import InvertedIndex
+
+        return InvertedIndex(self, sync=sync)
+
     def to_tuplist(self) -> "TupList":
         """
         The last element of the returned tuple was the dict's value.
@@ -436,32 +687,24 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         """
         from . import tuplist as tl
 
-        tup_list = tl.TupList()
-        for key, value in self.items():
-            if not isinstance(value, list):
-                value = [value]
-            if not isinstance(key, tuple):
-                key = [key]
-            else:
-                key = list(key)
-            # now we assume key is a list and value is a list of values.
-            for val in value:
-                if isinstance(val, tuple):
-                    val = list(val)
-                else:
-                    val = [val]
-                # we also assume val is a list
-                tup_list.append(tuple(key + val))
-        return tup_list
+        return tl.TupList(_iter_tuplist(self.items()))
 
-    def fill_with_default(self, keys: Iterable, default=0) -> "SuperDict":
+    def fill_with_default(
+        self, keys: Iterable, default=0, lazy: bool = False
+    ) -> "SuperDict | DefaultSuperDict":
         """
         guarantees dictionary will have specific keys
 
-        :param Iterable keys: dictionary will have at least these keys
+        :param Iterable keys: dictionary will have at least these keys.
+            A :py:class:`pytups.default.KeyProduct` avoids building all the combinations.
         :param default:
-        :return: new :py:class:`SuperDict`
+        :param bool lazy: do not build the missing keys. The dictionary is not copied.
+        :return: new :py:class:`SuperDict` or, if lazy, new :py:class:`pytups.default.DefaultSuperDict`
         """
+        if lazy:
+            from .default import DefaultSuperDict
+
+            return DefaultSuperDict(self, keys, default)
         rem_keys = set(keys) - self.keys()
         _dict = {k: default for k in rem_keys}
         _dict.update(self)
@@ -480,8 +723,48 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         """
         return self.vapply(len)
 
-    def index_by_property(self, property, get_list=False) -> Union["SuperDict", list]:
-        el = self.keys_l()[0]
+    def _first_key(self) -> K:
+        for key in self:
+            return key
+        raise IndexError("the dictionary is empty")
+
+    def _cached_index(self, name: tuple, build: Callable, cache: bool) -> "SuperDict":
+        """
+        Gets an index from the cache or builds it.
+
+        :param tuple name: identifies the index
+        :param callable build: returns the index
+        :param bool cache: keep the index until the dictionary is modified
+        """
+        index_cache = self._index_cache
+        if index_cache is not None and name in index_cache:
+            return index_cache[name]
+        if cache and not isinstance(self, TrackedSuperDict):
+            raise TypeError(
+                "cache=True needs a TrackedSuperDict, to know when it's modified. "
+                "Try SuperDict.tracked() first."
+            )
+        result = build()
+        if cache:
+            if index_cache is None:
+                index_cache = self._index_cache = {}
+            index_cache[name] = result
+        return result
+
+    def index_by_property(
+        self, property, get_list=False, cache: bool = False
+    ) -> Union["SuperDict", list]:
+        """
+        Groups the elements by the value of one of their properties.
+
+        :param property: key of the values (that are dictionaries)
+        :param bool get_list: return only the groups, in a list
+        :param bool cache: keep the result until the dictionary is modified.
+            Only for a :py:class:`TrackedSuperDict`.
+            The result is then shared between calls and should not be modified.
+        :return: new :py:class:`SuperDict` with a :py:class:`SuperDict` for each value of the property
+        """
+        el = self._first_key()
         if property not in self[el]:
             raise IndexError(
                 "property {} is not present in el {} of dict {}".format(
@@ -489,19 +772,65 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
                 )
             )
 
-        result = {v[property]: {} for v in self.values()}
-        for k, v in self.items():
-            result[v[property]][k] = v
+        def build():
+            return _group_items(
+                ((v[property], k, v) for k, v in self.items()), SuperDict
+            )
 
-        result = SuperDict.from_dict(result)
+        result = self._cached_index(("property", property), build, cache)
         if get_list:
             return result.values_l()
         return result
 
     def index_by_part_of_tuple(
-        self, position, get_list=False
+        self, position, get_list=False, cache: bool = False
     ) -> Union["SuperDict", list]:
-        el = self.keys_l()[0]
+        """
+        Groups the elements by one of the positions of their (tuple) keys.
+
+        :param int position: position in the key
+        :param bool get_list: return only the groups, in a list
+        :param bool cache: keep the result until the dictionary is modified.
+            Only for a :py:class:`TrackedSuperDict`.
+            The result is then shared between calls and should not be modified.
+        :return: new :py:class:`SuperDict` with a :py:class:`SuperDict` for each value in the position
+        """
+        result = self.index_by_parts_of_tuple([position], cache=cache)[position]
+        if get_list:
+            return result.values_l()
+        return result
+
+    def index_by_parts_of_tuple(
+        self, positions: Iterable[int], cache: bool = False
+    ) -> "SuperDict":
+        """
+        Same as :py:meth:`index_by_part_of_tuple` for several positions, with a single pass
+        over the dictionary.
+
+        >>> SuperDict({(1, 'a'): 2, (1, 'b'): 3}).index_by_parts_of_tuple([0, 1])
+        {0: {1: {(1, 'a'): 2, (1, 'b'): 3}}, 1: {'a': {(1, 'a'): 2}, 'b': {(1, 'b'): 3}}}
+
+        :param positions: positions in the key
+        :param bool cache: keep the result until the dictionary is modified.
+            Only for a :py:class:`TrackedSuperDict`.
+            The result is then shared between calls and should not be modified.
+        :return: new :py:class:`SuperDict` with the result of `index_by_part_of_tuple` for each position
+        """
+        positions = list(positions)
+        index_cache = self._index_cache or {}
+        missing = [pos for pos in positions if ("part", pos) not in index_cache]
+        for pos in missing:
+            self._check_position(pos)
+        built = _group_by_parts(self, missing)
+        return SuperDict(
+            {
+                pos: self._cached_index(("part", pos), lambda: built[pos], cache)
+                for pos in positions
+            }
+        )
+
+    def _check_position(self, position: int) -> None:
+        el = self._first_key()
         if len(el) <= position:
             raise IndexError(
                 "length of dict {} keys is smaller than position {}".format(
@@ -509,15 +838,6 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
                 )
             )
 
-        result = {k[position]: {} for k in self.keys()}
-        for k, v in self.items():
-            result[k[position]][k] = v
-
-        result = SuperDict.from_dict(result)
-        if get_list:
-            return result.values_l()
-        return result
-
     def kvapply(self, func: Callable[[K, V], R], *args, **kwargs) -> "SuperDict[K, R]":
         """Applies a function to the dictionary and returns the result
 
@@ -549,22 +869,112 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         func: Callable[[V, Any], R],
         other: dict | int | float | str,
         *args,
+        how: str = "left",
+        fill_value: Any = _NO_FILL,
         **kwargs,
     ) -> "SuperDict[K, R]":
         """
         Applies function to both dictionaries.
-        Using keys of the self.
+        By default, using keys of the self.
         It's like applying a function over the left join.
 
+        >>> SuperDict({'a': 1, 'b': 2}).sapply(op.add, {'b': 3, 'c': 4}, how='outer', fill_value=0)
+        {'a': 1, 'b': 5, 'c': 4}
+
         :param callable func: function to apply.
         :param Union[dict, int, float, str] other: either an int, a float, a string or another dictionary to
           perform the operation over
+        :param str how: keys of the result. left: the ones of self. inner: the ones in both dictionaries.
+          outer: the ones in any of them.
+        :param fill_value: value to use for the keys missing in one of the dictionaries.
+          If not given, a missing key raises a KeyError.
         :return: new :py:class:`SuperDict`
         """
         if isinstance(other, (int, float, str)):
             return self.vapply(lambda v: func(v, other, *args, **kwargs))
+        if args or kwargs:
+            func = partial(_apply_rest, func, args, kwargs)
+        keys = _aligned_keys(self, other, how)
+        if fill_value is _NO_FILL:
+            values = self.values() if how == "left" else map(self.__getitem__, keys)
+            return SuperDict(zip(keys, map(func, values, map(other.__getitem__, keys))))
+        get_self = self.get
+        get_other = other.get
+        return SuperDict(
+            {k: func(get_self(k, fill_value), get_other(k, fill_value)) for k in keys}
+        )
+
+    def sapply_inplace(
+        self,
+        func: Callable[[V, Any], V],
+        other: dict | int | float | str,
+        *args,
+        how: str = "left",
+        fill_value: Any = _NO_FILL,
+        **kwargs,
+    ) -> "SuperDict[K, V]":
+        """
+        Same as :py:meth:`sapply` but it stores the result in the dictionary instead of creating a new one.
+        With `how="inner"`, the keys that are not in `other` are left untouched.
+
+        :param callable func: function to apply.
+        :param Union[dict, int, float, str] other: either an int, a float, a string or another dictionary to
+          perform the operation over
+        :param str how: left, inner or outer. With outer, the keys only in `other` are added.
+        :param fill_value: value to use for the keys missing in one of the dictionaries.
+          If not given, a missing key raises a KeyError.
+        :return: modified :py:class:`SuperDict`
+        """
+        if args or kwargs:
+            func = partial(_apply_rest, func, args, kwargs)
+        if isinstance(other, (int, float, str)):
+            for k, v in self.items():
+                self[k] = func(v, other)
+            return self
+        keys = _aligned_keys(self, other, how)
+        if fill_value is _NO_FILL:
+            # we check first so a missing key does not leave the dictionary half updated
+            if how != "inner":
+                _check_keys(self, other)
+            if how == "outer":
+                _check_keys(other, self)
+            for k in keys:
+                self[k] = func(self[k], other[k])
+            return self
+        get_self = self.get
+        get_other = other.get
+        for k in keys:
+            self[k] = func(get_self(k, fill_value), get_other(k, fill_value))
+        return self
+
+    def accessor(self, *template, cache: bool = False) -> "PathAccessor":
+        """
+        Prepares the reading and writing of values in the nested dictionary, always with the same shape of path.
+        Each `...` in the template is a key given later to :py:meth:`pytups.accessor.PathAccessor.get`
+        or :py:meth:`pytups.accessor.PathAccessor.set`; the rest are fixed keys.
+
+        >>> costs = SuperDict.from_dict({'cost': {'a': {1: 10, 2: 20}}})
+        >>> costs.accessor('cost', ..., ...).get('a', 2)
+        20
+
+        :param template: keys in the nested dictionary, or `...` for keys given later
+        :param bool cache: keep a flat copy of the values, indexed by their path,
+            so a read costs a single lookup. It's updated when the dictionary is modified,
+            so it needs a :py:class:`TrackedSuperDict`.
+        :return: new :py:class:`pytups.accessor.PathAccessor`
+        """
+        from .accessor import PathAccessor
+
+        return PathAccessor(self, template, cache=cache)
 
-        return self.kvapply(lambda k, v: func(v, other[k], *args, **kwargs))
+    def tracked(self) -> "TrackedSuperDict":
+        """
+        Copies the dictionary, and the dictionaries nested in it, into a :py:class:`TrackedSuperDict`.
+        The rest of the values are not copied.
+
+        :return: new :py:class:`TrackedSuperDict`
+        """
+        return TrackedSuperDict.from_dict(self)
 
     def get_m(self, *args, default=None) -> Any:
         """
@@ -674,9 +1084,10 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
 
     def copy_deep(self) -> "SuperDict[K, V]":
         """
-        Copies the complete object using python's pickle
+        Copies the complete object. Only the containers (dicts, lists, sets) are copied:
+        numbers, strings and tuples of them are shared with the original.
         """
-        return pickle.loads(pickle.dumps(self, -1))
+        return tools.copy_deep(self)
 
     def copy_deep2(self) -> "SuperDict[K, V]":
         """
@@ -689,3 +1100,108 @@ class SuperDict(dict, Generic[K, V], Mapping[K, V]):
         # TODO: this assuming the object is a pandas dataframe
 
         pass
+
+
+class TrackedSuperDict(SuperDict[K, V]):
+    """
+    A :py:class:`SuperDict` that tells when it's modified, so the indexes and caches
+    built over it can be kept up to date: ``cache=True`` in :py:meth:`SuperDict.index_by_property`
+    and :py:meth:`SuperDict.index_by_part_of_tuple`, :py:meth:`SuperDict.inverted_index` with `sync`
+    and :py:meth:`SuperDict.accessor` with `cache`.
+
+    Only assigning and deleting keys is seen: changes made inside the values are not.
+    Each modification costs a bit more than in a :py:class:`SuperDict`.
+    Create one with :py:meth:`SuperDict.tracked` or :py:meth:`SuperDict.from_dict`.
+    To keep the methods of a subclass of SuperDict, inherit from both.
+    """
+
+    # objects to tell when the dictionary is modified. See _watch.
+    _watchers: list | None = None
+
+    def _watch(self, watcher) -> None:
+        """
+        Makes the dictionary call `watcher._dict_changed(self, key)` after each modification
+        (and `watcher._dict_changing(self, key)` before it, if the watcher has it).
+        `key` is None when any key could change.
+
+        :param watcher: any object with a `_dict_changed` method
+        """
+        if self._watchers is None:
+            self._watchers = []
+        if not any(w is watcher for w in self._watchers):
+            self._watchers.append(watcher)
+
+    def _unwatch(self, watcher) -> None:
+        """
+        Stops calling `watcher` after each modification.
+        """
+        if self._watchers is not None:
+            self._watchers = [w for w in self._watchers if w is not watcher]
+
+    def _notify_before(self, key) -> None:
+        # key is None when any key could change
+        if not self._watchers:
+            return
+        for watcher in list(self._watchers):
+            changing = getattr(watcher, "_dict_changing", None)
+            if changing is not None:
+                changing(self, key)
+
+    def _notify(self, key) -> None:
+        # the cached indexes are not valid anymore
+        if self._index_cache is not None:
+            self._index_cache = None
+        if not self._watchers:
+            return
+        for watcher in list(self._watchers):
+            watcher._dict_changed(self, key)
+
+    def __setitem__(self, key, value) -> None:
+        self._notify_before(key)
+        dict.__setitem__(self, key, value)
+        self._notify(key)
+
+    def __delitem__(self, key) -> None:
+        self._notify_before(key)
+        dict.__delitem__(self, key)
+        self._notify(key)
+
+    def __ior__(self, other):
+        self._notify_before(None)
+        dict.update(self, other)
+        self._notify(None)
+        return self
+
+    def pop(self, key, *default):
+        self._notify_before(key)
+        result = dict.pop(self, key, *default)
+        self._notify(key)
+        return result
+
+    def popitem(self):
+        self._notify_before(None)
+        key, value = dict.popitem(self)
+        self._notify(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        self[key] = default
+        return default
+
+    def clear(self) -> None:
+        self._notify_before(None)
+        dict.clear(self)
+        self._notify(None)
+
+    def set_m(self, *args, value=None) -> "TrackedSuperDict":
+        elem, *rest = args
+        if rest and not isinstance(self.get(elem), SuperDict):
+            # the new nested dictionaries are tracked too
+            self[elem] = type(self)()
+        return SuperDict.set_m(self, *args, value=value)
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles do not keep the watchers or the indexes
+        return type(self), (), None, None, iter(self.items())
@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+import copy
+import operator
 from collections.abc import Iterable
 
+# values that are never modified: they are shared by the copies
+_ATOMIC = {int, float, complex, bool, str, bytes, type(None), range, frozenset}
+
 
 def is_really_iterable(var):
     """
@@ -30,3 +37,83 @@ def list_splice(target, start, delete_count=None, *items):
     target[start:total] = items
 
     return removed
+
+
+def copy_deep(obj, memo: dict | None = None):
+    """
+    Deep copy that only copies the containers that can be modified.
+    Dicts, lists and sets (and their subclasses that do not change how they are created or copied)
+    are copied and their values are copied in turn. Numbers, strings and tuples of them
+    are shared with the original. Tuples with containers are copied.
+    Anything else goes through :py:func:`copy.deepcopy`.
+    An object that appears several times is copied once, as with :py:func:`copy.deepcopy`.
+
+    :param obj: the object to copy
+    :param dict memo: copies already made, by id of the original
+    :return: the copy
+    """
+    if type(obj) in _ATOMIC:
+        return obj
+    if memo is None:
+        memo = {}
+    return _copy_deep(obj, memo)
+
+
+def _all_atomic(values: Iterable) -> bool:
+    return all(map(_ATOMIC.__contains__, map(type, values)))
+
+
+def _copy_deep(obj, memo: dict):
+    cls = type(obj)
+    if cls in _ATOMIC:
+        return obj
+    if cls is tuple and _all_atomic(obj):
+        return obj
+    found = memo.get(id(obj))
+    if found is not None:
+        return found
+    if cls is tuple:
+        new = tuple([_copy_deep(v, memo) for v in obj])
+        # a tuple inside one of its values was copied already
+        found = memo.get(id(obj))
+        if found is not None:
+            return found
+        if all(map(operator.is_, new, obj)):
+            # as copy.deepcopy: nothing inside needed a copy
+            new = obj
+        memo[id(obj)] = new
+        return new
+    if (
+        isinstance(obj, dict)
+        and cls.__init__ is dict.__init__
+        and "__reduce_ex__" not in cls.__dict__
+    ):
+        new = memo[id(obj)] = cls()
+        if _all_atomic(obj.values()):
+            # items() so subclasses that change __iter__ do not make it slower
+            dict.update(new, obj.items())
+            return new
+        atomic = _ATOMIC
+        dict.update(
+            new,
+            [
+                (k, v if type(v) in atomic else _copy_deep(v, memo))
+                for k, v in obj.items()
+            ],
+        )
+        return new
+    if isinstance(obj, list) and cls.__init__ is list.__init__:
+        new = memo[id(obj)] = cls()
+        if _all_atomic(obj):
+            list.extend(new, obj)
+            return new
+        atomic = _ATOMIC
+        list.extend(
+            new, [v if type(v) in atomic else _copy_deep(v, memo) for v in obj]
+        )
+        return new
+    if cls is set:
+        # the elements are hashable: we do not copy them
+        new = memo[id(obj)] = set(obj)
+        return new
+    return copy.deepcopy(obj, memo)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Union, TYPE_CHECKING
+
+from .tuplist import TupList, _as_cols, _item_getter
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+
+class TupIndex:
+    """
+    A hash index over some positions (or keys) of the elements of a :py:class:`pytups.tuplist.TupList`.
+
+    It maps every value of the indexed columns to the positions of the elements that have it.
+    When the list is longer on the next lookup, only the new elements at the end are indexed.
+    It's built again when the list is shorter, or after :py:meth:`invalidate`.
+    Other modifications are not seen, unless the list is
+    a :py:class:`pytups.tuplist.TrackedTupList`: then the elements added at the end are indexed
+    as they come and any other change makes the index rebuild itself on the next lookup.
+    """
+
+    _positions: Dict[Any, List[int]]
+
+    def __init__(self, data: TupList, cols: Union[Iterable, int, str]):
+        """
+        :param data: the list to index
+        :param cols: a list of positions (or keys) or a single one
+        """
+        self.cols = _as_cols(cols)
+        self._data = data
+        self._get_key = _item_getter(self.cols)
+        self._positions = defaultdict(list)
+        self._size = 0
+        self._stale = True
+
+    def _build(self) -> None:
+        self._positions = defaultdict(list)
+        self._size = 0
+        self._stale = False
+        self._extend(0)
+
+    def _extend(self, start: int) -> None:
+        """
+        Indexes the elements of the list from position `start` to the end.
+        """
+        if self._stale:
+            return
+        if start != self._size:
+            # the list changed without us knowing
+            self._stale = True
+            return
+        positions = self._positions
+        data = self._data
+        if start == 0:
+            rows: Iterable = data
+        else:
+            rows = map(partial(list.__getitem__, data), range(start, len(data)))
+        for pos, key in enumerate(map(self._get_key, rows), start):
+            positions[key].append(pos)
+        self._size = len(data)
+
+    def invalidate(self) -> None:
+        """
+        Marks the index to be rebuilt on the next lookup.
+        """
+        self._stale = True
+
+    def _get_positions(self) -> Dict[Any, List[int]]:
+        if not self._stale and self._size < len(self._data):
+            # the list is longer: we assume it grew at the end and index the new elements
+            self._extend(self._size)
+        elif self._stale or self._size != len(self._data):
+            self._build()
+        return self._positions
+
+    def positions(self, key) -> List[int]:
+        """
+
+        :param key: value of the indexed columns
+        :return: positions in the list of the elements with that value
+        """
+        return list(self._get_positions().get(key, ()))
+
+    def get(self, key, default=None) -> TupList:
+        """
+
+        :param key: value of the indexed columns
+        :param default: what to return if no element has the value. An empty TupList by default.
+        :return: new :py:class:`pytups.tuplist.TupList` with the elements that have the value
+        """
+        positions = self._get_positions().get(key)
+        if positions is None:
+            return TupList() if default is None else default
+        return TupList(map(partial(list.__getitem__, self._data), positions))
+
+    def __getitem__(self, key) -> TupList:
+        positions = self._get_positions().get(key)
+        if positions is None:
+            raise KeyError(key)
+        return TupList(map(partial(list.__getitem__, self._data), positions))
+
+    def __contains__(self, key) -> bool:
+        return key in self._get_positions()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._get_positions())
+
+    def __len__(self) -> int:
+        return len(self._get_positions())
+
+    def keys(self) -> Iterable:
+        """
+
+        :return: the distinct values of the indexed columns
+        """
+        return self._get_positions().keys()
+
+    def to_dict(self) -> "SuperDict":
+        """
+        Same as :py:meth:`pytups.tuplist.TupList.to_dict` with `result_col=None` and
+        the indexed columns as `indices`.
+
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        getter = partial(list.__getitem__, self._data)
+        return sd.SuperDict(
+            {k: TupList(map(getter, v)) for k, v in self._get_positions().items()}
+        )
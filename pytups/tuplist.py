@@ -1,31 +1,483 @@
 from __future__ import annotations
 
 import csv
+import warnings
 from typing import (
+    Any,
     Callable,
     Iterable,
+    Iterator,
     Union,
     TypeVar,
     Generic,
     TYPE_CHECKING,
     List,
+    Dict,
     Set,
     SupportsIndex,
+    Tuple,
     cast,
     overload,
 )
-import pickle
-from itertools import chain
+from collections import defaultdict, deque
+from itertools import chain, islice
+from operator import itemgetter
 
 if TYPE_CHECKING:
     from .superdict import SuperDict
+    from .columnar import ColumnarTupList
+    from .tupindex import TupIndex
+    from .lazy import LazyTupList
+    from .groupby import GroupBy
 
-from .tools import is_really_iterable
+from .tools import copy_deep, is_really_iterable
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
+def _item_getter(cols: list) -> Callable:
+    """
+    Builds a function that gets the value of one position (or key) of an element
+    or a tuple of values if there are several positions.
+
+    :param list cols: positions of the tuple or keys of the dict
+    :return: callable
+    """
+    if not cols:
+        return lambda el: ()
+    return itemgetter(*cols)
+
+
+def _as_cols(cols: Union[Iterable, int, str]) -> list:
+    """
+    :param cols: a list of positions (or keys) or a single one
+    :return: list of positions (or keys)
+    """
+    if not is_really_iterable(cols):
+        return [cols]
+    return list(cast(Iterable, cols))
+
+
+def _take_getter(indices: Union[Iterable, int]) -> Callable:
+    """
+    Builds the function used by :py:meth:`TupList.take`: a tuple for a list of positions,
+    even with one position, and the value for a single position.
+
+    :param indices: a list of positions (or keys) or a single one
+    :return: callable
+    """
+    if not is_really_iterable(indices):
+        return itemgetter(indices)
+    indices = list(cast(Iterable, indices))
+    if len(indices) == 1:
+        position = indices[0]
+        return lambda tup: (tup[position],)
+    return _item_getter(indices)
+
+
+def _to_array(values: list):
+    """
+    Builds a numpy array with a typed dtype if all values are ints or all are floats.
+
+    :param list values: values of a column
+    :return: :py:class:`numpy.ndarray`
+    """
+    import numpy as np
+
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif kinds == {float}:
+        return np.array(values, dtype=np.float64)
+    # we fill an empty array so numpy does not look inside the values
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def _to_dict_cols(
+    width: int,
+    result_col: Union[Iterable, int, None],
+    indices: Union[Iterable, int, None],
+) -> Tuple[Union[list, None], list]:
+    """
+    Completes the columns used by :py:meth:`TupList.to_dict`.
+
+    :param int width: length of the tuples
+    :param result_col: columns for the content of the dictionary, or None
+    :param indices: columns for the keys of the dictionary, or None for the rest
+    :return: the two lists of columns
+    """
+    if result_col is not None:
+        if not is_really_iterable(result_col):
+            result_col = [result_col]
+        else:
+            result_col = list(cast(Iterable, result_col))
+
+    # now that we have a result_col, we can fill indices
+    if indices is None:
+        result_col = cast(list, result_col)
+        indices = [
+            col
+            for col in range(width)
+            if col not in result_col and (col - width) not in result_col
+        ]
+    elif not is_really_iterable(indices):
+        indices = [indices]
+    else:
+        indices = list(cast(Iterable, indices))
+    return result_col, indices
+
+
+def _group(keys: Iterable, contents: Iterable, is_list: bool = True) -> "SuperDict":
+    """
+    Builds a dictionary from a key and a content for each element.
+
+    :param keys: one key per element
+    :param contents: one content per element
+    :param bool is_list: if True, contents with the same key are stored in a TupList.
+        Otherwise, the last content is kept.
+    :return: new :py:class:`pytups.superdict.SuperDict`
+    """
+    from . import superdict as sd
+
+    if not is_list:
+        result = sd.SuperDict()
+        dict.update(result, zip(keys, contents))
+        return result
+    groups: defaultdict = defaultdict(TupList)
+    # we skip any append defined in a subclass: these lists are new
+    append = list.append
+    for key, content in zip(keys, contents):
+        append(groups[key], content)
+    return sd.SuperDict(groups)
+
+
+def _group_numpy(
+    keys: list, rows: list, get_content: Callable | None = None
+) -> "SuperDict":
+    """
+    Same as :py:func:`_group` for integer keys, sorting them with numpy.
+
+    :param list keys: one integer per element
+    :param list rows: the elements
+    :param callable get_content: gets the content from the element. None to store the element.
+    :return: new :py:class:`pytups.superdict.SuperDict`
+    """
+    import numpy as np
+    from . import superdict as sd
+
+    arr = np.array(keys)
+    if arr.dtype.kind != "i" or arr.ndim != 1:
+        raise TypeError("numpy grouping only works with integer keys")
+    # elements sorted by key, keeping their order inside each key
+    order = np.argsort(arr, kind="stable")
+    sorted_keys = arr[order]
+    starts = np.flatnonzero(np.diff(sorted_keys)) + 1
+    ends = np.append(starts, len(arr)).tolist()
+    starts = np.insert(starts, 0, 0)
+    # thanks to the stable sort, the first element of each group is its first appearance
+    first_pos = order[starts].tolist()
+    starts = starts.tolist()
+    order = order.tolist()
+    if get_content is None:
+        sorted_contents = list(map(rows.__getitem__, order))
+    else:
+        sorted_contents = list(map(get_content, map(rows.__getitem__, order)))
+    # keys are returned in the order they first appear
+    result = sd.SuperDict()
+    for group in sorted(range(len(first_pos)), key=first_pos.__getitem__):
+        result[keys[first_pos[group]]] = TupList(
+            sorted_contents[starts[group] : ends[group]]
+        )
+    return result
+
+
+def _col_setter(pos: Union[int, str, None], func: Callable) -> Callable:
+    """
+    Builds the function used by :py:meth:`TupList.vapply_col`.
+
+    :param pos: int or str. None to add the result at the end of the tuple
+    :param callable func: function to apply to create col
+    :return: callable that returns the modified element
+    """
+
+    def apply_to_tup(my_tuple):
+        # we apply the function before any potential modification
+        result = func(my_tuple)
+        # if it's un-mutable (tuple), we need to make it a list
+        tuple_flag = 0
+        if isinstance(my_tuple, tuple):
+            tuple_flag = 1
+            my_tuple = list(my_tuple)
+        # if None, we assume we want it at the end
+        if tuple_flag and pos is None:
+            my_tuple.append(result)
+        else:
+            my_tuple[pos] = result
+        if tuple_flag:
+            my_tuple = tuple(my_tuple)
+        return my_tuple
+
+    return apply_to_tup
+
+
+def _write_csv(path: str, first, rows: Iterable, header: list | None = None) -> None:
+    """
+    Writes the rows to a csv file, one at a time.
+
+    :param path: filename
+    :param first: first row, to check the header and to get it for dicts
+    :param rows: all the rows, including the first one
+    :param header: list of strings to use as header/column names for dict
+    """
+    if header is not None and len(first) != len(header):
+        raise ValueError("Header length does not match data length")
+    # Handle case of list of dict
+    if isinstance(first, dict):
+        if header is None:
+            header = first.keys()
+        header = list(cast(list, header))
+        missing = [h for h in header if h not in first]
+        if missing:
+            raise KeyError(missing[0])
+        get_row = itemgetter(*header) if len(header) > 1 else lambda v: (v[header[0]],)
+        rows = map(get_row, rows)
+    with open(path, "w", newline="\n", encoding="utf-8") as out:
+        csv_out = csv.writer(out)
+        if header is not None:
+            csv_out.writerow(header)
+        csv_out.writerows(rows)
+
+
+# number of csv rows converted at a time
+_CSV_CHUNKSIZE = 10000
+
+
+def _infer_types(rows: list) -> list:
+    """
+    Guesses the type of each column of csv rows: int, float or str.
+
+    :param list rows: lists of strings
+    :return: one type per column
+    """
+    types = []
+    for values in zip(*rows):
+        for _type in (int, float):
+            try:
+                # runs the conversion without keeping the result
+                deque(map(_type, values), maxlen=0)
+            except ValueError:
+                continue
+            types.append(_type)
+            break
+        else:
+            types.append(str)
+    return types
+
+
+def _widen_types(types: list, other: list) -> list:
+    """
+    Gets the types that can convert the values of both lists of inferred types.
+
+    :param list types: types from :py:func:`_infer_types`
+    :param list other: types from :py:func:`_infer_types`
+    :return: one type per column
+    """
+    order = [int, float, str]
+    return [max(a, b, key=order.index) for a, b in zip(types, other)]
+
+
+def _convert_columns(rows: list, types: list) -> Iterable[tuple]:
+    """
+    Converts the values of csv rows, one column at a time.
+
+    :param list rows: lists of strings
+    :param list types: a function per column. str or None to keep the values.
+    :return: an iterable of tuples
+    """
+    if set(map(len, rows)) != {len(types)}:
+        raise ValueError("All rows need to have {} values".format(len(types)))
+    columns = [
+        values if _type is None or _type is str else map(_type, values)
+        for values, _type in zip(zip(*rows), types)
+    ]
+    return zip(*columns)
+
+
+def _consecutive_breaks(pp: int) -> Callable:
+    """
+    The default `compare_tups` of :py:meth:`TupList.to_start_finish`: a new run starts
+    when the id (first position) changes or the period does not increase by one.
+    """
+
+    def compare_tups(tup, last_tup, _pp):
+        return tup[0] != last_tup[0] or tup[pp] - 1 != last_tup[pp]
+
+    return compare_tups
+
+
+def _iter_start_finish(
+    rows: Iterable,
+    compare_tups: Callable | None = None,
+    pp: int = 1,
+    join_func: Callable | None = None,
+) -> Iterator:
+    """
+    Joins runs of consecutive rows, one at a time. The rows need to be sorted already.
+
+    :param rows: the sorted rows
+    :param callable compare_tups: returns True if tups are not consecutive. Takes 3 arguments
+    :param int pp: the position in the tuple where the period is
+    :param callable join_func: returns joined tuple from list of consecutive tuples
+    :return: an iterator of joined tuples
+    """
+    if compare_tups is None:
+        compare_tups = _consecutive_breaks(pp)
+    rows = iter(rows)
+    for first in rows:
+        break
+    else:
+        return
+    if join_func is not None:
+        # the function needs the whole run
+        current = [first]
+        for tup in rows:
+            if compare_tups(tup, current[-1], pp):
+                yield join_func(current)
+                current = [tup]
+            else:
+                current.append(tup)
+        yield join_func(current)
+        return
+    # we only keep the first and last tuple of the run
+    last = first
+    for tup in rows:
+        if compare_tups(tup, last, pp):
+            yield tuple(first) + (last[pp],)
+            first = tup
+        last = tup
+    yield tuple(first) + (last[pp],)
+
+
+def _start_finish_numpy(rows: list, pp: int, sort: bool) -> "TupList":
+    """
+    Same as :py:meth:`TupList.to_start_finish` without `compare_tups`,
+    finding the runs with numpy over the id and period columns.
+    """
+    import numpy as np
+
+    periods = np.array(list(map(itemgetter(pp), rows)))
+    if periods.dtype.kind not in "iu" or periods.ndim != 1:
+        raise TypeError("numpy runs need integer periods")
+    # ids are compared (and sorted) by their rank
+    ids_col = list(map(itemgetter(0), rows))
+    rank = {k: i for i, k in enumerate(sorted(set(ids_col)))}
+    ids = np.fromiter(map(rank.__getitem__, ids_col), dtype=np.int64, count=len(ids_col))
+    if sort:
+        order = np.lexsort((periods, ids))
+        ids = ids[order]
+        periods = periods[order]
+    breaks = (ids[1:] != ids[:-1]) | (periods[1:] - 1 != periods[:-1])
+    starts = np.flatnonzero(breaks) + 1
+    ends = np.append(starts, len(periods)) - 1
+    starts = np.insert(starts, 0, 0)
+    finish = periods[ends].tolist()
+    if sort:
+        starts = order[starts]
+    firsts = map(rows.__getitem__, starts.tolist())
+    return TupList(tuple(first) + (last,) for first, last in zip(firsts, finish))
+
+
+def _unique_key(cols: list | None, first) -> Callable | None:
+    """
+    Gets the function that tells which elements are the same for :py:meth:`TupList.unique`.
+
+    :param cols: positions (or keys) to compare. None to compare the whole element.
+    :param first: an element of the list
+    :return: callable, or None to compare the elements themselves
+    """
+    if cols is not None:
+        return _item_getter(cols)
+    if isinstance(first, dict):
+        return lambda el: frozenset(el.items())
+    return None
+
+
+def _hashable(value):
+    """
+    Makes a hashable value out of lists, dicts and sets, so they can be compared
+    in :py:meth:`TupList.unique`. Equal values give equal results.
+
+    :param value: anything
+    :return: the value, or a hashable copy
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, (list, tuple)):
+        # the type, so a list is not the same as a tuple
+        return isinstance(value, tuple), tuple(map(_hashable, value))
+    return value
+
+
+def _iter_unique(rows: Iterable, cols: list | None = None) -> Iterator:
+    """
+    Yields the first element of each distinct value, in the order they appear.
+
+    :param rows: the elements
+    :param cols: positions (or keys) to compare. None to compare the whole element.
+    :return: an iterator of elements
+    """
+    rows = iter(rows)
+    for first in rows:
+        break
+    else:
+        return
+    get_key = _unique_key(cols, first)
+    get_cols = None if cols is None else _item_getter(cols)
+    seen = set()
+    add = seen.add
+    for el in chain([first], rows):
+        try:
+            key = el if get_key is None else get_key(el)
+            new = key not in seen
+        except TypeError:
+            # unhashable values: compared by their contents
+            key = _hashable(el if get_cols is None else get_cols(el))
+            new = key not in seen
+        if new:
+            add(key)
+            yield el
+
+
+def _unique_numpy(rows: "TupList", cols: list) -> "TupList":
+    """
+    Same as :py:meth:`TupList.unique` when all the columns to compare are numbers.
+    """
+    import numpy as np
+
+    columns = [rows.column_np(col) for col in cols]
+    if any(arr.dtype.kind not in "iuf" for arr in columns):
+        raise TypeError("numpy unique needs numeric columns")
+    if any(arr.dtype.kind == "f" and np.isnan(arr).any() for arr in columns):
+        # numpy never finds two nan equal, python does when they are the same object
+        raise TypeError("numpy unique does not compare nan as python")
+    # stable sort: the first element of each group is its first appearance
+    order = np.lexsort(columns[::-1])
+    breaks = np.zeros(len(order) - 1, dtype=bool)
+    for arr in columns:
+        arr = arr[order]
+        breaks |= arr[1:] != arr[:-1]
+    first_pos = np.sort(order[np.insert(np.flatnonzero(breaks) + 1, 0, 0)])
+    return TupList(map(rows.__getitem__, first_pos.tolist()))
+
+
 class TupList(list, Generic[T]):
     """
     A list of tuples or dictionaries
@@ -48,6 +500,72 @@ class TupList(list, Generic[T]):
     def __add__(self, *args, **kwargs) -> "TupList":
         return TupList(super().__add__(*args, **kwargs))
 
+    # indexes created with index_on, by indexed columns
+    _indexes: Dict[tuple, "TupIndex"] | None = None
+    # numpy arrays created with column_np, by column
+    _column_cache: Dict[Any, Any] | None = None
+
+    def __getstate__(self):
+        # indexes and columns are not copied, they can be built again
+        state = dict(self.__dict__)
+        state.pop("_indexes", None)
+        state.pop("_column_cache", None)
+        return state or None
+
+    def tracked(self) -> "TrackedTupList[T]":
+        """
+        Copies the list into a :py:class:`TrackedTupList`, that keeps its indexes up to date.
+        The elements are not copied.
+
+        :return: new :py:class:`TrackedTupList`
+        """
+        return TrackedTupList(self)
+
+    def index_on(self, cols: Union[Iterable, int, str]) -> "TupIndex":
+        """
+        Builds (or reuses) a hash index on some positions of the tuples (or keys of the dicts).
+        Elements added at the end of the list are indexed on the next lookup, and the index
+        is built again when the list is shorter.
+        Other modifications are not seen: call :py:meth:`pytups.tupindex.TupIndex.invalidate`
+        after them, or use a :py:class:`TrackedTupList`.
+
+        >>> TupList([(1, 'a'), (2, 'b'), (1, 'c')]).index_on(0)[1]
+        [(1, 'a'), (1, 'c')]
+
+        :param cols: a list of positions or a single position
+        :return: :py:class:`pytups.tupindex.TupIndex`
+        """
+        from .tupindex import TupIndex
+
+        cols = tuple(_as_cols(cols))
+        if self._indexes is None:
+            self._indexes = {}
+        index = self._indexes.get(cols)
+        if index is None:
+            index = self._indexes[cols] = TupIndex(self, cols)
+        return index
+
+    def drop_indexes(self) -> None:
+        """
+        Forgets the indexes built with :py:meth:`index_on`.
+        """
+        self._indexes = None
+
+    def drop_cache(self) -> None:
+        """
+        Forgets the columns kept by :py:meth:`column_np` and makes the indexes
+        built with :py:meth:`index_on` rebuild themselves on the next lookup.
+        Needed after changing the elements in place.
+        """
+        self._changed()
+
+    def _changed(self) -> None:
+        # the list, or its elements, were modified
+        self._column_cache = None
+        if self._indexes:
+            for index in self._indexes.values():
+                index.invalidate()
+
     def head(self) -> str:
         # TODO: change to show 5 first and 5 last, at least.
         # still wrong
@@ -59,15 +577,22 @@ class TupList(list, Generic[T]):
         return repr(text)
 
     def take(self, indices: Union[Iterable, int], use_numpy=False) -> "TupList":
+        """
+        filters the tuple of each element of the list according to a list of positions
+        (or the keys of each dict)
+
+        :param indices: a list of positions or a single position
+        :type indices: int or list
+        :param bool use_numpy: deprecated, it has no effect
+        :return: a new :py:class:`TupList`
+        """
         if use_numpy:
-            try:
-                return self.take_np(indices)
-            except ImportError:
-                pass
-        if not is_really_iterable(indices):
-            return self.vapply(lambda tup: tup[indices])
-        casted_indices = cast(Iterable, indices)
-        return self.vapply(lambda tup: tuple(tup[a] for a in casted_indices))
+            warnings.warn(
+                "use_numpy in take is deprecated and has no effect",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        return TupList(map(_take_getter(indices), self))
 
     def copy_shallow(self) -> "TupList":
         """
@@ -79,31 +604,51 @@ class TupList(list, Generic[T]):
 
     def copy_deep(self) -> "TupList":
         """
-        Copies the complete object using python's pickle
+        Copies the complete object. Only the containers (dicts, lists, sets) are copied:
+        numbers, strings and tuples of them are shared with the original.
         """
-        return pickle.loads(pickle.dumps(self, -1))
+        return copy_deep(self)
 
     def take_np(self, indices: Union[Iterable, int]) -> "TupList":
         """
-        filters the tuple of each element of the list according to a list of positions
+        Deprecated: same as :py:meth:`take`, that is faster than going through numpy arrays.
 
         :param indices: a list of positions
         :type indices: int or list
         :return: a new :py:class:`TupList`
         """
-        import numpy as np
+        warnings.warn(
+            "take_np is deprecated, use take instead", DeprecationWarning, stacklevel=2
+        )
+        return self.take(indices)
 
-        if not len(self):
-            return self
-        single = False
-        arr = np.array(self, dtype=object)
-        if not isinstance(indices, list):
-            indices = [indices]
-            single = True
-        arr_filt = np.take(arr, indices, axis=1)
-        if single:
-            return TupList(x[0] for x in arr_filt)
-        return TupList(tuple(x) for x in arr_filt)
+    def column_np(self, col: Union[int, str], cache: bool = False):
+        """
+        Gets the values of one position of the tuples (or one key of the dicts) as a numpy array.
+        Columns of ints or floats get a typed array and the rest an array of objects.
+
+        :param col: position of the tuple or key of the dict
+        :param bool cache: keep the array until the list is modified.
+            Only for a :py:class:`TrackedTupList`.
+            Changes made inside the elements are not seen, except with :py:meth:`vapply_col`:
+            call :py:meth:`drop_cache` after them.
+            The array is then shared between calls and should not be modified.
+        :return: :py:class:`numpy.ndarray`
+        """
+        column_cache = self._column_cache
+        if column_cache is not None and col in column_cache:
+            return column_cache[col]
+        if cache and not isinstance(self, TrackedTupList):
+            raise TypeError(
+                "cache=True needs a TrackedTupList, to know when it's modified. "
+                "Try TupList.tracked() first."
+            )
+        arr = _to_array(list(map(itemgetter(col), self)))
+        if cache:
+            if column_cache is None:
+                column_cache = self._column_cache = {}
+            column_cache[col] = arr
+        return arr
 
     def vfilter(self, function: Callable) -> "TupList[T]":
         """
@@ -119,6 +664,7 @@ class TupList(list, Generic[T]):
         result_col: Union[Iterable, int, None] = 0,
         is_list: bool = True,
         indices: Union[Iterable, int, None] = None,
+        use_numpy: bool = False,
     ) -> "SuperDict":
         """
         This magic function converts a tuple list into a dictionary
@@ -129,6 +675,7 @@ class TupList(list, Generic[T]):
         :param bool is_list: the value of the dictionary will be a TupList?
         :param list indices: optional way of determining the indices instead of
             being the complement of result_col
+        :param bool use_numpy: group with numpy when the index is a single column of integers
         :return: new :py:class:`pytups.superdict.SuperDict`
         """
         from . import superdict as sd
@@ -142,57 +689,22 @@ class TupList(list, Generic[T]):
                 "For a list of dicts, to_dict require indices to be specified"
             )
 
-        if result_col is None:
+        if result_col is None and indices is None:
             # if everything is None, we return the same tuple as index and as result
-            if indices is None:
-                return sd.SuperDict({k: k for k in self})
-        elif not is_really_iterable(result_col):
-            result_col = [result_col]
+            return sd.SuperDict({k: k for k in self})
+        result_col, indices = _to_dict_cols(len(first), result_col, indices)
 
-        # now that we have a result_col, we can fill indices
-        if indices is None:
-            indices = [
-                col
-                for col in range(len(self[0]))
-                if col not in result_col and (col - len(self[0])) not in result_col
-            ]
-        elif not is_really_iterable(indices):
-            indices = [indices]
-
-        def one_or_tup(_list):
-            if len(_list) == 1:
-                return _list[0]
-            return _list
-
-        def get_index(el):
-            index = tuple(el[i] for i in indices)
-            return one_or_tup(index)
-
-        if result_col is None:
-            # the content matches the input, no need to do anything
-            def get_content(x):
-                return x
-
-        else:
-
-            def get_content(el):
-                content = tuple(el[i] for i in result_col)
-                return one_or_tup(content)
-
-        def assign_result(result, index, content):
-            if not is_list:
-                result[index] = content
-                return
-            if index not in result:
-                result[index] = TupList()
-            result[index].append(content)
-
-        result = sd.SuperDict()
-        for el in self:
-            index = get_index(el)
-            content = get_content(el)
-            assign_result(result, index, content)
-        return result
+        get_index = _item_getter(indices)
+        # if result_col is None, the content matches the input
+        get_content = None if result_col is None else _item_getter(result_col)
+        if use_numpy and is_list and len(indices) == 1:
+            try:
+                return _group_numpy(list(map(get_index, self)), self, get_content)
+            except (ImportError, TypeError):
+                # numpy is not present or the keys are not integers
+                pass
+        contents = self if get_content is None else map(get_content, self)
+        return _group(map(get_index, self), contents, is_list)
 
     def to_dictlist(self, keys: list) -> "TupList":
         """
@@ -220,20 +732,62 @@ class TupList(list, Generic[T]):
         """
         return self.append(tuple(args))
 
-    def unique(self, **kwargs) -> "TupList[T]":
+    def unique(
+        self,
+        cols: Union[Iterable, int, str, None] = None,
+        use_numpy: bool = False,
+        **kwargs,
+    ) -> "TupList[T]":
         """
-        Applies :py:func:`numpy.unique`.
+        Keeps the first element of each distinct value, in the order they appear.
+        Values that are not hashable, such as lists, are compared by their contents.
+
+        >>> TupList([(1, 'a'), (2, 'b'), (1, 'a'), (1, 'c')]).unique()
+        [(1, 'a'), (2, 'b'), (1, 'c')]
+        >>> TupList([(1, 'a'), (2, 'b'), (1, 'a'), (1, 'c')]).unique(0)
+        [(1, 'a'), (2, 'b')]
 
-        :param dtype: arguments to :py:func:`numpy.asarray`
+        :param cols: positions (or keys) to compare. None to compare the whole element.
+        :param bool use_numpy: compare with numpy when all the columns are numbers
+        :param kwargs: not used. They were passed to :py:func:`numpy.asarray` in older versions.
         :return: new :py:class:`TupList`
         """
-        try:
-            import numpy as np
+        if not len(self):
+            return TupList()
+        if cols is not None:
+            cols = _as_cols(cols)
+        first = self[0]
+        if use_numpy and not isinstance(first, dict):
+            if cols is not None:
+                numpy_cols = cols
+            elif len(set(map(len, self))) == 1:
+                numpy_cols = list(range(len(first)))
+            else:
+                numpy_cols = []
+            try:
+                if numpy_cols:
+                    return _unique_numpy(self, numpy_cols)
+            except (ImportError, TypeError):
+                # numpy is not present or the values are not numbers
+                pass
+        if cols is None and not isinstance(first, dict):
+            try:
+                return TupList(dict.fromkeys(self))
+            except TypeError:
+                # unhashable elements, such as lists
+                pass
+        return TupList(_iter_unique(self, cols))
 
-            arr = np.asarray(self, **kwargs)
-            return TupList(np.unique(arr, axis=0).tolist())
-        except ImportError:
-            return self.unique2()
+    def iter_unique(self, cols: Union[Iterable, int, str, None] = None) -> Iterator:
+        """
+        Same as :py:meth:`unique`, yielding one element at a time.
+
+        :param cols: positions (or keys) to compare. None to compare the whole element.
+        :return: an iterator of elements
+        """
+        if cols is not None:
+            cols = _as_cols(cols)
+        return _iter_unique(self, cols)
 
     def unique2(self) -> "TupList[T]":
         """
@@ -243,6 +797,130 @@ class TupList(list, Generic[T]):
         """
         return TupList(set(self))
 
+    def join(
+        self,
+        other: Iterable,
+        left_on: Union[Iterable, int, str],
+        right_on: Union[Iterable, int, str, None] = None,
+        how: str = "inner",
+        right_width: int | None = None,
+    ) -> "TupList":
+        """
+        Joins the list with another one by the values in some positions of the tuples
+        (or keys of the dicts).
+
+        For tuples (or lists), the positions of `other` that are not in `right_on` are added
+        at the end of each tuple. For dicts, the two dicts are merged and the values of the list
+        win over the ones of `other`. The result keeps the order of the list.
+
+        >>> TupList([(1, 'a'), (2, 'b')]).join([(1, 10), (1, 20)], left_on=0)
+        [(1, 'a', 10), (1, 'a', 20)]
+
+        :param other: list of tuples (or dicts) to join with
+        :param left_on: positions (or keys) of the elements of this list
+        :param right_on: positions (or keys) of the elements of `other`. By default, `left_on`
+        :param str how: 'inner' (matching pairs), 'left' (like inner but elements without match
+            are kept and completed with None), 'semi' (elements with a match) or
+            'anti' (elements without a match)
+        :param int right_width: length of the tuples of `other`, for the None of a left join
+            when `other` is empty. It is needed in that case: the length of the result
+            can't be deduced from the data.
+        :return: new :py:class:`TupList`
+        """
+        if how not in ("inner", "left", "semi", "anti"):
+            raise ValueError("how needs to be one of: inner, left, semi, anti")
+        if right_on is None:
+            right_on = left_on
+        left_cols = _as_cols(left_on)
+        right_cols = _as_cols(right_on)
+        get_left = _item_getter(left_cols)
+        get_right = _item_getter(right_cols)
+        if not isinstance(other, list):
+            other = list(other)
+
+        if how in ("semi", "anti"):
+            keys = set(map(get_right, other))
+            keep = how == "semi"
+            return TupList(el for el in self if (get_left(el) in keys) is keep)
+
+        if not len(self) or (how == "inner" and not len(other)):
+            return TupList()
+        sample = other[0] if len(other) else self[0]
+        if isinstance(sample, dict):
+
+            def merge(left, right):
+                return {**right, **left}
+
+            def complete(left):
+                return dict(left)
+
+        else:
+            if len(other):
+                width = len(sample)
+            elif right_width is not None:
+                width = right_width
+            else:
+                raise ValueError(
+                    "right_width is needed for a left join with an empty list of tuples"
+                )
+            rest = _take_getter(
+                [
+                    col
+                    for col in range(width)
+                    if col not in right_cols and (col - width) not in right_cols
+                ]
+            )
+            empty = (None,) * (width - len(right_cols))
+
+            def merge(left, right):
+                return tuple(left) + rest(right)
+
+            def complete(left):
+                return tuple(left) + empty
+
+        result: TupList = TupList()
+        append = list.append
+        if how == "left" or len(other) <= len(self):
+            # we store the smaller list (or the other one, for a left join)
+            groups = _group(map(get_right, other), other)
+            for el in self:
+                matches = groups.get(get_left(el))
+                if matches is None:
+                    if how == "left":
+                        append(result, complete(el))
+                    continue
+                for match in matches:
+                    append(result, merge(el, match))
+            return result
+        # we store the positions of this list and stream the other one.
+        # The matches are then sorted by position to keep the order of this list.
+        positions = _group(map(get_left, self), range(len(self)))
+        found: defaultdict = defaultdict(list)
+        for match in other:
+            for pos in positions.get(get_right(match), ()):
+                found[pos].append(match)
+        for pos in sorted(found):
+            el = self[pos]
+            for match in found[pos]:
+                append(result, merge(el, match))
+        return result
+
+    def group_by(self, cols: Union[Iterable, int, str]) -> "GroupBy":
+        """
+        Groups the elements by some positions of the tuples (or keys of the dicts).
+        The groups are not built: the elements are aggregated directly with
+        :py:meth:`pytups.groupby.GroupBy.agg`.
+
+        >>> TupList([(1, 5), (1, 6), (2, 7)]).group_by(0).agg(sum=1)
+        {1: 11, 2: 7}
+
+        :param cols: a list of positions or a single position
+        :return: :py:class:`pytups.groupby.GroupBy`
+        """
+        from .groupby import GroupBy
+
+        return GroupBy(self, cols)
+
     def intersect(self, input_list: Iterable) -> "TupList[T]":
         """
         Converts list and argument into sets and then intersects them.
@@ -263,47 +941,54 @@ class TupList(list, Generic[T]):
 
     def to_start_finish(
         self,
-        compare_tups: Callable,
+        compare_tups: Callable | None = None,
         pp: int = 1,
         sort: bool = True,
         join_func: Callable | None = None,
+        use_numpy: bool = False,
     ) -> "TupList":
         """
         Takes a calendar tuple list of the form: (id, month) and
         returns a tuple list of the form (id, start_month, end_month)
         it works with a bigger tuple too.
+        The list is not modified: if needed, a sorted copy is used.
 
-        :param callable compare_tups: returns True if tups are not consecutive. Takes 3 arguments
+        :param callable compare_tups: returns True if tups are not consecutive. Takes 3 arguments.
+            None to start a new run when the id changes or the period does not increase by one.
         :param int pp: the position in the tuple where the period is
+        :param bool sort: sort the tuples by id and period first
         :param callable join_func: returns joined tuple from list of consecutive tuples. Takes 1 argument.
+        :param bool use_numpy: find the runs with numpy. Only without `compare_tups` and `join_func`
+            and with integer periods.
         :return: new :py:class:`TupList`
         """
+        if use_numpy and compare_tups is None and join_func is None and len(self):
+            try:
+                return _start_finish_numpy(self, pp, sort)
+            except (ImportError, TypeError):
+                # numpy is not present or the values cannot be compared
+                pass
+        rows: Iterable = self
         if sort:
-            self.sort(key=lambda x: (x[0], x[pp]))
-        last_tup = ()
-        all_periods = []
-        current_period = []
-        for tup in self:
-            if tup == self[0] or compare_tups(tup, last_tup, pp):
-                # we're starting, or it's a new id. Or we're changing month.
-                if len(current_period):
-                    # if there was a previous list of periods: save it
-                    all_periods.append(current_period)
-                # start list of consecutive periods
-                current_period = [tup]
-            else:
-                # don't start: just keep on storing it
-                current_period.append(tup)
-            last_tup = tup
+            rows = sorted(self, key=lambda x: (x[0], x[pp]))
+        return TupList(_iter_start_finish(rows, compare_tups, pp, join_func))
 
-        # The last tup, we need to save it too:
-        if len(current_period):
-            all_periods.append(current_period)
+    def iter_start_finish(
+        self,
+        compare_tups: Callable | None = None,
+        pp: int = 1,
+        join_func: Callable | None = None,
+    ) -> Iterator:
+        """
+        Same as :py:meth:`to_start_finish` for a list that is already sorted,
+        yielding one joined tuple at a time.
 
-        if join_func is None:
-            join_func = lambda list_tup: tuple(list(list_tup[0]) + [list_tup[-1][pp]])
-        res_start_finish = [join_func(list_tup) for list_tup in all_periods]
-        return TupList(res_start_finish)
+        :param callable compare_tups: returns True if tups are not consecutive. Takes 3 arguments
+        :param int pp: the position in the tuple where the period is
+        :param callable join_func: returns joined tuple from list of consecutive tuples. Takes 1 argument.
+        :return: an iterator of tuples
+        """
+        return _iter_start_finish(self, compare_tups, pp, join_func)
 
     def to_list(self) -> List[T]:
         """
@@ -319,6 +1004,30 @@ class TupList(list, Generic[T]):
         """
         return set(self)
 
+    def lazy(self) -> "LazyTupList":
+        """
+        Starts a lazy pipeline over the list: vfilter, vapply, take, vapply_col and chain
+        are recorded and run in a single pass when the result is collected.
+
+        >>> TupList([(1, 2), (3, 4)]).lazy().vfilter(lambda v: v[0] > 1).take(1).collect()
+        [4]
+
+        :return: new :py:class:`pytups.lazy.LazyTupList`
+        """
+        from .lazy import LazyTupList
+
+        return LazyTupList(self)
+
+    def to_columnar(self) -> "ColumnarTupList":
+        """
+        Stores the tuples column by column to save memory.
+
+        :return: new :py:class:`pytups.columnar.ColumnarTupList`
+        """
+        from .columnar import ColumnarTupList
+
+        return ColumnarTupList(self)
+
     def to_zip(self) -> zip:
         return zip(*self)
 
@@ -410,39 +1119,105 @@ class TupList(list, Generic[T]):
         """
         if len(self) == 0:
             return self
-        first = self[0]
-        if header is not None and len(first) != len(header):
-            raise ValueError("Header length does not match data length")
-        # Handle case of list of dict
-        if isinstance(first, dict):
-            if header is None:
-                header = first.keys()
-            header = list(cast(list, header))
-            thing_to_write = self.take(header)
-        else:
-            thing_to_write = self
-        with open(path, "w", newline="\n", encoding="utf-8") as out:
-            csv_out = csv.writer(out)
-            if header is not None:
-                csv_out.writerow(header)
-            csv_out.writerows(thing_to_write)
+        _write_csv(path, self[0], self, header)
         return self
 
     @classmethod
-    def from_csv(cls, path: str, func: Callable | None = None, **kwargs) -> "TupList":
+    def from_csv(
+        cls,
+        path: str,
+        func: Callable | None = None,
+        types: list | str | None = None,
+        chunksize: int | None = None,
+        **kwargs,
+    ) -> Union["TupList", Iterator["TupList"]]:
         """
         Generates a new TupList by reading a csv file
 
         :param str path: filename
         :param callable func: function to apply to each row
+        :param types: one function per column to convert its values (e.g. `[str, int, float]`)
+            or "infer" to guess them from the whole file (from the first rows with chunksize,
+            see :py:meth:`iter_csv`). Empty lines are skipped.
+            By default, values are kept as strings.
+        :param int chunksize: if given, returns an iterator of TupLists with at most
+            chunksize rows each, instead of a single TupList
         :param kwargs: arguments to csv.reader
         :return: new :py:class:`TupList`
         """
-        if func is None:
-            func = tuple
-        with open(path) as f:
-            data = cls(csv.reader(f, **kwargs)).vapply(func)
-        return data
+        if chunksize is not None:
+            return cls.iter_csv(path, func, types, chunksize=chunksize, **kwargs)
+        if types != "infer":
+            return cls(cls.iter_csv(path, func, types, **kwargs))
+        # all the rows are read before converting them, so they all get the same types
+        with open(path, newline="") as f:
+            rows = list(filter(None, csv.reader(f, **kwargs)))
+        if not rows:
+            return cls()
+        result = _convert_columns(rows, _infer_types(rows))
+        if func is not None:
+            result = map(func, result)
+        return cls(result)
+
+    @classmethod
+    def iter_csv(
+        cls,
+        path: str,
+        func: Callable | None = None,
+        types: list | str | None = None,
+        chunksize: int | None = None,
+        **kwargs,
+    ) -> Iterator:
+        """
+        Reads a csv file a few rows at a time, so the memory used does not depend on its size.
+        Values are converted one column at a time.
+
+        >>> TupList.iter_csv('data.csv', types=[str, int]) # doctest: +SKIP
+
+        :param str path: filename
+        :param callable func: function to apply to each row. It gets a list of strings if
+            types is None and a tuple of converted values otherwise
+        :param types: one function per column to convert its values (e.g. `[str, int, float]`)
+            or "infer" to guess them from the first rows. When later rows do not fit (a 1.5 in
+            a column of ints), their column is read with the wider type from there on: the rows
+            already yielded keep their types. Use :py:meth:`from_csv` without chunksize to
+            get the same types in all rows. Empty lines are skipped.
+            By default, values are kept as strings.
+        :param int chunksize: if given, TupLists of at most chunksize rows are yielded
+            instead of single rows
+        :param kwargs: arguments to csv.reader
+        :return: a generator of tuples (or of :py:class:`TupList`)
+        """
+        size = chunksize or _CSV_CHUNKSIZE
+        infer = types == "infer"
+        with open(path, newline="") as f:
+            reader: Iterator = csv.reader(f, **kwargs)
+            if types is not None:
+                # empty lines give empty rows, that can't be converted
+                reader = filter(None, reader)
+            while True:
+                chunk = list(islice(reader, size))
+                if not chunk:
+                    break
+                if types == "infer":
+                    types = _infer_types(chunk)
+                if types is None:
+                    rows: Iterable = chunk if func is not None else map(tuple, chunk)
+                elif infer:
+                    try:
+                        rows = list(_convert_columns(chunk, cast(list, types)))
+                    except ValueError:
+                        # these rows have other values, like a 1.5 in a column of ints
+                        types = _widen_types(cast(list, types), _infer_types(chunk))
+                        rows = list(_convert_columns(chunk, types))
+                else:
+                    rows = _convert_columns(chunk, cast(list, types))
+                if func is not None:
+                    rows = map(func, rows)
+                if chunksize:
+                    yield cls(rows)
+                else:
+                    yield from rows
 
     def vapply_col(self, pos: Union[int, str, None], func: Callable):
         """
@@ -451,22 +1226,79 @@ class TupList(list, Generic[T]):
         :param pos: int or str
         :param callable func: function to apply to create col
         """
+        result = self.vapply(_col_setter(pos, func))
+        self._changed()
+        return result
 
-        def apply_to_tup(my_tuple):
-            # we apply the function before any potential modification
-            result = func(my_tuple)
-            # if it's un-mutable (tuple), we need to make it a list
-            tuple_flag = 0
-            if isinstance(my_tuple, tuple):
-                tuple_flag = 1
-                my_tuple = list(my_tuple)
-            # if None, we assume we want it at the end
-            if tuple_flag and pos is None:
-                my_tuple.append(result)
-            else:
-                my_tuple[pos] = result
-            if tuple_flag:
-                my_tuple = tuple(my_tuple)
-            return my_tuple
 
-        return self.vapply(apply_to_tup)
+class TrackedTupList(TupList[T]):
+    """
+    A :py:class:`TupList` that tells its indexes (see :py:meth:`TupList.index_on`)
+    and cached columns (see :py:meth:`TupList.column_np`) when it's modified.
+    Elements added at the end are indexed as they come, any other change
+    makes the indexes rebuild themselves on the next lookup.
+
+    Only the list methods are seen: changes made inside the elements are not.
+    Each modification costs a bit more than in a :py:class:`TupList`.
+    Create one with :py:meth:`TupList.tracked`.
+    """
+
+    def _grown(self, start: int) -> None:
+        # new elements were added at the end, from position start
+        self._column_cache = None
+        if self._indexes:
+            for index in self._indexes.values():
+                index._extend(start)
+
+    def append(self, element: T) -> None:
+        list.append(self, element)
+        if self._indexes or self._column_cache:
+            self._grown(len(self) - 1)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        start = len(self)
+        list.extend(self, iterable)
+        if self._indexes or self._column_cache:
+            self._grown(start)
+
+    def __iadd__(self, iterable: Iterable[T]) -> "TrackedTupList[T]":  # type: ignore[override]
+        self.extend(iterable)
+        return self
+
+    def __setitem__(self, key, value) -> None:
+        list.__setitem__(self, key, value)
+        self._changed()
+
+    def __delitem__(self, key) -> None:
+        list.__delitem__(self, key)
+        self._changed()
+
+    def __imul__(self, value: SupportsIndex) -> "TrackedTupList[T]":  # type: ignore[override]
+        list.__imul__(self, value)
+        self._changed()
+        return self
+
+    def insert(self, index: SupportsIndex, element: T) -> None:
+        list.insert(self, index, element)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> T:
+        element = list.pop(self, index)
+        self._changed()
+        return element
+
+    def remove(self, element: T) -> None:
+        list.remove(self, element)
+        self._changed()
+
+    def clear(self) -> None:
+        list.clear(self)
+        self._changed()
+
+    def sort(self, *args, **kwargs) -> None:
+        list.sort(self, *args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._changed()
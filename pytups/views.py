@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Mapping, Tuple, TYPE_CHECKING
+
+from . import tools
+
+if TYPE_CHECKING:
+    from .superdict import SuperDict
+
+Predicate = Callable[[Tuple[Any, Any]], bool]
+
+
+class SuperDictView(Mapping):
+    """
+    A filtered view of a dictionary.
+
+    Each filter returns a new :py:class:`SuperDictView` with one more condition.
+    Nothing is copied: the conditions are checked over the original dictionary every time
+    the view is read, so the view sees the changes made to it.
+    A new :py:class:`pytups.superdict.SuperDict` is only built with :py:meth:`collect` or
+    when the view itself is modified. From then on, the view has its own copy.
+    """
+
+    # True once the view has its own copy of the elements
+    _owned = False
+
+    def __init__(self, data: dict, conditions: Tuple[Predicate, ...] = ()):
+        """
+        :param dict data: the dictionary to filter
+        :param conditions: functions that take a (key, value) pair and return True to keep it
+        """
+        self._data = data
+        self._conditions = conditions
+
+    def _then(self, condition: Predicate) -> "SuperDictView":
+        return SuperDictView(self._data, self._conditions + (condition,))
+
+    def _keep(self, key, value) -> bool:
+        pair = (key, value)
+        return all(condition(pair) for condition in self._conditions)
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if not self._keep(key, value):
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator:
+        return map(itemgetter(0), self.items())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def __repr__(self) -> str:
+        return "SuperDictView({} conditions)".format(len(self._conditions))
+
+    def __setitem__(self, key, value) -> None:
+        self._own()[key] = value
+
+    def __delitem__(self, key) -> None:
+        del self._own()[key]
+
+    def _own(self) -> "SuperDict":
+        """
+        Copies the filtered elements so they can be modified without touching the original dictionary.
+        """
+        if not self._owned:
+            self._data = self.collect()
+            self._conditions = ()
+            self._owned = True
+        return self._data
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:  # type: ignore[override]
+        pairs: Iterator = iter(self._data.items())
+        for condition in self._conditions:
+            pairs = filter(condition, pairs)
+        return pairs
+
+    def values(self) -> Iterator:  # type: ignore[override]
+        return map(itemgetter(1), self.items())
+
+    def keys_l(self) -> list:
+        """
+        :return: list with keys
+        """
+        return list(self)
+
+    def values_l(self) -> list:
+        """
+        :return: list with values
+        """
+        return list(self.values())
+
+    def view(self) -> "SuperDictView":
+        return self
+
+    def vfilter(self, func: Callable, **kwargs) -> "SuperDictView":
+        """
+        keeps the elements with a value for which `func` returns True
+
+        :param callable func: True for values we want to keep
+        :param kwargs: other arguments for func
+        :return: new :py:class:`SuperDictView`
+        """
+        if kwargs:
+            return self._then(lambda pair: func(pair[1], **kwargs))
+        return self._then(lambda pair: func(pair[1]))
+
+    def kfilter(self, func: Callable, **kwargs) -> "SuperDictView":
+        """
+        keeps the elements with a key for which `func` returns True
+
+        :param callable func: True for keys we want to keep
+        :param kwargs: other arguments for func
+        :return: new :py:class:`SuperDictView`
+        """
+        if kwargs:
+            return self._then(lambda pair: func(pair[0], **kwargs))
+        return self._then(lambda pair: func(pair[0]))
+
+    def kvfilter(self, func: Callable, **kwargs) -> "SuperDictView":
+        """
+        keeps the elements for which `func` returns True
+
+        :param callable func: takes the key and the value. True for elements we want to keep
+        :param kwargs: other arguments for func
+        :return: new :py:class:`SuperDictView`
+        """
+        return self._then(lambda pair: func(pair[0], pair[1], **kwargs))
+
+    def filter(self, indices: Iterable | Any, check: bool = True) -> "SuperDictView":
+        """
+        keeps only the elements in `indices`
+
+        :param indices: keys to keep
+        :param bool check: if True, raise a KeyError if some of them are not in the dictionary
+        :return: new :py:class:`SuperDictView`
+        """
+        if not tools.is_really_iterable(indices):
+            indices = {indices}
+        else:
+            indices = set(indices)
+        if check:
+            difference = [k for k in indices if k not in self]
+            if difference:
+                raise KeyError("following elements not in keys: {}".format(set(difference)))
+        return self._then(lambda pair: pair[0] in indices)
+
+    def clean(self, default_value=0, func: Callable | None = None, **kwargs) -> "SuperDictView":
+        """
+        takes out the elements with `default_value` (or for which `func` returns False)
+
+        :param default_value: value of elements to take out
+        :param function func: function that evaluates to true if we keep the element
+        :param kwargs: optional arguments for func
+        :return: new :py:class:`SuperDictView`
+        """
+        if func is None:
+            return self._then(lambda pair: pair[1] != default_value)
+        return self.vfilter(func, **kwargs)
+
+    def collect(self) -> "SuperDict":
+        """
+        Copies the elements that pass all the filters.
+
+        :return: new :py:class:`pytups.superdict.SuperDict`
+        """
+        from . import superdict as sd
+
+        return sd.SuperDict(self.items())
@@ -0,0 +1,120 @@
+import unittest
+import pytups as pt
+import os
+
+TEST_TUP = [
+    ("a", "b", "c", 1),
+    ("a", "b", "c", 2),
+    ("a", "b", "c", 3),
+    ("r", "b", "c", 1),
+    ("r", "b", "c", 2),
+    ("r", "b", "c", 3),
+]
+
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class ColumnarTest(unittest.TestCase):
+    tuplist_class = pt.ColumnarTupList
+
+    def setUp(self):
+        self.prop1 = self.tuplist_class(TEST_TUP)
+        self.tmpcsv = "tmp_columnar.csv"
+
+    def tearDown(self):
+        try:
+            os.remove(self.tmpcsv)
+        except FileNotFoundError:
+            pass
+
+    def test_rows(self):
+        self.assertEqual(len(self.prop1), 6)
+        self.assertEqual(self.prop1[1], ("a", "b", "c", 2))
+        self.assertEqual(self.prop1[-1], ("r", "b", "c", 3))
+        self.assertListEqual(list(self.prop1), TEST_TUP)
+
+    def test_from_tuplist(self):
+        prop = pt.TupList(TEST_TUP).to_columnar()
+        self.assertIsInstance(prop, pt.ColumnarTupList)
+        self.assertEqual(prop.to_tuplist(), TEST_TUP)
+
+    def test_chunks(self):
+        prop = self.tuplist_class(TEST_TUP, chunksize=4)
+        self.assertEqual(prop, TEST_TUP)
+
+    def test_mixed_column(self):
+        data = [(1, 2), (2, 2.5), (3, "a")]
+        prop = self.tuplist_class(data, chunksize=1)
+        self.assertEqual(prop.to_list(), data)
+        self.assertIs(type(prop[0][1]), int)
+
+    def test_equal_values_of_other_types(self):
+        data = [(1, "a"), (1.0, "b"), (True, "c"), (1, "a")]
+        prop = self.tuplist_class(data)
+        self.assertEqual(prop.to_list(), data)
+        self.assertListEqual([type(row[0]) for row in prop], [int, float, bool, int])
+        self.assertEqual(prop.unique().to_list(), pt.TupList(data).unique())
+        self.assertEqual(prop.sorted().to_list(), sorted(data))
+        later = self.tuplist_class([(1, "a"), (2, "b"), (1.0, "c")], chunksize=2)
+        self.assertIs(type(later[2][0]), float)
+
+    def test_huge_ints(self):
+        data = [(1, 2), (2, 3), (3, 4), (4, 2**70)]
+        prop = self.tuplist_class(data, chunksize=2)
+        self.assertEqual(prop.to_list(), data)
+        self.assertEqual(len(prop), 4)
+
+    def test_bad_length(self):
+        self.assertRaises(ValueError, self.tuplist_class, [(1, 2), (1, 2, 3)])
+
+    def test_take(self):
+        result = [(1, "a"), (2, "a"), (3, "a"), (1, "r"), (2, "r"), (3, "r")]
+        self.assertEqual(self.prop1.take([3, 0]), result)
+        self.assertListEqual(self.prop1.take(3), [1, 2, 3, 1, 2, 3])
+
+    def test_vfilter(self):
+        result = [("a", "b", "c", 1), ("a", "b", "c", 2), ("a", "b", "c", 3)]
+        self.assertEqual(self.prop1.vfilter(lambda x: x[0] <= "a"), result)
+
+    def test_to_dict(self):
+        result = {("a", "b", "c"): [1, 2, 3], ("r", "b", "c"): [1, 2, 3]}
+        self.assertDictEqual(result, self.prop1.to_dict(result_col=3))
+        reference = pt.TupList(TEST_TUP).to_dict(result_col=[0, 3], indices=2)
+        self.assertDictEqual(reference, self.prop1.to_dict(result_col=[0, 3], indices=2))
+
+    def test_to_dict_nolist(self):
+        result = {("a", "b", "c"): 3, ("r", "b", "c"): 3}
+        self.assertDictEqual(result, self.prop1.to_dict(result_col=3, is_list=False))
+
+    def test_sorted(self):
+        prop = self.tuplist_class([("b", 2), ("a", 3), ("b", 1), ("a", 1)])
+        self.assertEqual(prop.sorted(), [("a", 1), ("a", 3), ("b", 1), ("b", 2)])
+        self.assertEqual(
+            prop.sorted(key=lambda x: x[1], reverse=True),
+            [("a", 3), ("b", 2), ("b", 1), ("a", 1)],
+        )
+
+    def test_unique(self):
+        prop = self.prop1.take([0, 1])
+        self.assertEqual(prop.unique(), [("a", "b"), ("r", "b")])
+
+    def test_write(self):
+        self.prop1.to_csv(self.tmpcsv, header=["A", "B", "C", "D"])
+        with open(self.tmpcsv) as f:
+            content = f.read()
+        result = "A,B,C,D\na,b,c,1\na,b,c,2\na,b,c,3\nr,b,c,1\nr,b,c,2\nr,b,c,3\n"
+        self.assertEqual(result, content)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_to_numpy(self):
+        self.assertListEqual(self.prop1.to_numpy(3).tolist(), [1, 2, 3, 1, 2, 3])
+        self.assertListEqual(self.prop1.to_numpy(0).tolist(), list("aaarrr"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,21 @@
 # Some of these tests were inspired from the addict package
 # https://github.com/mewwts/addict
 
+import io
 import json
 import copy
+import operator as op
 import unittest
 import pickle
 import pytups as pt
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 TEST_VAL = [1, 2, 3]
 TEST_VAL2 = 4
 TEST_DICT = {"a": {"b": {"c": TEST_VAL}}}
@@ -25,6 +34,21 @@ class DictTest(unittest.TestCase):
         prop = self.dict_class.from_dict(TEST_DICT).to_dictup()
         self.assertDictEqual(prop, {("a", "b", "c"): TEST_VAL})
 
+    def test_dictup_depth(self):
+        prop = self.dict_class.from_dict(TEST_DICT_2)
+        self.assertDictEqual(
+            prop.to_dictup(), {("a", "b", "c"): TEST_VAL, ("b", ("c", "t"), "d"): TEST_VAL2}
+        )
+        result = prop.to_dictup(max_depth=2)
+        self.assertDictEqual(result, {("a", "b"): {"c": TEST_VAL}, ("b", ("c", "t")): {"d": TEST_VAL2}})
+        self.assertListEqual(list(prop.iter_flat(max_depth=1)), [(("a",), prop["a"]), (("b",), prop["b"])])
+        self.assertRaises(ValueError, prop.iter_flat, max_depth=0)
+
+    def test_dicts_to_tup(self):
+        prop = self.dict_class().dicts_to_tup(["x"], {"a": {"b": 1}, "c": 2})
+        self.assertDictEqual(prop, {("x", "a", "b"): 1, ("x", "c"): 2})
+        self.assertDictEqual(self.dict_class().dicts_to_tup(["x"], 3), {("x",): 3})
+
     def test_tuplist(self):
         prop = self.dict_class.from_dict(TEST_DICT).to_dictup().to_tuplist()
         self.assertListEqual(
@@ -54,6 +78,27 @@ class DictTest(unittest.TestCase):
         prop = self.dict_class.from_dict(TEST_DICT_3).to_dictdict()
         self.assertDictEqual(prop, {"ABC": {"a": {"b": {"c": TEST_VAL2}}}})
 
+    def test_to_dictdict_not_modified(self):
+        prop = self.dict_class.from_dict({"b": {("c", "t"): {("d", "e"): 1}}, ("b", "f"): 2})
+        prop2 = prop.copy_deep()
+        result = prop.to_dictdict()
+        self.assertDictEqual(result, {"b": {"c": {"t": {"d": {"e": 1}}}, "f": 2}})
+        self.assertIsInstance(result["b"]["c"], self.dict_class)
+        self.assertDictEqual(prop, prop2)
+
+    def test_to_dictdict_deep(self):
+        prop = value = self.dict_class()
+        for i in range(5000):
+            value[(i, "x")] = value = self.dict_class()
+        result = prop.to_dictdict()
+        self.assertIn("x", result[0])
+
+    def test_dump_json(self):
+        prop = self.dict_class({("a", "b"): 1, ("a", "c"): [2, 3], "d": {("e", "f"): 4}})
+        out = io.StringIO()
+        prop.dump_json(out)
+        self.assertDictEqual(json.loads(out.getvalue()), prop.to_dictdict())
+
     def test_set_one_level_item(self):
         some_dict = {"a": TEST_VAL}
         prop = self.dict_class()
@@ -436,6 +481,32 @@ class DictTest(unittest.TestCase):
         copy["a"]["b"] = 1
         self.assertEqual(type(original["a"]["b"]), self.dict_class)
 
+    def test_copy_deep_structure(self):
+        shared = [1, 2]
+        leaf = ("a", 1)
+        original = self.dict_class(
+            {"a": shared, "b": shared, "c": leaf, "d": pt.TupList([leaf]), "e": {("x", 1): {3}}}
+        )
+        original["f"] = original
+        copy = original.copy_deep()
+        self.assertIsInstance(copy, self.dict_class)
+        self.assertIsInstance(copy["d"], pt.TupList)
+        self.assertIs(copy["a"], copy["b"])
+        self.assertIsNot(copy["a"], shared)
+        self.assertIs(copy["c"], leaf)
+        self.assertIs(copy["d"][0], leaf)
+        self.assertIs(copy["f"], copy)
+        copy["e"][("x", 1)].add(4)
+        self.assertSetEqual(original["e"][("x", 1)], {3})
+
+    def test_copy_deep_tuples(self):
+        inner = ([1], 2)
+        original = self.dict_class({"a": inner, "b": inner, "c": (inner, "x")})
+        copy = original.copy_deep()
+        self.assertIs(copy["a"], copy["b"])
+        self.assertIs(copy["c"][0], copy["a"])
+        self.assertIsNot(copy["a"][0], inner[0])
+
     def test_copy_deep2(self):
         original = self.dict_class.from_dict(TEST_DICT)
         copy = original.copy_deep2()
@@ -579,6 +650,250 @@ class DictTest(unittest.TestCase):
         c = a * "2"
         self.assertEqual(c, {"a": "22"})
 
+    def test_sapply_how(self):
+        a = self.dict_class({"a": 1, "b": 2})
+        b = {"b": 3, "c": 4}
+        self.assertRaises(KeyError, a.sapply, op.add, b)
+        self.assertDictEqual(a.sapply(op.add, b, fill_value=0), {"a": 1, "b": 5})
+        self.assertDictEqual(a.sapply(op.add, b, how="inner"), {"b": 5})
+        c = a.sapply(op.sub, b, how="outer", fill_value=0)
+        self.assertDictEqual(c, {"a": 1, "b": -1, "c": -4})
+        self.assertListEqual(c.keys_l(), ["a", "b", "c"])
+        self.assertRaises(KeyError, a.sapply, op.add, b, how="outer")
+        self.assertRaises(ValueError, a.sapply, op.add, b, how="right")
+
+    def test_inplace(self):
+        a = self.dict_class({"a": 1, "b": 2})
+        c = a
+        a += {"a": 10, "b": 20}
+        a -= 1
+        a *= self.dict_class({"b": 2, "a": 3})
+        self.assertIs(a, c)
+        self.assertDictEqual(a, {"a": 30, "b": 42})
+        with self.assertRaises(KeyError):
+            a += {"a": 1}
+        self.assertDictEqual(a, {"a": 30, "b": 42})
+        a.sapply_inplace(op.add, {"b": 1, "d": 5}, how="outer", fill_value=0)
+        self.assertDictEqual(a, {"a": 30, "b": 43, "d": 5})
+
+    def test_view(self):
+        a = self.dict_class({"a": 2, "b": 3, "c": 1, "d": 0})
+        view = a.view().vfilter(lambda v: v > 1)
+        self.assertIsInstance(view, pt.SuperDictView)
+        self.assertDictEqual(view.collect(), a.vfilter(lambda v: v > 1))
+        self.assertDictEqual(view.kfilter(lambda k: k > "a").collect(), {"b": 3})
+        self.assertDictEqual(a.view().clean().collect(), a.clean())
+        self.assertDictEqual(a.view().kvfilter(lambda k, v: v and k < "c").collect(), {"a": 2, "b": 3})
+        self.assertDictEqual(a.view().filter(["a", "d"]).collect(), {"a": 2, "d": 0})
+        self.assertRaises(KeyError, a.view().filter, ["a", "e"])
+        self.assertDictEqual(a.view().filter(["a", "e"], check=False).collect(), {"a": 2})
+        self.assertEqual(len(view), 2)
+        self.assertIn("a", view)
+        self.assertNotIn("c", view)
+        self.assertRaises(KeyError, lambda: view["c"])
+        # the view sees the changes in the dictionary
+        a["c"] = 5
+        self.assertListEqual(view.keys_l(), ["a", "b", "c"])
+
+    def test_view_copy_on_write(self):
+        a = self.dict_class({"a": 2, "b": 3, "c": 1})
+        view = a.view().vfilter(lambda v: v > 1)
+        view["z"] = 0
+        del view["a"]
+        self.assertDictEqual(a, {"a": 2, "b": 3, "c": 1})
+        self.assertDictEqual(view.collect(), {"b": 3, "z": 0})
+
+    def test_accessor(self):
+        data = self.dict_class.from_dict({"cost": {"a": {1: 10, 2: 20}, "b": {1: 30}}, "other": 1})
+        acc = data.accessor("cost", ..., ...)
+        self.assertEqual(acc.get("a", 2), 20)
+        self.assertIsNone(acc.get("c", 2))
+        self.assertEqual(acc.get("c", 2, default=0), 0)
+        self.assertListEqual(acc.get_many([("a", 1), ("b", 1), ("b", 2)]), [10, 30, None])
+        self.assertRaises(TypeError, acc.get, "a")
+        acc.set("c", 1, value=5)
+        self.assertEqual(data["cost"]["c"][1], 5)
+        self.assertEqual(data.accessor(..., ...).get("cost", "b"), {1: 30})
+        self.assertEqual(self.dict_class(a=[1, 2]).accessor("a", ...).get(1), 2)
+
+    def test_accessor_cache(self):
+        plain = self.dict_class.from_dict({"cost": {"a": {1: 10, 2: 20}, "b": {1: 30}}})
+        self.assertRaises(TypeError, plain.accessor("cost", ..., ..., cache=True).get, "a", 2)
+        data = plain.tracked()
+        acc = data.accessor("cost", ..., ..., cache=True)
+        self.assertEqual(acc.get("a", 2), 20)
+        self.assertListEqual(acc.get_many([("a", 1), ("b", 1)]), [10, 30])
+        # writes through the accessor keep the cache
+        acc.set("a", 1, value=11)
+        self.assertIsNotNone(acc._flat)
+        self.assertEqual(acc.get("a", 1), 11)
+        self.assertEqual(data["cost"]["a"][1], 11)
+        # other writes drop it
+        data["cost"]["b"][1] = 31
+        self.assertIsNone(acc._flat)
+        self.assertEqual(acc.get("b", 1), 31)
+        del data["cost"]["a"]
+        self.assertIsNone(acc.get("a", 2))
+        acc.set("c", 1, value=5)
+        self.assertIsInstance(data["cost"]["c"], pt.TrackedSuperDict)
+        self.assertEqual(acc.get("c", 1), 5)
+        # the original dictionary was copied
+        self.assertEqual(plain["cost"]["b"][1], 30)
+        self.assertIs(type(plain["cost"]), self.dict_class)
+        copied = pickle.loads(pickle.dumps(data))
+        self.assertIs(type(copied), pt.TrackedSuperDict)
+        self.assertIsNone(copied._watchers)
+        acc.invalidate()
+        self.assertListEqual(data["cost"]._watchers, [])
+
+    def test_list_reverse(self):
+        data = self.dict_class(t1=["m1", "m2"], t2=["m1"], t3=["m2", "m2"])
+        result = data.list_reverse()
+        self.assertDictEqual(result, {"m1": ["t1", "t2"], "m2": ["t1", "t3", "t3"]})
+        self.assertIsInstance(result["m1"], pt.TupList)
+        self.assertDictEqual(data.inverted_index(sync=False).to_dict(), result)
+
+    def test_inverted_index(self):
+        plain = self.dict_class(t1=["m1", "m2"], t2=["m1"])
+        self.assertRaises(TypeError, plain.inverted_index, sync=True)
+        data = plain.tracked()
+        index = data.inverted_index()
+        self.assertListEqual(index["m1"], ["t1", "t2"])
+        data["t3"] = ["m3", "m1"]
+        del data["t1"]
+        self.assertListEqual(index["m1"], ["t2", "t3"])
+        self.assertNotIn("m2", index)
+        self.assertListEqual(index.get("m2"), [])
+        index.add("t2", "m3")
+        index.add("t4", "m3")
+        index.remove("t3", "m1")
+        self.assertDictEqual(data, {"t2": ["m1", "m3"], "t3": ["m3"], "t4": ["m3"]})
+        self.assertListEqual(index["m3"], ["t3", "t2", "t4"])
+        self.assertDictEqual(index.to_dict(), {"m1": ["t2"], "m3": ["t3", "t2", "t4"]})
+        data.pop("t4")
+        data.clear()
+        self.assertEqual(len(index), 0)
+        index.close()
+        self.assertListEqual(data._watchers, [])
+        self.assertIs(type(data), pt.TrackedSuperDict)
+
+    def test_inverted_index_out_of_sync(self):
+        data = self.dict_class(a=[1, 2], b=[2]).tracked()
+        index = data.inverted_index()
+        self.assertListEqual(index[2], ["a", "b"])
+        # the index did not see this, but writes still work
+        data["a"].append(9)
+        data["a"] = [5]
+        data["c"] = [2, 2]
+        self.assertDictEqual(index.to_dict(), {5: ["a"], 2: ["b", "c", "c"]})
+        index.remove("c", 2)
+        del data["b"]
+        self.assertListEqual(index[2], ["c"])
+
+    def test_index_by_part_of_tuple(self):
+        data = self.dict_class({(1, "a"): 2, (1, "b"): 3, (2, "a"): 4})
+        result = data.index_by_part_of_tuple(1)
+        self.assertDictEqual(result, {"a": {(1, "a"): 2, (2, "a"): 4}, "b": {(1, "b"): 3}})
+        self.assertIsInstance(result["a"], self.dict_class)
+        self.assertListEqual(data.index_by_part_of_tuple(0, get_list=True), [{(1, "a"): 2, (1, "b"): 3}, {(2, "a"): 4}])
+        both = data.index_by_parts_of_tuple([0, 1])
+        self.assertDictEqual(both[1], result)
+        self.assertRaises(IndexError, data.index_by_part_of_tuple, 2)
+        self.assertRaises(IndexError, self.dict_class().index_by_part_of_tuple, 0)
+
+    def test_index_by_cache(self):
+        plain = self.dict_class({(1, "a"): {"p": 1}, (1, "b"): {"p": 2}})
+        self.assertRaises(TypeError, plain.index_by_part_of_tuple, 0, cache=True)
+        data = plain.tracked()
+        first = data.index_by_part_of_tuple(0, cache=True)
+        self.assertIs(data.index_by_part_of_tuple(0), first)
+        self.assertIsNot(data.index_by_part_of_tuple(1), data.index_by_part_of_tuple(1))
+        by_p = data.index_by_property("p", cache=True)
+        self.assertIs(data.index_by_property("p"), by_p)
+        self.assertDictEqual(by_p, {1: {(1, "a"): {"p": 1}}, 2: {(1, "b"): {"p": 2}}})
+        data[(2, "a")] = {"p": 1}
+        self.assertIsNot(data.index_by_part_of_tuple(0), first)
+        self.assertDictEqual(data.index_by_part_of_tuple(0, cache=True)[2], {(2, "a"): {"p": 1}})
+        self.assertEqual(len(data.index_by_property("p")[1]), 2)
+        self.assertIsNone(pickle.loads(pickle.dumps(data))._index_cache)
+
+    def test_tracked_subclass(self):
+        class MyDict(self.dict_class):
+            def hello(self):
+                return "hello"
+
+        data = MyDict(t1=["m1"], t2=["m1", "m2"])
+        index = data.inverted_index()
+        self.assertListEqual(index["m1"], ["t1", "t2"])
+        index.close()
+        self.assertIs(type(data), MyDict)
+        self.assertEqual(data.hello(), "hello")
+
+        class MyTrackedDict(pt.TrackedSuperDict, MyDict):
+            pass
+
+        tracked = MyTrackedDict(data)
+        index = tracked.inverted_index()
+        tracked["t3"] = ["m2"]
+        self.assertListEqual(index["m2"], ["t2", "t3"])
+        self.assertEqual(tracked.hello(), "hello")
+
+    def test_fill_with_default_lazy(self):
+        data = self.dict_class({("t1", 2): 5, ("t3", 1): 7})
+        keys = pt.KeyProduct(["t1", "t2"], [1, 2])
+        lazy = data.fill_with_default(keys, default=0, lazy=True)
+        self.assertIsInstance(lazy, pt.DefaultSuperDict)
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(len(lazy), 5)
+        self.assertEqual(lazy[("t1", 2)], 5)
+        self.assertEqual(lazy[("t2", 2)], 0)
+        self.assertRaises(KeyError, lambda: lazy[("t3", 2)])
+        self.assertIn(("t3", 1), lazy)
+        self.assertNotIn("t1", lazy)
+        full = data.fill_with_default(list(keys), default=0)
+        self.assertDictEqual(lazy.to_superdict(), full)
+        self.assertListEqual(list(lazy)[:2], [("t1", 1), ("t1", 2)])
+        self.assertListEqual(sorted(lazy.to_tuplist()), sorted(full.to_tuplist()))
+
+    def test_default_dict_apply(self):
+        keys = pt.KeyProduct(["t1", "t2"], [1, 2])
+        a = self.dict_class({("t1", 2): 5}).fill_with_default(keys, default=1, lazy=True)
+        b = self.dict_class({("t2", 1): 3}).fill_with_default(keys, default=2, lazy=True)
+        c = a.vapply(lambda v: v * 10)
+        self.assertIsInstance(c, pt.DefaultSuperDict)
+        self.assertEqual(c.default, 10)
+        self.assertDictEqual(c.data, {("t1", 2): 50})
+        d = a.sapply(op.add, b)
+        self.assertIsInstance(d, pt.DefaultSuperDict)
+        self.assertDictEqual(d.to_superdict(), a.to_superdict() + b.to_superdict())
+        self.assertDictEqual(a.sapply(op.mul, 2).to_superdict(), a.to_superdict() * 2)
+        e = a.sapply(op.add, b.to_superdict())
+        self.assertIsInstance(e, pt.SuperDict)
+        self.assertDictEqual(e, d.to_superdict())
+        same_keys = pt.KeyProduct(["t1", "t2"], [1, 2])
+        g = a.sapply(op.add, self.dict_class().fill_with_default(same_keys, default=2, lazy=True))
+        self.assertIsInstance(g, pt.DefaultSuperDict)
+        self.assertDictEqual(g.data, {("t1", 2): 7})
+        outside = self.dict_class({("t3", 1): 4}).fill_with_default(keys, default=2, lazy=True)
+        f = a.sapply(op.add, outside)
+        self.assertNotIn(("t3", 1), f)
+        self.assertEqual(f[("t1", 2)], 7)
+
+    def test_default_dict_superdict_methods(self):
+        keys = pt.KeyProduct(["t1", "t2"], [1, 2])
+        a = self.dict_class({("t1", 2): 5}).fill_with_default(keys, default=1, lazy=True)
+        self.assertListEqual(sorted(a.values_l()), [1, 1, 1, 5])
+        self.assertEqual(a.vfilter(lambda v: v > 1), {("t1", 2): 5})
+        self.assertDictEqual(a.to_dictdict(), a.to_superdict().to_dictdict())
+        self.assertFalse(hasattr(a, "not_a_method"))
+        self.assertFalse(hasattr(a, "_not_a_method"))
+        self.assertRaises(TypeError, lambda: a.pop(("t1", 2)))
+        self.assertRaises(TypeError, lambda: a.update({("t1", 1): 3}))
+        self.assertRaises(TypeError, lambda: a.set_m("t1", 1, 3))
+        self.assertEqual(a[("t1", 2)], 5)
+        copied = copy.deepcopy(a)
+        self.assertDictEqual(copied.data, a.data)
+
     def setUp(self):
         pass
 
@@ -586,5 +901,48 @@ class DictTest(unittest.TestCase):
         pass
 
 
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class NumericDictTest(unittest.TestCase):
+    def setUp(self):
+        self.a = pt.SuperDict({"a": 1, "b": 2, "c": 3})
+        self.b = pt.SuperDict({"c": 30, "a": 10, "b": 20})
+
+    def test_operations(self):
+        a = self.a.as_array()
+        self.assertIsInstance(a, pt.NumericSuperDict)
+        self.assertDictEqual((a + 1).to_superdict(), self.a + 1)
+        self.assertDictEqual((a * a).to_superdict(), {"a": 1, "b": 4, "c": 9})
+        self.assertDictEqual((a - self.b.as_array()).to_superdict(), self.a - self.b)
+        self.assertDictEqual((a / self.b).to_superdict(), self.a / self.b)
+        self.assertDictEqual((10 // a).to_superdict(), {"a": 10, "b": 5, "c": 3})
+        self.assertDictEqual((-a).to_superdict(), {"a": -1, "b": -2, "c": -3})
+
+    def test_shared_keys(self):
+        a = self.a.as_array()
+        result = (a * 2 + a) / 3
+        self.assertIs(result._pos, a._pos)
+        self.assertListEqual(result.keys_l(), ["a", "b", "c"])
+        self.assertEqual(result["b"], 2.0)
+        self.assertEqual(result.sum(), 6.0)
+        self.assertIsInstance(result.to_superdict(), pt.SuperDict)
+
+    def test_mapping(self):
+        a = self.a.as_array()
+        self.assertEqual(a, self.a)
+        self.assertIn("a", a)
+        self.assertEqual(len(a), 3)
+        a["a"] = 5
+        self.assertEqual(a["a"], 5)
+        self.assertRaises(KeyError, a.__setitem__, "d", 1)
+        self.assertRaises(KeyError, lambda: a + {"a": 1})
+        self.assertDictEqual(a.vapply(np.square).to_superdict(), {"a": 25, "b": 4, "c": 9})
+        a["b"] = 2.5
+        self.assertEqual(a["b"], 2.5)
+        self.assertRaises(TypeError, a.__setitem__, "b", "x")
+
+    def test_not_numbers(self):
+        self.assertRaises(TypeError, pt.SuperDict({"a": "a"}).as_array)
+
+
 if __name__ == "__main__":
     unittest.main()
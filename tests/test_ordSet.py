@@ -1,6 +1,15 @@
+import copy
+import datetime as dt
 import unittest
 import pytups as pt
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 TEST_TUP = [
     ("a", "b", "c", 1),
     ("a", "b", "c", 2),
@@ -83,10 +92,212 @@ class OrdSetTest(unittest.TestCase):
         del self.dates1[3]
         self.assertListEqual(self.refDates1, self.dates1._pos)
 
+    def test_insert(self):
+        self.refDates1.insert(2, "2019-00")
+        self.dates1.insert(2, "2019-00")
+        self.assertListEqual(self.refDates1, self.dates1._pos)
+        self.assertEqual(self.dates1.ord("2019-00"), 2)
+        self.assertEqual(self.dates1.next("2019-00"), "2019-03")
+        self.assertRaises(ValueError, self.dates1.insert, 0, "2019-05")
+
+    def test_edit_negative(self):
+        self.dates1[-1] = "2019-10"
+        self.assertEqual(self.dates1.ord("2019-10"), 8)
+        self.assertRaises(ValueError, self.dates1.__setitem__, 0, "2019-05")
+
+    def test_many_edits(self):
+        dates = self.list_class(["d{}".format(i) for i in range(100)])
+        ref = list(dates)
+        for i in range(30):
+            del dates[i]
+            del ref[i]
+            dates.insert(50, "n{}".format(i))
+            ref.insert(50, "n{}".format(i))
+            self.assertEqual(dates.ord(ref[60]), 60)
+        del dates[10:20]
+        del ref[10:20]
+        self.assertListEqual(ref, dates._pos)
+        self.assertListEqual([dates.ord(v) for v in ref], list(range(len(ref))))
+        self.assertEqual(dates.index(ref[-1]), len(ref) - 1)
+        self.assertIn("n20", dates)
+        self.assertNotIn("d0", dates)
+
+    def test_append_no_shift(self):
+        for i in range(10):
+            self.dates1.append("2020-{}".format(i))
+        self.dates1.insert(len(self.dates1), "2021-01")
+        self.assertEqual(self.dates1._shifts, 0)
+        self.assertEqual(self.dates1.ord("2021-01"), 19)
+
+    def test_ord_after_slice_deletes(self):
+        dates = self.list_class(list(range(30)))
+        ref = list(range(30))
+        for pos in (25, 3, 12):
+            dates.insert(pos, 100 + pos)
+            ref.insert(pos, 100 + pos)
+        del dates[20:2:-3]
+        del ref[20:2:-3]
+        self.assertListEqual([dates.ord(v) for v in ref], list(range(len(ref))))
+
+    def test_splice(self):
+        removed = self.dates1.splice(2, 3, "a", "b")
+        self.assertListEqual(removed, self.refDates1[2:5])
+        self.refDates1[2:5] = ["a", "b"]
+        self.assertListEqual(self.refDates1, self.dates1._pos)
+        self.assertListEqual([self.dates1.ord(v) for v in self.refDates1], list(range(8)))
+        # the removed elements can come back
+        self.dates1.splice(0, 2, "2019-01", "c", "d")
+        self.assertEqual(self.dates1.ord("b"), 4)
+        self.assertListEqual(self.dates1.splice(-2), ["2019-08", "2019-09"])
+        self.assertRaises(ValueError, self.dates1.splice, 0, 0, "a")
+        self.assertRaises(ValueError, self.dates1.splice, 0, 0, "z", "z")
+
+    def test_ord_after_splice(self):
+        dates = self.list_class(list(range(15)))
+        dates.splice(5, 0, *range(20, 30))
+        del dates[:20:2]
+        ref = list(range(5)) + list(range(20, 30)) + list(range(5, 15))
+        del ref[:20:2]
+        self.assertListEqual([dates.ord(v) for v in ref], list(range(len(ref))))
+
+    def test_deepcopy(self):
+        class Node:
+            def __init__(self, value):
+                self.value = value
+
+        node = Node(1)
+        original = self.list_class([node, "a"])
+        shallow = original.copy()
+        deep = copy.deepcopy(original)
+        self.assertIs(shallow[0], node)
+        self.assertIsNot(deep[0], node)
+        self.assertEqual(deep[0].value, 1)
+        self.assertEqual(deep.ord("a"), 1)
+        self.assertEqual(deep.ord(deep[0]), 0)
+
+    def test_between(self):
+        window = self.dates1.between("2019-03", "2019-06")
+        self.assertEqual(len(window), 4)
+        self.assertEqual(window[0], "2019-03")
+        self.assertEqual(window[-1], "2019-06")
+        self.assertEqual(window, self.refDates1[2:6])
+        self.assertListEqual(window[1:].to_list(), self.refDates1[3:6])
+        self.assertIn("2019-04", window)
+        self.assertNotIn("2019-07", window)
+        self.assertEqual(window.index("2019-04"), 1)
+        self.assertEqual(window.positions(), range(2, 6))
+        self.assertEqual(len(self.dates1.between("2019-06", "2019-03")), 0)
+
+    @unittest.skipIf(not HAS_NUMPY, "numpy is not installed")
+    def test_between_numpy(self):
+        positions = self.dates1.between("2019-03", "2019-06").positions(use_numpy=True)
+        self.assertListEqual(positions.tolist(), [2, 3, 4, 5])
+
+    def test_slice_by_value(self):
+        self.assertEqual(self.dates1.slice_by_value("2019-03", "2019-06"), self.refDates1[2:5])
+        self.assertEqual(self.dates1.slice_by_value("2019-08"), self.refDates1[7:])
+        self.assertEqual(self.dates1.slice_by_value(value2="2019-02"), self.refDates1[:1])
+
+    @unittest.skipIf(not HAS_NUMPY, "numpy is not installed")
+    def test_ord_many(self):
+        values = ["2019-03", "2019-01", "2019-09"]
+        positions = self.dates1.ord_many(values)
+        self.assertListEqual(positions.tolist(), [self.dates1.ord(v) for v in values])
+        self.assertListEqual(self.prop1.ord_many(TEST_TUP[::-1]).tolist(), list(range(5, -1, -1)))
+        self.assertRaises(pt.MissingValue, self.dates1.ord_many, ["2019-03", "2018-01"])
+        positions = self.dates1.ord_many(["2019-03", "2018-01"], how="fill")
+        self.assertListEqual(positions.tolist(), [2, -1])
+        self.assertRaises(ValueError, self.dates1.ord_many, values, how="clip")
+        positions = self.dates1.ord_many(["2019-03", ["2019-01"]], how="fill")
+        self.assertListEqual(positions.tolist(), [2, -1])
+        self.assertRaises(pt.MissingValue, self.dates1.ord_many, [["2019-01"]])
+
+    @unittest.skipIf(not HAS_NUMPY, "numpy is not installed")
+    def test_next_many(self):
+        numbers = self.list_class([5, 3, 8, 1])
+        self.assertListEqual(numbers.next_many(np.array([5, 8])).tolist(), [3, 1])
+        self.assertListEqual(numbers.prev_many([8, 1], num=2).tolist(), [5, 3])
+        self.assertRaises(IndexError, numbers.next_many, [1])
+        self.assertListEqual(numbers.next_many([8, 1], how="clip").tolist(), [1, 1])
+        self.assertListEqual(numbers.prev_many([5, 4], how="fill", fill_value=0).tolist(), [0, 0])
+        self.assertRaises(pt.MissingValue, numbers.next_many, [4], how="clip")
+        self.assertListEqual(self.dates1.next_many(["2019-02"], num=3).tolist(), ["2019-05"])
+        result = self.prop1.next_many([TEST_TUP[0], TEST_TUP[-1]], how="fill")
+        self.assertListEqual(result.tolist(), [TEST_TUP[1], None])
+        # the arrays are rebuilt after a change
+        numbers.insert(1, 7)
+        self.assertListEqual(numbers.next_many([5]).tolist(), [7])
+
     def test_dist(self):
         self.assertEqual(self.dates1.dist("2019-01", "2019-09"), 8)
 
 
+class RangeOrdSetTest(unittest.TestCase):
+    def setUp(self):
+        self.periods = pt.RangeOrderSet(0, 10, step=2)
+        self.dates = pt.RangeOrderSet(dt.date(2024, 1, 1), 366, step=dt.timedelta(days=1))
+
+    def test_positions(self):
+        self.assertListEqual(list(self.periods), list(range(0, 20, 2)))
+        self.assertEqual(len(self.periods), 10)
+        self.assertEqual(self.periods[-1], 18)
+        self.assertListEqual(self.periods[:3], [0, 2, 4])
+        self.assertEqual(self.periods.ord(6), 3)
+        self.assertEqual(self.periods.next(6), 8)
+        self.assertEqual(self.periods.prev(6, 2), 2)
+        self.assertEqual(self.periods.dist(2, 10), 4)
+        self.assertEqual(self.periods.between(4, 10), [4, 6, 8, 10])
+        self.assertIn(6, self.periods)
+        self.assertNotIn(7, self.periods)
+        self.assertNotIn(20, self.periods)
+        self.assertRaises(pt.MissingValue, self.periods.ord, 7)
+
+    def test_dates(self):
+        self.assertEqual(self.dates.ord(dt.date(2024, 3, 1)), 60)
+        self.assertEqual(self.dates.next(dt.date(2024, 2, 28), 2), dt.date(2024, 3, 1))
+        self.assertEqual(self.dates[-1], dt.date(2024, 12, 31))
+        self.assertNotIn("2024-03-01", self.dates)
+
+    def test_read_only(self):
+        self.assertNotIsInstance(self.periods, pt.OrderSet)
+        self.assertFalse(hasattr(self.periods, "append"))
+        with self.assertRaises(TypeError):
+            self.periods[0] = 1
+        ordinary = self.periods.to_orderset()
+        self.assertNotIsInstance(ordinary, pt.RangeOrderSet)
+        ordinary.append(20)
+        self.assertEqual(ordinary.ord(20), 10)
+        self.assertEqual(ordinary.ord(18), 9)
+
+    @unittest.skipIf(not HAS_NUMPY, "numpy is not installed")
+    def test_ord_many(self):
+        self.assertListEqual(self.periods.ord_many(range(0, 20, 4)).tolist(), [0, 2, 4, 6, 8])
+        self.assertListEqual(self.periods.ord_many([7, 20, 6], how="fill").tolist(), [-1, -1, 3])
+        self.assertListEqual(self.periods.next_many([16, 18], how="clip").tolist(), [18, 18])
+        self.assertListEqual(self.dates.ord_many([dt.date(2024, 3, 1)]).tolist(), [60])
+        self.assertListEqual(self.periods.ord_many([[2], 2], how="fill").tolist(), [-1, 1])
+
+    def test_float_step(self):
+        self.assertRaises(TypeError, pt.RangeOrderSet, 0, 10, 0.1)
+
+    @unittest.skipIf(not HAS_NUMPY, "numpy is not installed")
+    def test_ord_many_big_ints(self):
+        periods = pt.RangeOrderSet(2**62, 4, step=2**61)
+        self.assertListEqual(list(periods.next_many([2**62], how="clip")), [2**62 + 2**61])
+        self.assertListEqual(periods.ord_many([2**62 + 2**62]).tolist(), [2])
+        self.assertListEqual(
+            self.periods.ord_many(np.array([2**63 - 1, 4]), how="fill").tolist(), [-1, 2]
+        )
+        small = pt.RangeOrderSet(-10, 10, step=2)
+        query = np.array([2**64 - 1, 2], dtype=np.uint64)
+        self.assertListEqual(small.ord_many(query, how="fill").tolist(), [-1, 6])
+
+    def test_from_range(self):
+        periods = pt.RangeOrderSet.from_range(range(10, 0, -3))
+        self.assertListEqual(list(periods), [10, 7, 4, 1])
+        self.assertEqual(periods.ord(4), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
     self = OrdSetTest()
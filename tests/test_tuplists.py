@@ -2,6 +2,13 @@ import unittest
 import pytups as pt
 import os
 
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 TEST_TUP = [
     ("a", "b", "c", 1),
     ("a", "b", "c", 2),
@@ -58,6 +65,42 @@ class TupTest(unittest.TestCase):
         result = [(1, "a"), (2, "a"), (3, "a"), (1, "r"), (2, "r"), (3, "r")]
         self.assertListEqual(result, self.prop1.take([3, 0]))
 
+    def test_filter_dict(self):
+        result = [("a", 1), ("a", 2), ("a", 3), ("r", 1), ("r", 2), ("r", 3)]
+        self.assertListEqual(result, self.prop2.take([1, 4]))
+        self.assertListEqual([("a",), ("a",), ("a",), ("r",), ("r",), ("r",)], self.prop2.take([1]))
+
+    def test_take_np(self):
+        with self.assertWarns(DeprecationWarning):
+            self.assertListEqual(self.prop1.take([3, 0]), self.prop1.take_np([3, 0]))
+        with self.assertWarns(DeprecationWarning):
+            self.assertListEqual(self.prop2.take([1, 4]), self.prop2.take_np([1, 4]))
+        with self.assertWarns(DeprecationWarning):
+            self.assertListEqual(self.prop1.take(3), self.prop1.take(3, use_numpy=True))
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_column_np(self):
+        column = self.prop1.column_np(3)
+        self.assertEqual(column.dtype.kind, "i")
+        self.assertEqual(self.prop1.column_np(0).dtype.kind, "O")
+        self.assertIsNot(column, self.prop1.column_np(3))
+        self.assertRaises(TypeError, self.prop1.column_np, 3, cache=True)
+        tracked = self.prop1.tracked()
+        column = tracked.column_np(3, cache=True)
+        self.assertIs(column, tracked.column_np(3))
+        tracked.add("t", "b", "c", 4)
+        self.assertListEqual(tracked.column_np(3).tolist(), [1, 2, 3, 1, 2, 3, 4])
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_column_np_modify_elements(self):
+        prop = self.tuplist_class([{"a": 1}, {"a": 2}]).tracked()
+        prop.column_np("a", cache=True)
+        prop.vapply_col("a", lambda r: r["a"] * 10)
+        self.assertListEqual(prop.column_np("a").tolist(), [10, 20])
+        prop[0]["a"] = 5
+        prop.drop_cache()
+        self.assertListEqual(prop.column_np("a").tolist(), [5, 20])
+
     def test_filter_list_f(self):
         result = [("a", "b", "c", 1), ("a", "b", "c", 2), ("a", "b", "c", 3)]
         self.assertListEqual(result, self.prop1.vfilter(lambda x: x[0] <= "a"))
@@ -80,6 +123,22 @@ class TupTest(unittest.TestCase):
         result = {("a", "b", "c"): 3, ("r", "b", "c"): 3}
         self.assertDictEqual(result, self.prop1.to_dict(result_col=3, is_list=False))
 
+    def test_to_dict_all_cols(self):
+        result = {(): [("a", 1), ("a", 2), ("a", 3), ("r", 1), ("r", 2), ("r", 3)]}
+        self.assertDictEqual(result, self.prop1.to_dict(result_col=[0, 3], indices=[]))
+
+    def test_to_dict_numpy(self):
+        prop = self.prop1.take([3, 0])
+        result = {1: ["a", "r"], 2: ["a", "r"], 3: ["a", "r"]}
+        to_dict = prop.to_dict(result_col=1, use_numpy=True)
+        self.assertDictEqual(result, to_dict)
+        self.assertListEqual(list(to_dict), [1, 2, 3])
+        self.assertIsInstance(to_dict[1], pt.TupList)
+
+    def test_to_dict_numpy_not_int(self):
+        result = {("a", "b", "c"): [1, 2, 3], ("r", "b", "c"): [1, 2, 3]}
+        self.assertDictEqual(result, self.prop1.to_dict(result_col=3, use_numpy=True))
+
     def test_unique(self):
         prop = self.prop1.take([0, 1])
         result = [("a", "b"), ("r", "b")]
@@ -90,6 +149,40 @@ class TupTest(unittest.TestCase):
         result = [1, 2, 3]
         self.assertSetEqual(set(result), set(prop.unique(dtype="i")))
 
+    def test_unique_order(self):
+        prop = self.tuplist_class([(3, "a"), (1, "b"), (3, "a"), (1, 2.5), (3, "c")])
+        self.assertListEqual(prop.unique(), [(3, "a"), (1, "b"), (1, 2.5), (3, "c")])
+        self.assertListEqual(prop.unique(0), [(3, "a"), (1, "b")])
+        self.assertListEqual(list(prop.iter_unique([0])), [(3, "a"), (1, "b")])
+        self.assertListEqual(prop.lazy().unique(1).collect(), [(3, "a"), (1, "b"), (1, 2.5), (3, "c")])
+        self.assertListEqual(self.tuplist_class().unique(), [])
+
+    def test_unique_dict(self):
+        prop = self.tuplist_class(self.prop2 + self.prop2)
+        self.assertListEqual(prop.unique(), self.prop2)
+        self.assertListEqual(prop.unique([1, 2]), self.prop2[:1] + self.prop2[3:4])
+
+    def test_unique_unhashable(self):
+        prop = pt.TupList([[1, 2], [1, 2], [3, 4], (1, 2)])
+        self.assertListEqual(prop.unique(), [[1, 2], [3, 4], (1, 2)])
+        prop = pt.TupList([{"a": [1], "b": 1}, {"a": [1], "b": 2}, {"a": [2], "b": 1}])
+        self.assertListEqual(prop.unique(), prop)
+        self.assertListEqual(prop.unique("a"), [prop[0], prop[2]])
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_unique_nan(self):
+        nan = float("nan")
+        prop = self.tuplist_class([(nan, 1), (nan, 1), (1.0, 2)])
+        self.assertListEqual(prop.unique(use_numpy=True), prop.unique())
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_unique_numpy(self):
+        prop = self.tuplist_class([(3, 1.5), (1, 2.0), (3, 1.5), (1, 0.5), (3, 2.0)])
+        result = [(3, 1.5), (1, 2.0), (1, 0.5), (3, 2.0)]
+        self.assertListEqual(prop.unique(use_numpy=True), result)
+        self.assertListEqual(prop.unique(0, use_numpy=True), [(3, 1.5), (1, 2.0)])
+        self.assertListEqual(self.prop1.unique([0, 1], use_numpy=True), [self.prop1[0], self.prop1[3]])
+
     def test_unique2(self):
         prop = self.prop1.take([0, 1])
         result = [("a", "b"), ("r", "b")]
@@ -102,6 +195,35 @@ class TupTest(unittest.TestCase):
         result = [("a", 1, 3), ("r", 1, 3)]
         self.assertListEqual(result, st_fin)
 
+    def test_start_finish_default(self):
+        prop = self.tuplist_class([("r", 4), ("a", 2), ("r", 1), ("a", 1), ("r", 3), ("a", 3)])
+        original = list(prop)
+        result = [("a", 1, 3), ("r", 1, 1), ("r", 3, 4)]
+        self.assertListEqual(prop.to_start_finish(), result)
+        self.assertListEqual(prop, original)
+        join = lambda run: (run[0][0], len(run))
+        self.assertListEqual(prop.to_start_finish(join_func=join), [("a", 3), ("r", 1), ("r", 2)])
+
+    def test_start_finish_repeated_first(self):
+        prop = self.tuplist_class([("a", 1), ("a", 2), ("a", 1)])
+        self.assertListEqual(prop.to_start_finish(sort=False), [("a", 1, 2), ("a", 1, 1)])
+
+    def test_iter_start_finish(self):
+        prop = self.tuplist_class([("a", 1), ("a", 2), ("r", 1), ("r", 3)])
+        result = [("a", 1, 2), ("r", 1, 1), ("r", 3, 3)]
+        self.assertListEqual(list(prop.iter_start_finish()), result)
+        self.assertListEqual(prop.lazy().to_start_finish().collect(), result)
+        self.assertListEqual(list(self.tuplist_class().iter_start_finish()), [])
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_start_finish_numpy(self):
+        prop = self.tuplist_class([("r", 4, "x"), ("a", 2, "y"), ("r", 1, "z"), ("a", 1, "w"), ("r", 3, "v")])
+        result = prop.to_start_finish(use_numpy=True)
+        self.assertListEqual(result, prop.to_start_finish())
+        self.assertListEqual(result, [("a", 1, "w", 2), ("r", 1, "z", 1), ("r", 3, "v", 4)])
+        prop = self.tuplist_class([(2, 5), (2, 6), (1, 8)])
+        self.assertListEqual(prop.to_start_finish(sort=False, use_numpy=True), [(2, 5, 6), (1, 8, 8)])
+
     def test_to_list(self):
         self.assertTrue(type(self.prop1.to_list()) is list)
 
@@ -224,6 +346,57 @@ class TupTest(unittest.TestCase):
         a = self.tuplist_class.from_csv(self.tmpcsv, func=fmt)
         self.assertEqual(a, self.prop1)
 
+    def test_read_types(self):
+        with open(self.tmpcsv, "w") as file:
+            file.write("a,b,c,1\na,b,c,2\na,b,c,3\nr,b,c,1\nr,b,c,2\nr,b,c,3\n")
+        a = self.tuplist_class.from_csv(self.tmpcsv, types=[str, str, str, int])
+        self.assertEqual(a, self.prop1)
+        b = self.tuplist_class.from_csv(self.tmpcsv, types="infer")
+        self.assertEqual(b, self.prop1)
+
+    def test_read_infer(self):
+        with open(self.tmpcsv, "w") as file:
+            file.write("1,1.5,x\n2,2,y\n")
+        a = self.tuplist_class.from_csv(self.tmpcsv, types="infer")
+        self.assertEqual(a, [(1, 1.5, "x"), (2, 2.0, "y")])
+        self.assertIs(type(a[1][1]), float)
+
+    def test_read_infer_widen(self):
+        with open(self.tmpcsv, "w") as file:
+            file.write("1,1,x\n\n2,2,y\n3,1.5,z\n4,2,w\n5,a,v\n")
+        chunks = list(self.tuplist_class.from_csv(self.tmpcsv, types="infer", chunksize=2))
+        self.assertEqual(
+            chunks, [[(1, 1, "x"), (2, 2, "y")], [(3, 1.5, "z"), (4, 2.0, "w")], [(5, "a", "v")]]
+        )
+        self.assertIs(type(chunks[1][1][1]), float)
+        # without chunks, all the rows get the types of the whole file
+        a = self.tuplist_class.from_csv(self.tmpcsv, types="infer")
+        self.assertEqual(a.take(1), ["1", "2", "1.5", "2", "a"])
+        self.assertEqual(a.take(0), [1, 2, 3, 4, 5])
+        a = self.tuplist_class.from_csv(self.tmpcsv, types=[int, str, str])
+        self.assertEqual(len(a), 5)
+
+    def test_read_chunks(self):
+        with open(self.tmpcsv, "w") as file:
+            file.write("a,b,c,1\na,b,c,2\na,b,c,3\nr,b,c,1\nr,b,c,2\nr,b,c,3\n")
+        chunks = list(
+            self.tuplist_class.from_csv(self.tmpcsv, types="infer", chunksize=4)
+        )
+        self.assertEqual([len(c) for c in chunks], [4, 2])
+        self.assertIsInstance(chunks[0], pt.TupList)
+        self.assertEqual(chunks[0] + chunks[1], self.prop1)
+
+    def test_iter_csv(self):
+        self.prop1.to_csv(self.tmpcsv)
+        rows = self.tuplist_class.iter_csv(self.tmpcsv, types=[None, None, None, int])
+        self.assertEqual(next(rows), ("a", "b", "c", 1))
+        self.assertEqual(pt.TupList(rows), self.prop1[1:])
+
+    def test_read_bad_types(self):
+        self.prop1.to_csv(self.tmpcsv)
+        to_error = lambda: self.tuplist_class.from_csv(self.tmpcsv, types=[str, int])
+        self.assertRaises(ValueError, to_error)
+
     def test_to_dictlist(self):
         self.assertEqual(self.prop1.to_dictlist([1, 2, 3, 4]), self.prop2)
 
@@ -371,6 +544,218 @@ class TupTest(unittest.TestCase):
         copy[0][1] = 1
         self.assertEqual(original[0][1], "a")
 
+    def test_copy_deep_shares_tuples(self):
+        original = self.tuplist_class(self.prop1 + [(pt.OrderSet([1, 2]), [3])])
+        original.index_on(0)
+        copy = original.copy_deep()
+        self.assertIsInstance(copy, self.tuplist_class)
+        self.assertIs(copy[0], original[0])
+        self.assertIsNot(copy[-1], original[-1])
+        copy[-1][0].append(3)
+        copy[-1][1].append(4)
+        self.assertListEqual(list(original[-1][0]), [1, 2])
+        self.assertListEqual(original[-1][1], [3])
+        self.assertIsNone(copy._indexes)
+
+    def test_index_on(self):
+        index = self.prop1.index_on(0)
+        self.assertEqual(index["r"], self.prop1[3:])
+        self.assertEqual(index.positions("a"), [0, 1, 2])
+        self.assertEqual(index.get("z"), [])
+        self.assertIs(index, self.prop1.index_on([0]))
+
+    def test_index_on_several(self):
+        index = self.prop1.index_on([0, 3])
+        self.assertEqual(index[("r", 2)], [("r", "b", "c", 2)])
+        self.assertNotIn(("r", 4), index)
+
+    def test_index_on_dict(self):
+        index = self.prop2.index_on(4)
+        self.assertEqual(index[1], [TEST_DICT[0], TEST_DICT[3]])
+
+    def test_index_on_grow(self):
+        index = self.prop1.index_on(0)
+        self.assertEqual(len(index), 2)
+        self.prop1.add("t", "b", "c", 1)
+        self.prop1 += [("r", "b", "c", 5)]
+        positions = index._positions
+        self.assertEqual(index.positions("t"), [6])
+        self.assertEqual(index.positions("r"), [3, 4, 5, 7])
+        # the new elements were added to the index, that was not built again
+        self.assertIs(index._positions, positions)
+        self.prop1.pop()
+        self.assertEqual(index.positions("r"), [3, 4, 5])
+
+    def test_index_on_modify(self):
+        index = self.prop1.index_on(3)
+        self.assertEqual(index.positions(3), [2, 5])
+        self.prop1[0] = ("a", "b", "c", 3)
+        self.assertEqual(index.positions(3), [2, 5])
+        index.invalidate()
+        self.assertEqual(index.positions(3), [0, 2, 5])
+
+    def test_tracked_index_on_grow(self):
+        tracked = self.prop1.tracked()
+        self.assertIsInstance(tracked, pt.TrackedTupList)
+        index = tracked.index_on(0)
+        self.assertEqual(len(index), 2)
+        tracked.add("t", "b", "c", 1)
+        tracked.append(("r", "b", "c", 4))
+        tracked.extend([("t", "b", "c", 2)])
+        tracked += [("r", "b", "c", 5)]
+        self.assertIsInstance(tracked, pt.TrackedTupList)
+        self.assertEqual(index.positions("t"), [6, 8])
+        self.assertEqual(index.positions("r"), [3, 4, 5, 7, 9])
+
+    def test_tracked_index_on_modify(self):
+        tracked = self.prop1.tracked()
+        index = tracked.index_on(3)
+        tracked.pop(0)
+        tracked[0] = ("a", "b", "c", 3)
+        self.assertEqual(index.positions(1), [2])
+        self.assertEqual(index.positions(3), [0, 1, 4])
+        tracked.sort(key=lambda x: x[3])
+        self.assertEqual(index.positions(3), [2, 3, 4])
+
+    def test_index_on_copy(self):
+        self.prop1.index_on(0)
+        copy = self.prop1.copy_deep()
+        self.assertIsNone(copy._indexes)
+        self.assertEqual(copy, self.prop1)
+
+    def test_lazy(self):
+        lazy = (
+            self.prop1.lazy()
+            .vfilter(lambda x: x[0] == "r")
+            .vfilter(lambda x: x[3] > 1)
+            .take([0, 3])
+            .vapply(lambda x: x + (x[1] * 2,))
+        )
+        self.assertIsInstance(lazy, pt.LazyTupList)
+        result = [("r", 2, 4), ("r", 3, 6)]
+        self.assertEqual(lazy.collect(), result)
+        # the pipeline can be run again
+        self.assertIsInstance(lazy.collect(), pt.TupList)
+        self.assertEqual(lazy.collect(), result)
+
+    def test_lazy_same_as_eager(self):
+        lazy = self.prop1.lazy().take([3]).vapply_col(None, lambda v: v[0] * 10)
+        eager = self.prop1.take([3]).vapply_col(None, lambda v: v[0] * 10)
+        self.assertEqual(lazy.collect(), eager)
+        some_test = self.tuplist_class([[{"a": 1}], [{"b": 2, "c": 4}]])
+        self.assertEqual(some_test.lazy().chain().collect(), some_test.chain())
+
+    def test_lazy_to_dict(self):
+        lazy = self.prop1.lazy().vfilter(lambda x: x[3] < 3)
+        result = {("a", "b", "c"): [1, 2], ("r", "b", "c"): [1, 2]}
+        self.assertDictEqual(lazy.to_dict(result_col=3), result)
+        self.assertDictEqual(
+            self.prop2.lazy().to_dict(result_col=None, indices=[1, 2], is_list=False),
+            self.prop2.to_dict(result_col=None, indices=[1, 2], is_list=False),
+        )
+        self.assertDictEqual(lazy.vfilter(lambda x: False).to_dict(), {})
+
+    def test_lazy_to_csv(self):
+        self.prop2.lazy().vfilter(lambda x: x[1] == "r").to_csv(self.tmpcsv)
+        content = read_and_delete(self.tmpcsv)
+        result = "1,2,3,4\nr,b,c,1\nr,b,c,2\nr,b,c,3\n"
+        self.assertEqual(result, content)
+
+    def test_join(self):
+        other = [("a", 10), ("r", 20), ("r", 30), ("t", 40)]
+        result = self.prop1.take([0, 3]).join(other, left_on=0)
+        self.assertEqual(
+            result,
+            [("a", 1, 10), ("a", 2, 10), ("a", 3, 10)]
+            + [("r", p, c) for p in [1, 2, 3] for c in [20, 30]],
+        )
+        small = self.tuplist_class([(1, "x")])
+        self.assertEqual(
+            small.join(self.prop1, left_on=0, right_on=3),
+            [(1, "x", "a", "b", "c"), (1, "x", "r", "b", "c")],
+        )
+        # the smaller list is stored: the result still follows the order of the list
+        small = self.tuplist_class([(3, "y"), (1, "x"), (3, "z")])
+        self.assertEqual(
+            small.join(self.prop1.take([0, 3]), left_on=0, right_on=1),
+            [(3, "y", "a"), (3, "y", "r"), (1, "x", "a"), (1, "x", "r")]
+            + [(3, "z", "a"), (3, "z", "r")],
+        )
+
+    def test_join_several(self):
+        other = [("a", 2, "ok"), ("r", 3, "ok")]
+        result = self.prop1.join(other, left_on=[0, 3], right_on=[0, 1])
+        self.assertEqual(result, [("a", "b", "c", 2, "ok"), ("r", "b", "c", 3, "ok")])
+
+    def test_join_left(self):
+        other = [(2, "x", "y")]
+        result = self.prop1.take([0, 3]).join(other, left_on=1, right_on=0, how="left")
+        self.assertEqual(result[:3], [("a", 1, None, None), ("a", 2, "x", "y"), ("a", 3, None, None)])
+        self.assertEqual(len(result), 6)
+        result = self.prop1.take([0, 3]).join([], left_on=1, right_on=0, how="left", right_width=3)
+        self.assertEqual(result[0], ("a", 1, None, None))
+        self.assertRaises(
+            ValueError, self.prop1.take([0, 3]).join, [], left_on=1, right_on=0, how="left"
+        )
+        self.assertEqual(self.prop1.join([], left_on=1, right_on=0), [])
+
+    def test_join_lists(self):
+        prop = pt.TupList([["a", 1], ["b", 2]])
+        result = prop.join([[1, "x"], [2, "y"]], left_on=1, right_on=0)
+        self.assertEqual(result, [("a", 1, "x"), ("b", 2, "y")])
+
+    def test_join_semi_anti(self):
+        other = [(1,), (3,)]
+        semi = self.prop1.join(other, left_on=3, right_on=0, how="semi")
+        anti = self.prop1.join(other, left_on=3, right_on=0, how="anti")
+        self.assertEqual(semi, [self.prop1[i] for i in [0, 2, 3, 5]])
+        self.assertEqual(anti, [self.prop1[i] for i in [1, 4]])
+
+    def test_join_dict(self):
+        other = [{"id": "a", "name": "first"}]
+        result = self.prop2.join(other, left_on=1, right_on="id")
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0], {1: "a", 2: "b", 3: "c", 4: 1, "id": "a", "name": "first"})
+        self.assertRaises(ValueError, self.prop2.join, other, 1, "id", "outer")
+
+    def test_group_by(self):
+        groups = self.prop1.group_by(0)
+        self.assertDictEqual(groups.agg(sum=3), {"a": 6, "r": 6})
+        self.assertDictEqual(groups.count(), {"a": 3, "r": 3})
+        self.assertDictEqual(groups.min(3), {"a": 1, "r": 1})
+        self.assertDictEqual(groups.max(3), {"a": 3, "r": 3})
+        self.assertDictEqual(groups.first(3), {"a": 1, "r": 1})
+        self.assertIsInstance(groups.count(), pt.SuperDict)
+
+    def test_group_by_several(self):
+        result = self.prop1.group_by([0, 1]).agg(count=True, sum=3, max=3, first=2)
+        self.assertDictEqual(result, {("a", "b"): (3, 6, 3, "c"), ("r", "b"): (3, 6, 3, "c")})
+        self.assertRaises(ValueError, self.prop1.group_by(0).agg, avg=3)
+
+    def test_group_by_sum_not_numbers(self):
+        # the sum starts from the first value, with one aggregation or several
+        groups = self.prop1.group_by(0)
+        self.assertDictEqual(groups.sum(1), {"a": "bbb", "r": "bbb"})
+        self.assertDictEqual(groups.agg(sum=1, count=True), {"a": ("bbb", 3), "r": ("bbb", 3)})
+
+    def test_group_by_dict(self):
+        result = self.prop2.group_by(1).agg(sum=4)
+        self.assertDictEqual(result, {"a": 6, "r": 6})
+
+    def test_group_by_lazy(self):
+        lazy = self.prop1.lazy().vfilter(lambda x: x[3] > 1)
+        self.assertDictEqual(lazy.group_by(0).agg(sum=3), {"a": 5, "r": 5})
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_group_by_numpy(self):
+        prop = self.tuplist_class([(3, 1.5, 2), (1, 2.0, 5), (3, 0.5, 7)])
+        result = prop.group_by(0).agg(use_numpy=True, sum=1, count=True, min=2, max=2, first=2)
+        self.assertDictEqual(result, {3: (2.0, 2, 2, 7, 2), 1: (2.0, 1, 5, 5, 5)})
+        self.assertListEqual(list(result), [3, 1])
+        self.assertDictEqual(
+            self.prop1.group_by(0).agg(use_numpy=True, sum=3), {"a": 6, "r": 6}
+        )
+
     def test_chain(self):
         some_test = self.tuplist_class([[{"a": 1}], [{"b": 2, "c": 4}]])
         self.assertEqual(some_test.chain(), [{"a": 1}, {"b": 2, "c": 4}])